@@ -37,9 +37,21 @@ if sys.version_info[:2] < (3, 5):
             self.name = name
             self.basepath = basepath
 
+        @property
+        def path(self):
+            return os.path.join(self.basepath, self.name)
+
         def is_dir(self):
-            path_for_name = os.path.join(self.basepath, self.name)
-            return os.path.isdir(path_for_name)
+            return os.path.isdir(self.path)
+
+        def is_file(self):
+            return os.path.isfile(self.path)
+
+        def is_symlink(self):
+            return os.path.islink(self.path)
+
+        def stat(self):
+            return os.stat(self.path)
 
     def scandir(dir):
         return [_DirEntry(name, dir) for name in os.listdir(dir)]
@@ -20,6 +20,7 @@ from jedi.parser_utils import get_executable_nodes
 from jedi import debug
 from jedi import settings
 from jedi import cache
+from jedi import file_watcher
 from jedi.file_io import KnownContentFileIO
 from jedi.api import classes
 from jedi.api import interpreter
@@ -181,6 +182,8 @@ class Script(object):
                 os.path.dirname(self.path) if path else None
             )
 
+        # Let caches know about changes in the file system before using them.
+        file_watcher.publish_changes()
         self._inference_state = InferenceState(
             project, environment=environment, script_path=self.path
         )
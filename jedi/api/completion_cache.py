@@ -2,11 +2,8 @@ _cache = {}
 
 
 def save_entry(module_name, name, cache):
-    try:
-        module_cache = _cache[module_name]
-    except KeyError:
-        module_cache = _cache[module_name] = {}
-    module_cache[name] = cache
+    # setdefault is atomic, threads never overwrite each other's entries.
+    _cache.setdefault(module_name, {})[name] = cache
 
 
 def _create_get_from_cache(number):
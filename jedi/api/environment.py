@@ -6,10 +6,14 @@ import os
 import sys
 import hashlib
 import filecmp
+import weakref
+import threading
 from collections import namedtuple
 
 from jedi._compatibility import highest_pickle_protocol, which
 from jedi.cache import memoize_method, time_cache
+from jedi.file_watcher import watch
+from jedi.common.utils import register_after_fork
 from jedi.inference.compiled.subprocess import CompiledSubprocess, \
     InferenceStateSameProcess, InferenceStateSubprocess
 
@@ -22,6 +26,16 @@ _SAFE_PATHS = ['/usr/bin', '/usr/local/bin']
 _CONDA_VAR = 'CONDA_PREFIX'
 _CURRENT_VERSION = '%s.%s' % (sys.version_info.major, sys.version_info.minor)
 
+_subprocess_lock = threading.Lock()
+
+
+def _reset_lock_after_fork():
+    global _subprocess_lock
+    _subprocess_lock = threading.Lock()
+
+
+register_after_fork(_reset_lock_after_fork)
+
 
 class InvalidPythonEnvironment(Exception):
     """
@@ -60,6 +74,8 @@ class Environment(_BaseEnvironment):
     functions instead. It is then returned by that function.
     """
     _subprocess = None
+    _sys_path = None
+    _watching_site_packages = False
 
     def __init__(self, executable):
         self._start_executable = executable
@@ -70,9 +86,16 @@ class Environment(_BaseEnvironment):
         if self._subprocess is not None and not self._subprocess.is_crashed:
             return self._subprocess
 
+        with _subprocess_lock:
+            # Another thread might have started a subprocess in the meantime.
+            if self._subprocess is not None and not self._subprocess.is_crashed:
+                return self._subprocess
+            return self._start_subprocess()
+
+    def _start_subprocess(self):
         try:
-            self._subprocess = CompiledSubprocess(self._start_executable)
-            info = self._subprocess._send(None, _get_info)
+            subprocess = CompiledSubprocess(self._start_executable)
+            info = subprocess._send(None, _get_info)
         except Exception as exc:
             raise InvalidPythonEnvironment(
                 "Could not get version information for %r: %r" % (
@@ -101,10 +124,11 @@ class Environment(_BaseEnvironment):
             self.path = self.path.decode()
 
         # Adjust pickle protocol according to host and client version.
-        self._subprocess._pickle_protocol = highest_pickle_protocol([
+        subprocess._pickle_protocol = highest_pickle_protocol([
             sys.version_info, self.version_info])
 
-        return self._subprocess
+        self._subprocess = subprocess
+        return subprocess
 
     def __repr__(self):
         version = '.'.join(str(i) for i in self.version_info)
@@ -113,7 +137,6 @@ class Environment(_BaseEnvironment):
     def get_inference_state_subprocess(self, inference_state):
         return InferenceStateSubprocess(inference_state, self._get_subprocess())
 
-    @memoize_method
     def get_sys_path(self):
         """
         The sys path for this environment. Does not include potential
@@ -121,12 +144,17 @@ class Environment(_BaseEnvironment):
 
         :returns: list of str
         """
-        # It's pretty much impossible to generate the sys path without actually
-        # executing Python. The sys path (when starting with -S) itself depends
-        # on how the Python version was compiled (ENV variables).
-        # If you omit -S when starting Python (normal case), additionally
-        # site.py gets executed.
-        return self._get_subprocess().get_sys_path()
+        if self._sys_path is None:
+            # It's pretty much impossible to generate the sys path without
+            # actually executing Python. The sys path (when starting with -S)
+            # itself depends on how the Python version was compiled (ENV
+            # variables). If you omit -S when starting Python (normal case),
+            # additionally site.py gets executed.
+            self._sys_path = self._get_subprocess().get_sys_path()
+            if not self._watching_site_packages:
+                _watch_site_packages(self)
+                self._watching_site_packages = True
+        return self._sys_path
 
 
 class _SameEnvironmentMixin(object):
@@ -148,6 +176,25 @@ class InterpreterEnvironment(_SameEnvironmentMixin, _BaseEnvironment):
         return sys.path
 
 
+def _watch_site_packages(environment):
+    """
+    Installing packages can add ``.pth`` files to site-packages, which modify
+    the sys path. Forget the sys path of the environment in that case.
+    """
+    environment_ref = weakref.ref(environment)
+
+    def on_change(events):
+        environment = environment_ref()
+        if environment is not None \
+                and any(e.path.endswith(('.pth', '.egg-link')) for e in events):
+            environment._sys_path = None
+
+    for path in environment._sys_path:
+        if os.path.basename(path) in ('site-packages', 'dist-packages') \
+                and os.path.isdir(path):
+            watch(path, on_change, recursive=False)
+
+
 def _get_virtual_env_from_var(env_var='VIRTUAL_ENV'):
     """Get virtualenv environment from VIRTUAL_ENV environment variable.
 
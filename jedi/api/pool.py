@@ -0,0 +1,371 @@
+"""
+A :class:`ScriptPool` distributes requests to multiple worker processes. Every
+worker is a normal |jedi| process with its own caches and its own compiled
+subprocess. Requests are sent to workers by file, which means that the
+module of a file is always parsed and inferred in the same worker and its
+caches stay warm.
+
+Results cannot refer to the inference state of a worker, therefore they are
+returned as :class:`PoolName` and :class:`PoolCompletion` objects, that contain
+the most important attributes of :class:`.Name` and :class:`.Completion`.
+"""
+import os
+import itertools
+import threading
+import traceback
+import zlib
+
+from jedi import debug
+from jedi.api.exceptions import InternalError
+from jedi.common.utils import get_process_context
+from jedi.api.environment import InterpreterEnvironment
+
+_NAME_ATTRIBUTES = (
+    'name', 'type', 'module_name', 'module_path', 'line', 'column',
+    'description', 'full_name',
+)
+_COMPLETION_ATTRIBUTES = _NAME_ATTRIBUTES + ('complete', 'name_with_symbols')
+
+
+class _PoolBaseName(object):
+    _attributes = _NAME_ATTRIBUTES
+
+    def __init__(self, name, with_docstring=False):
+        for attribute in self._attributes:
+            setattr(self, attribute, getattr(name, attribute))
+        self._in_builtin_module = name.in_builtin_module()
+        self._is_stub = name.is_stub()
+        self._docstring = None
+        if with_docstring:
+            self._docstring = name.docstring(raw=True), name.docstring()
+
+    def in_builtin_module(self):
+        return self._in_builtin_module
+
+    def is_stub(self):
+        return self._is_stub
+
+    def docstring(self, raw=False):
+        """
+        The docstring is only available for results of :meth:`.ScriptPool.infer`
+        and :meth:`.ScriptPool.goto`. For other results an empty string is
+        returned.
+        """
+        if self._docstring is None:
+            return ''
+        return self._docstring[not raw]
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self._key() == other._key()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def _key(self):
+        return self.module_path, self.line, self.column, self.name
+
+    def __repr__(self):
+        return "<%s %sname=%r, description=%r>" % (
+            self.__class__.__name__,
+            'full_' if self.full_name else '',
+            self.full_name or self.name,
+            self.description,
+        )
+
+
+class PoolName(_PoolBaseName):
+    """
+    A picklable copy of a :class:`.Name`. It has the same attributes, but
+    cannot be used to infer anything.
+    """
+    def __init__(self, name, with_docstring=False):
+        super(PoolName, self).__init__(name, with_docstring)
+        self._is_definition = name.is_definition()
+
+    def is_definition(self):
+        return self._is_definition
+
+
+class PoolCompletion(_PoolBaseName):
+    """
+    A picklable copy of a :class:`.Completion`.
+    """
+    _attributes = _COMPLETION_ATTRIBUTES
+
+    def __repr__(self):
+        return '<%s: %s>' % (type(self).__name__, self.name)
+
+
+def _create_environment(executable):
+    from jedi.api.environment import create_environment
+    if executable is None:
+        return InterpreterEnvironment()
+    return create_environment(executable, safe=False)
+
+
+def _get_builtins_name(environment):
+    if environment.version_info.major == 2:
+        return '__builtin__'
+    return 'builtins'
+
+
+def _preload(project, environment, modules):
+    """
+    Like :func:`jedi.preload_module`, but with a project and an environment.
+    This parses the modules (and their stubs) and starts the subprocess of the
+    environment.
+    """
+    from jedi.api import Script
+
+    for module in (_get_builtins_name(environment), 'typing') + tuple(modules):
+        code = 'import %s as x; x.' % module
+        Script(code, project=project, environment=environment).complete(1, len(code))
+
+
+def _get_fork_context():
+    import multiprocessing
+
+    if not hasattr(os, 'fork'):
+        return None
+    try:
+        get_context = multiprocessing.get_context
+    except AttributeError:
+        # Python 2 always forks on POSIX.
+        return multiprocessing
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    return get_context('fork')
+
+
+def _run_request(project, environment, request):
+    from jedi.api import Script
+
+    method, code, path, line, column, kwargs = request
+    script = Script(code, path=path, project=project, environment=environment)
+    results = getattr(script, method)(line, column, **kwargs)
+    if method == 'complete':
+        return [PoolCompletion(c) for c in results]
+    with_docstring = method in ('infer', 'goto')
+    return [PoolName(n, with_docstring) for n in results]
+
+
+def _work(connection, project, executable, preload_modules, environment=None):
+    """
+    The main loop of a worker process. Runs until it receives ``None``.
+
+    ``environment`` is only given to forked workers, that inherit the warm
+    environment and caches of the pool's process.
+    """
+    if environment is None and preload_modules is not None:
+        try:
+            environment = _create_environment(executable)
+            _preload(project, environment, preload_modules)
+        except Exception:
+            debug.warning('Preloading failed:\n%s', traceback.format_exc())
+    while True:
+        try:
+            request = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if request is None:
+            break
+        try:
+            if environment is None:
+                environment = _create_environment(executable)
+            result = True, _run_request(project, environment, request)
+        except Exception as e:
+            result = False, (e, traceback.format_exc())
+        try:
+            connection.send(result)
+        except Exception:
+            # The exception might not be picklable.
+            connection.send((False, (None, traceback.format_exc())))
+
+
+class _Worker(object):
+    """
+    The first process of a worker might be forked from a prewarmed pool, but
+    crashed workers are always restarted with ``restart_context``, because
+    the pool's process might be using threads by then.
+    """
+    def __init__(self, context, args, restart_context, restart_args):
+        self._context = context
+        self._args = args
+        self._restart_context = restart_context
+        self._restart_args = restart_args
+        self._lock = threading.Lock()
+        self._process = None
+        self._connection = None
+
+    def start(self):
+        with self._lock:
+            self._start(self._context, self._args)
+
+    def _start(self, context, args):
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(
+            target=_work,
+            args=(child_connection,) + args,
+        )
+        self._process.daemon = True
+        self._process.start()
+        child_connection.close()
+
+    def request(self, request):
+        with self._lock:
+            if self._process is None or not self._process.is_alive():
+                self._start(self._restart_context, self._restart_args)
+            try:
+                self._connection.send(request)
+                success, result = self._connection.recv()
+            except (EOFError, IOError, OSError) as e:
+                self._kill()
+                raise InternalError(
+                    "The worker process of a ScriptPool crashed: %r" % e
+                )
+        if not success:
+            exception, tb = result
+            debug.warning('Exception in a ScriptPool worker:\n%s', tb)
+            if exception is None:
+                raise InternalError(tb)
+            raise exception
+        return result
+
+    def _kill(self):
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def close(self):
+        with self._lock:
+            if self._process is not None and self._process.is_alive():
+                try:
+                    self._connection.send(None)
+                except (IOError, OSError):
+                    pass
+                self._process.join(1)
+            self._kill()
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class ScriptPool(object):
+    """
+    A pool of worker processes, that handle :class:`.Script` requests in
+    parallel. Requests for the same path are always handled by the same
+    worker. A pool can be used by multiple threads.
+
+    ::
+
+        with jedi.ScriptPool(project=jedi.Project('/home/user/project')) as pool:
+            completions = pool.complete(code, 'foo.py', line=10, column=4)
+
+    :param project: The :class:`.Project` that is used by all requests.
+    :param environment: The :class:`.Environment` that is used by all
+        requests. By default the environment of the project is used.
+    :param processes: The number of worker processes, defaults to the number
+        of CPUs.
+    :param preload_modules: If given (a list of module names, can be empty),
+        ``builtins``, ``typing`` and these modules are loaded before the
+        workers handle requests. Where ``os.fork`` is available, they are
+        loaded once in this process and the workers are forked from it. They
+        inherit the parsed modules copy-on-write and start warm. Otherwise
+        every worker loads them itself. Forking is only safe if no other
+        threads are running, therefore such a pool must be created before
+        any threads are started. All the other workers (and restarted ones)
+        are started with ``forkserver`` or ``spawn``.
+    """
+    def __init__(self, project=None, environment=None, processes=None,
+                 preload_modules=None):
+        import multiprocessing
+
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        if environment is None:
+            if project is None:
+                from jedi.api.environment import get_cached_default_environment
+                environment = get_cached_default_environment()
+            else:
+                environment = project.get_environment()
+        executable = None
+        if not isinstance(environment, InterpreterEnvironment):
+            # Environments cannot be pickled, every worker creates its own.
+            executable = environment.executable
+
+        context = restart_context = get_process_context()
+        args = restart_args = project, executable, preload_modules
+        if preload_modules is not None:
+            fork_context = _get_fork_context()
+            if fork_context is not None:
+                _preload(project, environment, preload_modules)
+                context = fork_context
+                args += (environment,)
+
+        self._workers = [
+            _Worker(context, args, restart_context, restart_args)
+            for _ in range(processes)
+        ]
+        self._counter = itertools.count()
+        for worker in self._workers:
+            worker.start()
+
+    def _get_worker(self, path):
+        if path is None:
+            index = next(self._counter)
+        else:
+            index = zlib.crc32(path.encode('utf-8'))
+        return self._workers[index % len(self._workers)]
+
+    def _request(self, method, code, path, line, column, kwargs):
+        worker = self._get_worker(path)
+        return worker.request((method, code, path, line, column, kwargs))
+
+    def complete(self, code, path=None, line=None, column=None, **kwargs):
+        """
+        Like :meth:`.Script.complete`.
+
+        :rtype: list of :class:`PoolCompletion`
+        """
+        return self._request('complete', code, path, line, column, kwargs)
+
+    def infer(self, code, path=None, line=None, column=None, **kwargs):
+        """
+        Like :meth:`.Script.infer`.
+
+        :rtype: list of :class:`PoolName`
+        """
+        return self._request('infer', code, path, line, column, kwargs)
+
+    def goto(self, code, path=None, line=None, column=None, **kwargs):
+        """
+        Like :meth:`.Script.goto`.
+
+        :rtype: list of :class:`PoolName`
+        """
+        return self._request('goto', code, path, line, column, kwargs)
+
+    def get_references(self, code, path=None, line=None, column=None, **kwargs):
+        """
+        Like :meth:`.Script.get_references`.
+
+        :rtype: list of :class:`PoolName`
+        """
+        return self._request('get_references', code, path, line, column, kwargs)
+
+    def close(self):
+        """
+        Stops all worker processes.
+        """
+        for worker in self._workers:
+            worker.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -24,20 +24,24 @@ from jedi.inference.imports import load_module_from_path, \
     load_namespace_from_path, iter_module_names
 from jedi.inference.sys_path import discover_buildout_paths
 from jedi.inference.cache import inference_state_as_method_param_cache
-from jedi.inference.references import recurse_find_python_folders_and_files, search_in_file_ios
-from jedi.file_io import FolderIO
+from jedi.inference.references import search_in_file_ios
+from jedi.api.symbol_index import get_symbol_index
+from jedi.file_io import FolderIO, FileIO
+from jedi.file_walker import walk_python_files
 from jedi.common.utils import traverse_parents
 
 _CONFIG_FOLDER = '.jedi'
 _CONTAINS_POTENTIAL_PROJECT = 'setup.py', '.git', '.hg', 'requirements.txt', 'MANIFEST.in'
 
 _SERIALIZER_VERSION = 1
+# The number of files that a search parses to build the symbol index.
+_INDEX_PARSE_LIMIT = 50
 
 
 def _try_to_skip_duplicates(func):
     def wrapper(*args, **kwargs):
-        found_tree_nodes = []
-        found_modules = []
+        found_tree_nodes = set()
+        found_modules = set()
         for definition in func(*args, **kwargs):
             tree_node = definition._name.tree_name
             if tree_node is not None and tree_node in found_tree_nodes:
@@ -45,9 +49,9 @@ def _try_to_skip_duplicates(func):
             if definition.type == 'module' and definition.module_path is not None:
                 if definition.module_path in found_modules:
                     continue
-                found_modules.append(definition.module_path)
+                found_modules.add(definition.module_path)
             yield definition
-            found_tree_nodes.append(tree_node)
+            found_tree_nodes.add(tree_node)
     return wrapper
 
 
@@ -134,9 +138,16 @@ class Project(object):
         :param smart_sys_path: If this is enabled (default), adds paths from
             local directories. Otherwise you will have to rely on your packages
             being properly configured on the ``sys.path``.
+        :param exclude_patterns: list of str. Files and folders of the project
+            that are not searched, in the syntax of ``.gitignore`` files.
+            These are added to ``.tox/``, ``venv/``, ``__pycache__/``,
+            ``.git/``, ``.hg/`` and ``node_modules/`` and take precedence over
+            the ``.gitignore`` files of the project, e.g. ``!venv/`` would
+            search ``venv`` folders again.
         """
         def py2_comp(path, python_path=None, load_unsafe_extensions=False,
-                     sys_path=None, added_sys_path=(), smart_sys_path=True):
+                     sys_path=None, added_sys_path=(), smart_sys_path=True,
+                     exclude_patterns=()):
             self._path = os.path.abspath(path)
 
             self._python_path = python_path
@@ -144,11 +155,18 @@ class Project(object):
             self._smart_sys_path = smart_sys_path
             self._load_unsafe_extensions = load_unsafe_extensions
             self._django = False
+            self._exclude_patterns = list(exclude_patterns)
             self.added_sys_path = list(added_sys_path)
             """The sys path that is going to be added at the end of the """
 
         py2_comp(path, **kwargs)
 
+    def __getstate__(self):
+        # Environments cannot be pickled, they are recreated if necessary.
+        data = dict(self.__dict__)
+        data.pop('_environment', None)
+        return data
+
     @inference_state_as_method_param_cache()
     def _get_base_sys_path(self, inference_state):
         # The sys path has not been set explicitly.
@@ -263,83 +281,154 @@ class Project(object):
             )
         debug.dbg('Search for string %s, complete=%s', string, complete)
         wanted_type, wanted_names = split_search_string(string)
+
+        index = get_symbol_index(self._path, self._exclude_patterns)
+        # Building the index of a big project takes a while, therefore every
+        # search only parses a few more files for it. Until it's built, the
+        # project is searched lazily like without an index.
+        index.update(inference_state.grammar, parse_limit=_INDEX_PARSE_LIMIT)
+        if index.is_built():
+            search = self._search_with_index(
+                inference_state, index, wanted_type, wanted_names, complete, all_scopes)
+        else:
+            search = self._search_by_walking(
+                inference_state, wanted_type, wanted_names, complete, all_scopes)
+        for x in search:
+            yield x  # Python 2...
+
+        # 3. Search for modules on sys.path
+        sys_path = [
+            p for p in self._get_sys_path(inference_state)
+            # Exclude folders that are handled by recursing of the Python
+            # folders.
+            if not p.startswith(self._path)
+        ]
+        names = list(iter_module_names(inference_state, empty_module_context, sys_path))
+        for x in search_in_module(
+            inference_state,
+            empty_module_context,
+            names=names,
+            wanted_type=wanted_type,
+            wanted_names=wanted_names,
+            complete=complete,
+            convert=True,
+        ):
+            yield x  # Python 2...
+
+    def _search_with_index(self, inference_state, index, wanted_type, wanted_names,
+                           complete, all_scopes):
         name = wanted_names[0]
         stub_folder_name = name + '-stubs'
 
-        ios = recurse_find_python_folders_and_files(FolderIO(self._path))
+        # 1. Search for modules in the current project
+        for folder_path in index.get_folder_paths(name) + index.get_folder_paths(stub_folder_name):
+            m = self._load_package(inference_state, FolderIO(folder_path))
+            for x in self._search_in_module(inference_state, m, wanted_type,
+                                            wanted_names, complete):
+                yield x  # Python 2...
+
+        for path in index.get_file_paths(name + '.py') + index.get_file_paths(name + '.pyi'):
+            try:
+                m = load_module_from_path(inference_state, FileIO(path)).as_context()
+            except FileNotFoundError:
+                # The file has been removed since the index was updated.
+                continue
+            for x in self._search_in_module(inference_state, m, wanted_type,
+                                            wanted_names, complete):
+                yield x  # Python 2...
+
+        # 2. Search for identifiers in the project. The index knows which
+        # files define the name, therefore there's no need for a limit.
+        paths = index.get_defining_paths(
+            name,
+            # Only the last name is completed, the others need to match.
+            complete=complete and len(wanted_names) == 1,
+            all_scopes=all_scopes,
+        )
+        for path in paths:
+            try:
+                module_value = load_module_from_path(inference_state, FileIO(path))
+            except FileNotFoundError:
+                # The file has been removed since the index was updated.
+                continue
+            if module_value.is_compiled():
+                continue
+            for x in self._search_identifiers(inference_state, module_value.as_context(),
+                                              wanted_type, wanted_names, complete,
+                                              all_scopes):
+                yield x  # Python 2...
+
+    def _search_by_walking(self, inference_state, wanted_type, wanted_names,
+                           complete, all_scopes):
+        name = wanted_names[0]
+        stub_folder_name = name + '-stubs'
         file_ios = []
 
         # 1. Search for modules in the current project
-        for folder_io, file_io in ios:
-            if file_io is None:
-                file_name = folder_io.get_base_name()
-                if file_name == name or file_name == stub_folder_name:
-                    f = folder_io.get_file_io('__init__.py')
-                    try:
-                        m = load_module_from_path(inference_state, f).as_context()
-                    except FileNotFoundError:
-                        f = folder_io.get_file_io('__init__.pyi')
-                        try:
-                            m = load_module_from_path(inference_state, f).as_context()
-                        except FileNotFoundError:
-                            m = load_namespace_from_path(inference_state, folder_io).as_context()
-                else:
+        for entry in walk_python_files(self._path, self._exclude_patterns):
+            if entry.is_dir():
+                if entry.name not in (name, stub_folder_name):
                     continue
+                m = self._load_package(inference_state, FolderIO(entry.path))
             else:
+                file_io = FileIO(entry.path)
                 file_ios.append(file_io)
-                file_name = os.path.basename(file_io.path)
-                if file_name in (name + '.py', name + '.pyi'):
+                if entry.name not in (name + '.py', name + '.pyi'):
+                    continue
+                try:
                     m = load_module_from_path(inference_state, file_io).as_context()
-                else:
+                except FileNotFoundError:
                     continue
-
-            debug.dbg('Search of a specific module %s', m)
-            for x in search_in_module(
-                inference_state,
-                m,
-                names=[m.name],
-                wanted_type=wanted_type,
-                wanted_names=wanted_names,
-                complete=complete,
-                convert=True,
-                ignore_imports=True,
-            ):
+            for x in self._search_in_module(inference_state, m, wanted_type,
+                                            wanted_names, complete):
                 yield x  # Python 2...
 
         # 2. Search for identifiers in the project.
         for module_context in search_in_file_ios(inference_state, file_ios, name):
-            names = get_module_names(module_context.tree_node, all_scopes=all_scopes)
-            names = [module_context.create_name(n) for n in names]
-            names = _remove_imports(names)
-            for x in search_in_module(
-                inference_state,
-                module_context,
-                names=names,
-                wanted_type=wanted_type,
-                wanted_names=wanted_names,
-                complete=complete,
-                ignore_imports=True,
-            ):
+            for x in self._search_identifiers(inference_state, module_context,
+                                              wanted_type, wanted_names, complete,
+                                              all_scopes):
                 yield x  # Python 2...
 
-        # 3. Search for modules on sys.path
-        sys_path = [
-            p for p in self._get_sys_path(inference_state)
-            # Exclude folders that are handled by recursing of the Python
-            # folders.
-            if not p.startswith(self._path)
-        ]
-        names = list(iter_module_names(inference_state, empty_module_context, sys_path))
-        for x in search_in_module(
+    def _load_package(self, inference_state, folder_io):
+        f = folder_io.get_file_io('__init__.py')
+        try:
+            return load_module_from_path(inference_state, f).as_context()
+        except FileNotFoundError:
+            f = folder_io.get_file_io('__init__.pyi')
+            try:
+                return load_module_from_path(inference_state, f).as_context()
+            except FileNotFoundError:
+                return load_namespace_from_path(inference_state, folder_io).as_context()
+
+    def _search_identifiers(self, inference_state, module_context, wanted_type,
+                            wanted_names, complete, all_scopes):
+        names = get_module_names(module_context.tree_node, all_scopes=all_scopes)
+        names = [module_context.create_name(n) for n in names]
+        names = _remove_imports(names)
+        return search_in_module(
             inference_state,
-            empty_module_context,
+            module_context,
             names=names,
             wanted_type=wanted_type,
             wanted_names=wanted_names,
             complete=complete,
+            ignore_imports=True,
+        )
+
+    def _search_in_module(self, inference_state, module_context, wanted_type,
+                          wanted_names, complete):
+        debug.dbg('Search of a specific module %s', module_context)
+        return search_in_module(
+            inference_state,
+            module_context,
+            names=[module_context.name],
+            wanted_type=wanted_type,
+            wanted_names=wanted_names,
+            complete=complete,
             convert=True,
-        ):
-            yield x  # Python 2...
+            ignore_imports=True,
+        )
 
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self._path)
@@ -0,0 +1,532 @@
+"""
+The symbol index keeps an outline of every Python file in a project: All the
+definitions with their qualified name, their type, their position and the
+first line of their docstring. It is used by :meth:`.Project.search` and
+:meth:`.Project.complete_search` to find the files that are worth parsing and
+inferring, instead of crawling and grepping the whole project for every
+search.
+
+It also knows where names are called, which is used to find the arguments of
+functions for dynamic params (see :mod:`jedi.inference.dynamic_params`).
+
+The index is persisted in the :data:`jedi.settings.cache_directory` and is
+updated incrementally, which means that only files that were modified since
+the last update are parsed again.
+"""
+import os
+import time
+import errno
+import hashlib
+import threading
+from functools import wraps
+from bisect import bisect_left
+from collections import namedtuple
+
+from jedi import debug
+from jedi import settings
+from jedi._compatibility import pickle_dump, pickle_load, force_unicode, \
+    FileNotFoundError
+from jedi.common.utils import register_after_fork
+from jedi.file_walker import walk_python_files
+from jedi.file_watcher import watch
+from jedi.parser_utils import get_parent_scope, clean_scope_docstring, \
+    find_statement_documentation
+
+_INDEX_VERSION = 2
+_PICKLE_PROTOCOL = 2
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _reset_locks_after_fork():
+    global _indexes_lock
+    _indexes_lock = threading.Lock()
+    for index in _indexes.values():
+        index._lock = threading.RLock()
+
+
+register_after_fork(_reset_locks_after_fork)
+
+Symbol = namedtuple(
+    'Symbol',
+    'name full_name type path line column docstring is_top_level'
+)
+"""
+A definition in the project. ``type`` is one of ``module``, ``class``,
+``function``, ``param``, ``statement`` and ``import``. ``docstring`` is the
+first line of the docstring.
+"""
+
+
+def get_symbol_index(project_path, exclude_patterns=()):
+    """
+    Returns the (cached) :class:`SymbolIndex` of a project path. The index is
+    loaded from disk if it has been saved before.
+
+    :param exclude_patterns: The exclude patterns of the project, see
+        :func:`jedi.file_walker.walk_python_files`.
+    """
+    with _indexes_lock:
+        try:
+            index = _indexes[project_path]
+        except KeyError:
+            index = _indexes[project_path] = SymbolIndex.load(project_path)
+    index.set_exclude_patterns(exclude_patterns)
+    return index
+
+
+def _get_module_name(project_path, path):
+    rel_path = os.path.relpath(path, project_path)
+    parts = os.path.splitext(rel_path)[0].split(os.path.sep)
+    if parts[-1] == '__init__':
+        parts.pop()
+    if not parts:
+        # The __init__.py of the project folder.
+        parts = [os.path.basename(project_path)]
+    return '.'.join(parts)
+
+
+def _get_symbol_type(definition):
+    type_ = definition.type
+    if type_ == 'classdef':
+        return 'class'
+    if type_ == 'funcdef':
+        return 'function'
+    if type_ == 'param':
+        return 'param'
+    if type_ in ('import_from', 'import_name'):
+        return 'import'
+    return 'statement'
+
+
+def _first_line(docstring):
+    return docstring.strip().split('\n', 1)[0]
+
+
+def _get_scope_names(name):
+    names = []
+    scope = get_parent_scope(name)
+    while scope is not None and scope.type != 'file_input':
+        if scope.type == 'async_stmt':
+            scope = scope.parent
+            continue
+        if scope.type in ('classdef', 'funcdef'):
+            names.append(scope.name.value)
+        scope = get_parent_scope(scope)
+    return names[::-1]
+
+
+def _is_top_level(module_node, name):
+    parent_scope = get_parent_scope(name)
+    # async functions have an extra wrapper. Strip it.
+    if parent_scope and parent_scope.type == 'async_stmt':
+        parent_scope = parent_scope.parent
+    return parent_scope in (module_node, None)
+
+
+def create_outline(module_node, module_name, path):
+    """
+    Returns a list of :class:`Symbol` for a parsed module. The first symbol
+    is always the module itself.
+    """
+    module_doc = _first_line(clean_scope_docstring(module_node))
+    symbols = [Symbol(
+        module_name.rpartition('.')[2], module_name, 'module', path,
+        1, 0, module_doc, True
+    )]
+    for names in module_node.get_used_names().values():
+        for name in names:
+            if not name.is_definition():
+                continue
+            definition = name.get_definition(import_name_always=True)
+            type_ = _get_symbol_type(definition)
+            if type_ in ('class', 'function'):
+                docstring = clean_scope_docstring(definition)
+            else:
+                docstring = find_statement_documentation(definition)
+            full_name = '.'.join([module_name] + _get_scope_names(name) + [name.value])
+            line, column = name.start_pos
+            symbols.append(Symbol(
+                name.value, full_name, type_, path, line, column,
+                _first_line(docstring), _is_top_level(module_node, name)
+            ))
+    symbols[1:] = sorted(symbols[1:], key=lambda s: (s.line, s.column))
+    return symbols
+
+
+def _is_called(name):
+    bracket = name.get_next_leaf()
+    return bracket == '(' and bracket.parent.type == 'trailer'
+
+
+def create_call_sites(module_node):
+    """
+    Returns a dict of the names that are called within a module, like ``foo``
+    in ``foo()`` and ``x.foo()``, to the positions of these names.
+    """
+    call_sites = {}
+    for key, names in module_node.get_used_names().items():
+        positions = [name.start_pos for name in names if _is_called(name)]
+        if positions:
+            call_sites[key] = positions
+    return call_sites
+
+
+def _synchronized(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class SymbolIndex(object):
+    """
+    An incrementally updated index of all the definitions within a project.
+    Use :func:`get_symbol_index` to get the index of a project. The index can
+    be used by multiple threads.
+    """
+    def __init__(self, project_path):
+        self._lock = threading.RLock()
+        self._project_path = project_path
+        # Dict[path, Tuple[modified, List[Symbol]]]
+        self._outlines = {}
+        # Dict[base_name, Set[path]], folders that are walked
+        self._folders = {}
+        # Dict[path, Dict[name, List[position]]]
+        self._call_sites = {}
+        self._by_name = None
+        self._callers = None
+        self._sorted_names = None
+        self._last_update = None
+        # Set once the whole project was walked by this process.
+        self._built = False
+        self._changed = False
+        self._watched = None  # Not watched until the exclude patterns are set.
+        self._pending_paths = set()
+        self._exclude_patterns = ()
+
+    @staticmethod
+    def _get_cache_path(project_path):
+        hashed = hashlib.sha256(project_path.encode('utf-8')).hexdigest()
+        return os.path.join(settings.cache_directory, 'symbol_index', hashed + '.pkl')
+
+    @classmethod
+    def load(cls, project_path):
+        index = cls(project_path)
+        try:
+            with open(cls._get_cache_path(project_path), 'rb') as f:
+                data = pickle_load(f)
+                version = data[0]
+        except (FileNotFoundError, IOError, EOFError, ValueError):
+            return index
+        except Exception as e:
+            # Corrupted or pickled by an incompatible Python.
+            debug.warning('Could not load the symbol index: %s', e)
+            return index
+        if version == _INDEX_VERSION:
+            _, index._outlines, index._folders, index._call_sites = data
+        return index
+
+    @_synchronized
+    def save(self):
+        """
+        Writes the index to the cache directory, if it changed since the last
+        time it was loaded or saved.
+        """
+        if not self._changed:
+            return
+        path = self._get_cache_path(self._project_path)
+        try:
+            os.makedirs(os.path.dirname(path))
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        with open(path, 'wb') as f:
+            data = _INDEX_VERSION, self._outlines, self._folders, self._call_sites
+            pickle_dump(data, f, _PICKLE_PROTOCOL)
+        self._changed = False
+
+    def _parse_file(self, grammar, path):
+        try:
+            with open(path, 'rb') as f:
+                code = f.read()
+        except (IOError, OSError):
+            return None
+        module_node = grammar.parse(
+            force_unicode(code.decode('utf-8', 'replace')),
+            error_recovery=True,
+            cache=False,
+        )
+        module_name = _get_module_name(self._project_path, path)
+        return create_outline(module_node, module_name, path), create_call_sites(module_node)
+
+    @_synchronized
+    def set_exclude_patterns(self, exclude_patterns):
+        exclude_patterns = tuple(exclude_patterns)
+        if exclude_patterns != self._exclude_patterns or self._watched is None:
+            self._exclude_patterns = exclude_patterns
+            # Other files might be ignored now.
+            self._last_update = None
+            # The watcher ignores the same folders as the index.
+            self._watched = watch(self._project_path, self._on_change,
+                                  exclude_patterns=exclude_patterns)
+
+    @_synchronized
+    def _on_change(self, events):
+        for event in events:
+            if not event.is_directory and event.path.endswith(('.py', '.pyi')) \
+                    and (event.path in self._outlines or event.type == 'deleted'):
+                self._pending_paths.add(event.path)
+            else:
+                # New files and folders might be ignored, therefore walk the
+                # project again.
+                self._last_update = None
+
+    @_synchronized
+    def update(self, grammar, force=False, parse_limit=None):
+        """
+        Updates the index by checking the modification times of all the
+        Python files in the project. Only files that have changed are parsed
+        again. If the project is watched for changes (see
+        :mod:`jedi.file_watcher`), only the changed files are checked.
+        Otherwise updates within :data:`jedi.settings.symbol_index_validity`
+        seconds of the last one are skipped unless ``force`` is given.
+
+        :param parse_limit: The maximum number of files that are parsed. The
+            other changed files are parsed by the next updates, the index is
+            only built once all of them are parsed.
+        :returns: The paths that were added, changed or removed.
+        """
+        if not force and self._watched and self._last_update is not None:
+            changed_paths = sorted(self._pending_paths)
+            self._pending_paths.clear()
+            if changed_paths:
+                self.update_paths(grammar, changed_paths)
+                self.save()
+            return changed_paths
+
+        now = time.time()
+        if not force and self._last_update is not None \
+                and now < self._last_update + settings.symbol_index_validity:
+            return []
+        self._last_update = now
+        self._pending_paths.clear()
+
+        folders = {}
+        seen = set()
+        changed_paths = []
+        complete = True
+        for entry in walk_python_files(self._project_path, self._exclude_patterns):
+            path = entry.path
+            if entry.is_dir():
+                folders.setdefault(entry.name, set()).add(path)
+                continue
+
+            try:
+                modified = entry.stat().st_mtime
+            except OSError:
+                # The file was removed in the meantime.
+                continue
+            seen.add(path)
+            try:
+                old_modified, _ = self._outlines[path]
+            except KeyError:
+                pass
+            else:
+                if old_modified == modified:
+                    continue
+            if parse_limit is not None and len(changed_paths) >= parse_limit:
+                complete = False
+                continue
+            changed_paths.append(path)
+            self._set_outline(path, modified, self._parse_file(grammar, path))
+
+        for path in set(self._outlines) - seen:
+            changed_paths.append(path)
+            self._set_outline(path, None, None)
+
+        self._built = complete
+        if not complete:
+            debug.dbg('Hit limit of parsed files for the index: %s', parse_limit)
+            # The next update has to walk the project again.
+            self._last_update = None
+        if folders != self._folders:
+            self._folders = folders
+            self._changed = True
+        if changed_paths:
+            debug.dbg('Updated the symbol index for %s files', len(changed_paths))
+            self._changed = True
+        self.save()
+        return changed_paths
+
+    def is_built(self):
+        """
+        Returns True if the whole project has been indexed by this process and
+        the last update parsed all the changed files. Before that an
+        :meth:`update` may parse every file of the project.
+        """
+        return self._built
+
+    @_synchronized
+    def update_paths(self, grammar, paths):
+        """
+        Updates the outlines of specific files, e.g. when the caller knows
+        which files have changed.
+        """
+        for path in paths:
+            try:
+                modified = os.path.getmtime(path)
+            except OSError:
+                self._set_outline(path, None, None)
+            else:
+                self._set_outline(path, modified, self._parse_file(grammar, path))
+            self._changed = True
+
+    def _set_outline(self, path, modified, parsed):
+        """
+        :param parsed: A tuple of the outline and the call sites of a file or
+            None if the file doesn't exist (anymore).
+        """
+        if self._by_name is not None:
+            try:
+                _, old_outline = self._outlines[path]
+            except KeyError:
+                pass
+            else:
+                for symbol in old_outline:
+                    self._remove_from_names(symbol)
+        if self._callers is not None:
+            for name in self._call_sites.get(path, ()):
+                self._callers[name].discard(path)
+
+        if parsed is None:
+            self._outlines.pop(path, None)
+            self._call_sites.pop(path, None)
+            return
+
+        outline, call_sites = parsed
+        self._outlines[path] = modified, outline
+        self._call_sites[path] = call_sites
+        if self._by_name is not None:
+            for symbol in outline:
+                self._add_to_names(symbol)
+        if self._callers is not None:
+            for name in call_sites:
+                self._callers.setdefault(name, set()).add(path)
+
+    def _add_to_names(self, symbol):
+        key = symbol.name.lower()
+        try:
+            self._by_name[key].append(symbol)
+        except KeyError:
+            self._by_name[key] = [symbol]
+            self._sorted_names = None
+
+    def _remove_from_names(self, symbol):
+        key = symbol.name.lower()
+        lst = self._by_name[key]
+        lst.remove(symbol)
+        if not lst:
+            del self._by_name[key]
+            self._sorted_names = None
+
+    def _get_by_name(self):
+        if self._by_name is None:
+            self._by_name = {}
+            for _, outline in self._outlines.values():
+                for symbol in outline:
+                    self._add_to_names(symbol)
+        return self._by_name
+
+    def _iter_matching_names(self, string, complete):
+        by_name = self._get_by_name()
+        string = string.lower()
+        if not complete:
+            if string in by_name:
+                yield string
+        else:
+            if self._sorted_names is None:
+                self._sorted_names = sorted(by_name)
+            sorted_names = self._sorted_names
+            i = bisect_left(sorted_names, string)
+            while i < len(sorted_names) and sorted_names[i].startswith(string):
+                yield sorted_names[i]
+                i += 1
+
+    @_synchronized
+    def get_outline(self, path):
+        """
+        Returns the list of :class:`Symbol` of a file, sorted by position.
+        """
+        try:
+            return self._outlines[path][1]
+        except KeyError:
+            return []
+
+    @_synchronized
+    def iter_symbols(self, name, complete=False, all_scopes=True):
+        """
+        Iterates over the symbols with a specific name. If ``complete`` is
+        given, the name is treated as a prefix.
+        """
+        by_name = self._get_by_name()
+        # Not a generator, other threads might change the index.
+        return iter([
+            symbol
+            for key in self._iter_matching_names(name, complete)
+            for symbol in by_name[key]
+            if all_scopes or symbol.is_top_level
+        ])
+
+    @_synchronized
+    def get_defining_paths(self, name, complete=False, all_scopes=False):
+        """
+        Returns the sorted paths of all the files that define a name.
+        """
+        return sorted(set(
+            symbol.path
+            for symbol in self.iter_symbols(name, complete, all_scopes)
+            if symbol.type != 'module'
+        ))
+
+    @_synchronized
+    def get_folder_paths(self, base_name):
+        """
+        Returns the sorted paths of the folders with a specific base name.
+        """
+        return sorted(self._folders.get(base_name, ()))
+
+    @_synchronized
+    def get_file_paths(self, base_name):
+        """
+        Returns the sorted paths of the files with a specific base name.
+        """
+        return sorted(
+            symbol.path
+            for symbol in self._get_by_name().get(
+                os.path.splitext(base_name)[0].lower(), ()
+            )
+            if symbol.type == 'module'
+            and os.path.basename(symbol.path) == base_name
+        )
+
+    @_synchronized
+    def get_call_sites(self, name):
+        """
+        Returns the call sites of a name (e.g. ``foo()`` or ``x.foo()``) as a
+        dict of paths to the positions of the called names.
+        """
+        if self._callers is None:
+            self._callers = {}
+            for path, call_sites in self._call_sites.items():
+                for called_name in call_sites:
+                    self._callers.setdefault(called_name, set()).add(path)
+        return {
+            path: self._call_sites[path][name]
+            for path in self._callers.get(name, ())
+        }
+
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, self._project_path)
@@ -7,14 +7,16 @@ available:
   which can be useful if there's user interaction and the user cannot react
   faster than a certain time.
 
-This module is one of the reasons why |jedi| is not thread-safe. As you can see
-there are global variables, which are holding the cache information. Some of
-these variables are being cleaned after every API usage.
+The caches are global variables and shared by all threads. Some of them are
+being cleaned after every API usage. Reading and writing single keys of a dict
+is atomic, therefore the caches are only accessed that way (a value might be
+computed twice by two threads, which doesn't matter).
 """
 import time
 from functools import wraps
 
 from jedi import settings
+from jedi.parser_utils import clear_snippet_cache
 from parso.cache import parser_cache
 
 _time_caches = {}
@@ -30,17 +32,19 @@ def clear_time_caches(delete_all=False):
     global _time_caches
 
     if delete_all:
-        for cache in _time_caches.values():
+        for cache in list(_time_caches.values()):
             cache.clear()
         parser_cache.clear()
+        clear_snippet_cache()
     else:
         # normally just kill the expired entries, not all
-        for tc in _time_caches.values():
+        for tc in list(_time_caches.values()):
             # check time_cache for expired entries
             for key, (t, value) in list(tc.items()):
                 if t < time.time():
-                    # delete expired entries
-                    del tc[key]
+                    # delete expired entries, another thread might have
+                    # deleted them already.
+                    tc.pop(key, None)
 
 
 def signature_time_cache(time_add_setting):
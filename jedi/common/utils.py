@@ -34,3 +34,33 @@ def indent_block(text, indention='    '):
         text = text[:-1]
     lines = text.split('\n')
     return '\n'.join(map(lambda s: indention + s, lines)) + temp
+
+
+def register_after_fork(func):
+    """
+    Calls ``func`` in the child process after ``os.fork``. This is used to
+    reset locks, pipes and file descriptors that must not be shared with the
+    parent. Only Python 3.7+ supports this, code that has to work in forked
+    processes on older versions needs to compare ``os.getpid()`` as well.
+    """
+    register_at_fork = getattr(os, 'register_at_fork', None)
+    if register_at_fork is not None:
+        register_at_fork(after_in_child=func)
+
+
+def get_process_context():
+    """
+    Returns the ``multiprocessing`` context for worker processes. Workers are
+    started with ``forkserver`` or ``spawn``, because forking a process that
+    uses threads and holds big caches is neither safe nor cheap.
+    """
+    import multiprocessing
+
+    try:
+        get_context = multiprocessing.get_context
+    except AttributeError:
+        # Python 2 always forks on POSIX.
+        return multiprocessing
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return get_context('forkserver')
+    return get_context('spawn')
@@ -11,7 +11,18 @@ class BaseValue(object):
             value = value.parent_context
 
 
+# Empty sets are very common and immutable, they are shared per class.
+_empty_sets = {}
+
+
 class BaseValueSet(object):
+    """
+    An immutable set of values. Most inferences result in no value or in a
+    single value, therefore empty sets are shared and unions avoid creating
+    new sets where possible.
+    """
+    __slots__ = ('_set',)
+
     def __init__(self, iterable):
         self._set = frozenset(iterable)
         for value in iterable:
@@ -19,8 +30,15 @@ class BaseValueSet(object):
 
     @classmethod
     def _from_frozen_set(cls, frozenset_):
+        if not frozenset_:
+            try:
+                return _empty_sets[cls]
+            except KeyError:
+                pass
         self = cls.__new__(cls)
         self._set = frozenset_
+        if not frozenset_:
+            _empty_sets[cls] = self
         return self
 
     @classmethod
@@ -28,27 +46,51 @@ class BaseValueSet(object):
         """
         Used to work with an iterable of set.
         """
-        aggregated = set()
+        first = first_frozen = None
+        aggregated = None
         for set_ in sets:
             if isinstance(set_, BaseValueSet):
-                aggregated |= set_._set
+                frozen = set_._set
             else:
-                aggregated |= frozenset(set_)
-        return cls._from_frozen_set(frozenset(aggregated))
+                frozen = frozenset(set_)
+            if not frozen:
+                continue
+            if first is None:
+                first = set_
+                first_frozen = frozen
+            elif aggregated is None:
+                aggregated = set(first_frozen)
+                aggregated |= frozen
+            else:
+                aggregated |= frozen
+
+        if aggregated is not None:
+            return cls._from_frozen_set(frozenset(aggregated))
+        if first is None:
+            return cls._from_frozen_set(frozenset())
+        if type(first) is cls:
+            # Only one non-empty set, no need to copy it.
+            return first
+        return cls._from_frozen_set(first_frozen)
 
     def __or__(self, other):
+        if not other._set or other._set is self._set:
+            return self
+        if not self._set and type(other) is type(self):
+            return other
         return self._from_frozen_set(self._set | other._set)
 
     def __and__(self, other):
         return self._from_frozen_set(self._set & other._set)
 
     def __iter__(self):
-        for element in self._set:
-            yield element
+        return iter(self._set)
 
     def __bool__(self):
         return bool(self._set)
 
+    __nonzero__ = __bool__  # Python 2
+
     def __len__(self):
         return len(self._set)
 
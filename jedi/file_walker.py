@@ -0,0 +1,296 @@
+"""
+Finds the Python files of a project (or of a folder in the sys path) without
+looking into the folders that are ignored.
+
+Folders are ignored if they match one of the exclude patterns of a project
+(see :class:`jedi.Project`) or a pattern of a ``.gitignore`` file. Both use the
+`gitignore syntax <https://git-scm.com/docs/gitignore#_pattern_format>`_ and
+are compiled to regular expressions once. Ignored folders are never scanned,
+which matters a lot for projects with huge ``node_modules`` or build folders.
+"""
+import os
+import re
+
+from jedi._compatibility import scandir
+
+DEFAULT_EXCLUDE_PATTERNS = (
+    '.tox/', 'venv/', '__pycache__/', '.git/', '.hg/', 'node_modules/',
+)
+_PYTHON_SUFFIXES = ('.py', '.pyi')
+
+_rules_cache = {}
+_gitignore_cache = {}
+
+
+def _translate_segment(segment):
+    result = []
+    i = 0
+    n = len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == '*':
+            result.append('[^/]*')
+        elif c == '?':
+            result.append('[^/]')
+        elif c == '\\' and i < n:
+            result.append(re.escape(segment[i]))
+            i += 1
+        elif c == '[':
+            end = i
+            if segment[end:end + 1] in ('!', '^'):
+                end += 1
+            if segment[end:end + 1] == ']':
+                end += 1
+            end = segment.find(']', end)
+            if end == -1:
+                result.append(re.escape(c))
+            else:
+                chars = segment[i:end].replace('\\', '\\\\')
+                if chars[0] in ('!', '^'):
+                    chars = '^' + chars[1:]
+                result.append('[%s]' % chars)
+                i = end + 1
+        else:
+            result.append(re.escape(c))
+    return ''.join(result)
+
+
+def _translate(pattern):
+    """
+    Translates a gitignore pattern (without a leading ``!`` or trailing
+    ``/``) to a regular expression that matches paths relative to the folder
+    of the pattern.
+    """
+    if pattern.startswith('/'):
+        pattern = pattern[1:]
+    elif '/' not in pattern:
+        # Patterns without a slash match on any level.
+        pattern = '**/' + pattern
+
+    segments = pattern.split('/')
+    last = len(segments) - 1
+    result = []
+    for i, segment in enumerate(segments):
+        if segment == '**':
+            result.append('.*' if i == last else '(?:.*/)?')
+        else:
+            result.append(_translate_segment(segment))
+            if i != last:
+                result.append('/')
+    return ''.join(result) + r'\Z'
+
+
+def _parse_line(line):
+    """
+    Returns a tuple ``(regex_string, negated, only_directories)`` or None for
+    empty lines and comments.
+    """
+    stripped = line.rstrip(' ')
+    if stripped.endswith('\\') and len(stripped) < len(line):
+        # An escaped trailing space.
+        stripped += ' '
+    line = stripped
+    if not line or line.startswith('#'):
+        return None
+
+    negated = line.startswith('!')
+    if negated:
+        line = line[1:]
+    only_directories = line.endswith('/')
+    if only_directories:
+        line = line[:-1]
+    if not line or line == '/':
+        return None
+    return _translate(line), negated, only_directories
+
+
+class IgnoreRules(object):
+    """
+    The compiled patterns of a ``.gitignore`` file or the exclude patterns of
+    a project. Later patterns take precedence over earlier ones.
+    """
+    def __init__(self, lines):
+        self._rules = []
+        file_regexes = []
+        directory_regexes = []
+        for line in lines:
+            parsed = _parse_line(line)
+            if parsed is None:
+                continue
+            regex_string, negated, only_directories = parsed
+            self._rules.append((re.compile(regex_string), negated, only_directories))
+            directory_regexes.append(regex_string)
+            if not only_directories:
+                file_regexes.append(regex_string)
+
+        self._has_negations = any(negated for _, negated, _ in self._rules)
+        # Without negations the order of the patterns doesn't matter and all
+        # of them can be matched at once.
+        self._file_regex = _compile_union(file_regexes)
+        self._directory_regex = _compile_union(directory_regexes)
+
+    def __bool__(self):
+        return bool(self._rules)
+
+    __nonzero__ = __bool__  # Python 2
+
+    def match(self, relative_path, is_directory):
+        """
+        :param relative_path: A path relative to the folder of the patterns,
+            separated by ``/``.
+        :returns: True if the path is ignored, False if it was explicitly
+            included by a negated pattern and None if no pattern matches.
+        """
+        if not self._has_negations:
+            regex = self._directory_regex if is_directory else self._file_regex
+            if regex is not None and regex.match(relative_path):
+                return True
+            return None
+
+        for regex, negated, only_directories in reversed(self._rules):
+            if only_directories and not is_directory:
+                continue
+            if regex.match(relative_path):
+                return not negated
+        return None
+
+
+def _compile_union(regex_strings):
+    if not regex_strings:
+        return None
+    return re.compile('|'.join('(?:%s)' % r for r in regex_strings))
+
+
+def get_exclude_rules(exclude_patterns=()):
+    """
+    Returns the (cached) :class:`IgnoreRules` of the default exclude patterns
+    extended by ``exclude_patterns``.
+    """
+    key = tuple(exclude_patterns)
+    try:
+        return _rules_cache[key]
+    except KeyError:
+        rules = _rules_cache[key] = IgnoreRules(DEFAULT_EXCLUDE_PATTERNS + key)
+        return rules
+
+
+def _load_gitignore(path):
+    try:
+        modified = os.stat(path).st_mtime
+        cached_modified, rules = _gitignore_cache[path]
+    except OSError:
+        return None
+    except KeyError:
+        pass
+    else:
+        if cached_modified == modified:
+            return rules
+
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+    except (IOError, OSError):
+        return None
+    rules = IgnoreRules(content.decode('utf-8', 'replace').splitlines())
+    _gitignore_cache[path] = modified, rules
+    return rules
+
+
+def _is_ignored(exclude_rules, relative_folder, gitignores, name, is_directory):
+    result = exclude_rules.match(relative_folder + name, is_directory)
+    if result is not None:
+        return result
+    # Patterns of deeper .gitignore files take precedence.
+    for rules, prefix in reversed(gitignores):
+        result = rules.match(prefix + name, is_directory)
+        if result is not None:
+            return result
+    return False
+
+
+def is_ignored(path, relative_path, is_directory, exclude_patterns=()):
+    """
+    Checks if :func:`walk_python_files` ignores a file or folder, because it
+    or one of its parent folders matches an exclude pattern or a pattern of a
+    ``.gitignore`` file. Unlike the walker, this doesn't check file suffixes.
+
+    :param path: The folder that is walked.
+    :param relative_path: The path of the file or folder relative to
+        ``path``.
+    """
+    exclude_rules = get_exclude_rules(exclude_patterns)
+    names = relative_path.split(os.path.sep)
+    folder = path
+    relative_folder = ''
+    gitignores = []
+    for i, name in enumerate(names):
+        rules = _load_gitignore(os.path.join(folder, '.gitignore'))
+        if rules:
+            gitignores = gitignores + [(rules, '')]
+        is_folder = is_directory or i < len(names) - 1
+        if _is_ignored(exclude_rules, relative_folder, gitignores, name, is_folder):
+            return True
+        folder = os.path.join(folder, name)
+        relative_folder += name + '/'
+        gitignores = [(rules, prefix + name + '/') for rules, prefix in gitignores]
+    return False
+
+
+def walk_python_files(path, exclude_patterns=(), except_paths=()):
+    """
+    Walks a folder and yields the :func:`os.scandir` entries of all Python
+    files and folders that are not ignored. The files of a folder are yielded
+    before its subfolders, subfolders are yielded before their content.
+
+    :param exclude_patterns: Gitignore-style patterns relative to ``path``,
+        that are added to :data:`DEFAULT_EXCLUDE_PATTERNS`.
+    :param except_paths: Paths of files and folders that are skipped.
+    """
+    exclude_rules = get_exclude_rules(exclude_patterns)
+    except_paths = set(except_paths)
+    # List[Tuple[folder, folder relative to path, List[Tuple[rules, prefix]]]]
+    stack = [(path, '', [])]
+    while stack:
+        folder, relative_folder, gitignores = stack.pop()
+        try:
+            entries = list(scandir(folder))
+        except OSError:
+            continue
+
+        for entry in entries:
+            if entry.name == '.gitignore':
+                rules = _load_gitignore(entry.path)
+                if rules:
+                    gitignores = gitignores + [(rules, '')]
+                break
+
+        folders = []
+        for entry in entries:
+            name = entry.name
+            try:
+                is_directory = entry.is_dir()
+            except OSError:
+                continue
+            if not is_directory and not name.endswith(_PYTHON_SUFFIXES):
+                continue
+            if _is_ignored(exclude_rules, relative_folder, gitignores, name, is_directory) \
+                    or except_paths and entry.path in except_paths:
+                continue
+            if is_directory:
+                folders.append(entry)
+            else:
+                yield entry
+
+        for entry in folders:
+            yield entry
+        for entry in reversed(folders):
+            if entry.is_symlink():
+                # Like os.walk, don't follow symlinks to avoid endless loops.
+                continue
+            name = entry.name + '/'
+            stack.append((
+                entry.path,
+                relative_folder + name,
+                [(rules, prefix + name) for rules, prefix in gitignores],
+            ))
@@ -0,0 +1,527 @@
+"""
+Jedi caches a lot of information about files: Parsed modules, the stub files
+of typeshed, the sys path of environments and the symbol index of projects.
+Instead of checking on every request if these caches are still valid, the
+parts that cache something can watch the directories they depend on and get
+notified about changes.
+
+On Linux inotify is used. On other systems (or if inotify runs out of watches)
+the directories are polled at most every ``_POLL_INTERVAL`` seconds. Scanning
+whole projects regularly would be way too slow, therefore polling only checks
+the files of recursively watched directories that were loaded by |jedi|. New
+files are only noticed in directories that are not watched recursively.
+
+Watching is disabled by default, see :data:`jedi.settings.watch_file_system`.
+
+Changes are only collected when :func:`publish_changes` is called, which the
+API does before every request. This means that there are no threads involved
+and callbacks are always called in the thread that uses |jedi|. If multiple
+threads use |jedi|, changes are published by one of them at a time.
+"""
+import os
+import sys
+import time
+import errno
+import struct
+import threading
+from collections import namedtuple
+
+from parso.cache import parser_cache
+
+from jedi import debug
+from jedi import settings
+from jedi._compatibility import scandir
+from jedi.common.utils import register_after_fork
+from jedi.file_walker import get_exclude_rules, is_ignored, walk_python_files
+
+ChangeEvent = namedtuple('ChangeEvent', 'type path is_directory')
+"""
+``type`` is one of ``created``, ``modified`` and ``deleted``. A ``modified``
+event for a directory means that anything within it might have changed.
+"""
+
+_WATCHED_SUFFIXES = ('.py', '.pyi', '.pth', '.egg-link', '.gitignore')
+_POLL_INTERVAL = 2.0
+
+_IN_ATTRIB = 0x4
+_IN_CLOSE_WRITE = 0x8
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ONLYDIR = 0x1000000
+_IN_ISDIR = 0x40000000
+_IN_CLOEXEC = 0o2000000
+_INOTIFY_MASK = _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO \
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+_INOTIFY_EVENT = struct.Struct('iIII')
+
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def _is_relevant(name, is_directory):
+    if is_directory:
+        return not get_exclude_rules().match(name, True)
+    return name.endswith(_WATCHED_SUFFIXES)
+
+
+class _BaseFileWatcher(object):
+    def __init__(self):
+        self._roots = {}  # Dict[path, recursive]
+        # Dict[path, exclude patterns], see jedi.file_walker.
+        self._exclude_patterns = {}
+        # Dict[path, bool], whether all the changes within a root are found.
+        self._complete_roots = {}
+        self._subscriptions = []
+        self._lock = threading.RLock()
+        self._forked = False
+
+    def _get_watching_root(self, path, recursive, exclude_patterns):
+        if self._roots.get(path) is False and not recursive:
+            return path
+        for root, root_recursive in self._roots.items():
+            if not root_recursive:
+                continue
+            if root == path:
+                if not recursive or self._exclude_patterns[root] == exclude_patterns:
+                    return root
+            elif not recursive and path.startswith(os.path.join(root, '')) \
+                    and self._is_relevant_in_root(root, path, True):
+                return root
+        return None
+
+    def _is_relevant_in_root(self, root, path, is_directory):
+        # Recursively watched roots ignore the same files and folders as
+        # jedi.file_walker.walk_python_files.
+        if not is_directory and not path.endswith(_WATCHED_SUFFIXES):
+            return False
+        relative_path = os.path.relpath(path, root)
+        return not is_ignored(root, relative_path, is_directory, self._exclude_patterns[root])
+
+    def watch(self, path, recursive=True, exclude_patterns=()):
+        """
+        Starts watching a directory. If ``recursive`` is false, only the files
+        directly within the directory are watched.
+
+        :param exclude_patterns: The folders and files that are not watched
+            recursively, like in :func:`jedi.file_walker.walk_python_files`.
+        :returns: True if all the changes within the directory are found,
+            False if only the files that were loaded are checked.
+        """
+        path = os.path.abspath(path)
+        exclude_patterns = tuple(exclude_patterns)
+        with self._lock:
+            self._check_fork()
+            root = self._get_watching_root(path, recursive, exclude_patterns)
+            if root is None:
+                root = path
+                self._roots[path] = recursive
+                self._exclude_patterns[path] = exclude_patterns
+                self._complete_roots[path] = self._add_root(path, recursive)
+            return self._complete_roots[root]
+
+    def subscribe(self, callback, path=None):
+        """
+        ``callback`` is called with a list of :class:`ChangeEvent`. If a path
+        is given, only the changes within that path are published to it.
+        Subscribing a callback for the same path again has no effect.
+        """
+        with self._lock:
+            if (path, callback) not in self._subscriptions:
+                self._subscriptions.append((path, callback))
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s[1] != callback]
+
+    def publish_changes(self):
+        with self._lock:
+            self._check_fork()
+            events = self.get_changes()
+            if events:
+                debug.dbg('File changes: %s', events[:10])
+            for path, callback in list(self._subscriptions):
+                if not events:
+                    break
+                if path is None:
+                    relevant = events
+                else:
+                    prefix = os.path.join(path, '')
+                    relevant = [e for e in events if e.path == path or e.path.startswith(prefix)]
+                if relevant:
+                    callback(relevant)
+            return events
+
+    def _add_root(self, path, recursive):
+        raise NotImplementedError
+
+    def _mark_forked(self):
+        # Forking happens often (e.g. for subprocesses), but most children
+        # never use the watcher. Therefore it's only reset on first use.
+        self._lock = threading.RLock()
+        self._forked = True
+
+    def _check_fork(self):
+        if self._forked:
+            self._forked = False
+            self._reset_after_fork()
+
+    def _reset_after_fork(self):
+        pass
+
+    def get_changes(self):
+        raise NotImplementedError
+
+
+class PollingWatcher(_BaseFileWatcher):
+    """
+    Keeps a snapshot of the modification times of the relevant files and
+    compares it with a new ``scandir`` of each directory that is not watched
+    recursively. Within recursively watched directories only the files in the
+    parser cache are checked.
+    """
+    def __init__(self):
+        super(PollingWatcher, self).__init__()
+        # Dict[directory, Dict[name, Tuple[is_directory, modified]]]
+        self._directories = {}
+        self._loaded_files = {}  # Dict[path, Optional[modified]]
+        self._last_poll = time.time()
+
+    def _add_root(self, path, recursive):
+        if recursive:
+            return False
+        self._scan(path, recursive, [])
+        return True
+
+    def _scan_directory(self, directory):
+        entries = {}
+        try:
+            dir_entries = scandir(directory)
+        except OSError:
+            return None
+        for entry in dir_entries:
+            try:
+                is_directory = entry.is_dir()
+                if _is_relevant(entry.name, is_directory):
+                    modified = None if is_directory else entry.stat().st_mtime
+                    entries[entry.name] = is_directory, modified
+            except OSError:
+                # The file was removed while scanning.
+                pass
+        return entries
+
+    def _scan(self, directory, recursive, events):
+        entries = self._scan_directory(directory)
+        if entries is None:
+            self._remove(directory, events)
+            return
+
+        old_entries = self._directories.get(directory)
+        self._directories[directory] = entries
+        if old_entries is not None:
+            for name, (is_directory, modified) in entries.items():
+                path = os.path.join(directory, name)
+                try:
+                    old_is_directory, old_modified = old_entries[name]
+                except KeyError:
+                    events.append(ChangeEvent('created', path, is_directory))
+                else:
+                    if old_is_directory != is_directory:
+                        events.append(ChangeEvent('deleted', path, old_is_directory))
+                        events.append(ChangeEvent('created', path, is_directory))
+                    elif old_modified != modified:
+                        events.append(ChangeEvent('modified', path, is_directory))
+            for name, (is_directory, modified) in old_entries.items():
+                if name not in entries or entries[name][0] != is_directory:
+                    path = os.path.join(directory, name)
+                    if is_directory:
+                        self._remove(path, events)
+                    if name not in entries:
+                        events.append(ChangeEvent('deleted', path, is_directory))
+
+        if recursive:
+            for name, (is_directory, modified) in entries.items():
+                if is_directory:
+                    self._scan(os.path.join(directory, name), True, events)
+
+    def _remove(self, directory, events):
+        entries = self._directories.pop(directory, None) or {}
+        for name, (is_directory, modified) in entries.items():
+            path = os.path.join(directory, name)
+            if is_directory:
+                self._remove(path, events)
+            else:
+                events.append(ChangeEvent('deleted', path, False))
+
+    def get_changes(self, force=False):
+        now = time.time()
+        if not force and now < self._last_poll + _POLL_INTERVAL:
+            return []
+        self._last_poll = now
+
+        events = []
+        for root, recursive in self._roots.items():
+            if not recursive:
+                self._scan(root, recursive, events)
+        self._check_loaded_files(events)
+        return events
+
+    def _check_loaded_files(self, events):
+        roots = [root for root, recursive in self._roots.items() if recursive]
+        if not roots:
+            return
+        prefixes = tuple(os.path.join(root, '') for root in roots)
+        paths = set(
+            path
+            for cache in list(parser_cache.values())
+            for path in list(cache)
+            if path is not None and path.startswith(prefixes)
+        )
+
+        loaded_files = {}
+        for path in paths:
+            try:
+                modified = os.stat(path).st_mtime
+            except OSError:
+                modified = None
+            loaded_files[path] = modified
+            # Files that were loaded since the last poll are not reported.
+            if self._loaded_files.get(path, modified) != modified and any(
+                path.startswith(prefix) and self._is_relevant_in_root(root, path, False)
+                for root, prefix in zip(roots, prefixes)
+            ):
+                type_ = 'modified' if modified is not None else 'deleted'
+                events.append(ChangeEvent(type_, path, False))
+        self._loaded_files = loaded_files
+
+
+class InotifyWatcher(_BaseFileWatcher):
+    """
+    Uses Linux' inotify via ctypes. Directories that cannot be watched (e.g.
+    because ``max_user_watches`` is exhausted) are polled.
+    """
+    def __init__(self, libc):
+        super(InotifyWatcher, self).__init__()
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(_get_errno(), 'inotify_init1 failed')
+        # Dict[wd, Tuple[directory, root]], the root is None if the directory
+        # is not watched recursively.
+        self._watch_descriptors = {}
+        self._fallback = None
+
+    def _add_watch(self, directory, root):
+        wd = self._libc.inotify_add_watch(
+            self._fd,
+            directory.encode(sys.getfilesystemencoding()),
+            _INOTIFY_MASK
+        )
+        if wd < 0:
+            raise OSError(_get_errno(), 'inotify_add_watch failed', directory)
+        if wd not in self._watch_descriptors:
+            # Otherwise already watched, e.g. by another root.
+            self._watch_descriptors[wd] = directory, root
+
+    def _add_new_directory(self, directory, root):
+        self._add_watch(directory, root)
+        for entry in scandir(directory):
+            if entry.is_dir() and not entry.is_symlink() \
+                    and self._is_relevant_in_root(root, entry.path, True):
+                self._add_new_directory(entry.path, root)
+
+    def _add_root(self, path, recursive):
+        try:
+            if recursive:
+                self._add_watch(path, path)
+                for entry in walk_python_files(path, self._exclude_patterns[path]):
+                    if entry.is_dir():
+                        self._add_watch(entry.path, path)
+            else:
+                self._add_watch(path, None)
+        except OSError as e:
+            debug.warning('Cannot use inotify for %s (%s), polling instead', path, e)
+            if self._fallback is None:
+                self._fallback = PollingWatcher()
+            return self._fallback.watch(path, recursive)
+        return True
+
+    def _reset_after_fork(self):
+        # The inotify instance is shared with the parent, which would steal
+        # the events of the child (and the other way around).
+        if self._fd is not None:
+            os.close(self._fd)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | _IN_CLOEXEC)
+        self._watch_descriptors = {}
+        self._fallback = None
+        if self._fd < 0:
+            debug.warning('Cannot use inotify after fork, polling instead')
+            self._fd = None
+        for path, recursive in self._roots.items():
+            if self._fd is None:
+                if self._fallback is None:
+                    self._fallback = PollingWatcher()
+                complete = self._fallback.watch(path, recursive)
+            else:
+                complete = self._add_root(path, recursive)
+            self._complete_roots[path] = complete
+
+    def _read_events(self, data, events):
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            name = name.decode(sys.getfilesystemencoding(), 'replace')
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were lost, everything might have changed.
+                for root in self._roots:
+                    events.append(ChangeEvent('modified', root, True))
+                continue
+            try:
+                directory, root = self._watch_descriptors[wd]
+            except KeyError:
+                continue
+            if mask & _IN_IGNORED:
+                del self._watch_descriptors[wd]
+                continue
+            if not name:
+                if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                    events.append(ChangeEvent('deleted', directory, True))
+                continue
+
+            is_directory = bool(mask & _IN_ISDIR)
+            path = os.path.join(directory, name)
+            if root is None:
+                if not _is_relevant(name, is_directory):
+                    continue
+            elif not self._is_relevant_in_root(root, path, is_directory):
+                continue
+            if mask & (_IN_CREATE | _IN_MOVED_TO):
+                events.append(ChangeEvent('created', path, is_directory))
+                if is_directory and root is not None:
+                    try:
+                        self._add_new_directory(path, root)
+                    except OSError:
+                        # Let the subscribers deal with the whole directory.
+                        events.append(ChangeEvent('modified', directory, True))
+            elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                events.append(ChangeEvent('deleted', path, is_directory))
+            elif not is_directory:
+                events.append(ChangeEvent('modified', path, is_directory))
+
+    def get_changes(self):
+        events = []
+        while self._fd is not None:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+            if not data:
+                break
+            self._read_events(data, events)
+        if self._fallback is not None:
+            events += self._fallback.get_changes()
+        return events
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+
+
+def _get_errno():
+    import ctypes
+    return ctypes.get_errno()
+
+
+def _load_libc():
+    if not sys.platform.startswith('linux'):
+        return None
+    import ctypes
+    import ctypes.util
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def _evict_parser_cache(events):
+    for event in events:
+        if event.is_directory:
+            continue
+        for cache in parser_cache.values():
+            cache.pop(event.path, None)
+
+
+def get_file_watcher():
+    """
+    Returns the file watcher of this process or None if
+    :data:`jedi.settings.watch_file_system` is disabled.
+    """
+    global _watcher
+    if not settings.watch_file_system:
+        return None
+    with _watcher_lock:
+        if _watcher is None:
+            watcher = None
+            libc = _load_libc()
+            if libc is not None:
+                try:
+                    watcher = InotifyWatcher(libc)
+                except OSError as e:
+                    debug.warning('Cannot use inotify: %s', e)
+            if watcher is None:
+                watcher = PollingWatcher()
+            watcher.subscribe(_evict_parser_cache)
+            _watcher = watcher
+    return _watcher
+
+
+def _reset_watcher_after_fork():
+    global _watcher_lock
+    _watcher_lock = threading.Lock()
+    if _watcher is not None:
+        _watcher._mark_forked()
+
+
+register_after_fork(_reset_watcher_after_fork)
+
+
+def watch(path, callback, recursive=True, exclude_patterns=()):
+    """
+    Watches a directory and calls ``callback`` with the list of changes within
+    it, every time changes are published. Recursively watched directories
+    ignore the same folders and files as
+    :func:`jedi.file_walker.walk_python_files` with ``exclude_patterns``.
+
+    :returns: True if all the changes within the directory are published.
+        False if watching the file system is disabled or if only the loaded
+        files within the directory are polled.
+    """
+    watcher = get_file_watcher()
+    if watcher is None:
+        return False
+    complete = watcher.watch(path, recursive, exclude_patterns)
+    watcher.subscribe(callback, os.path.abspath(path))
+    return complete
+
+
+def publish_changes():
+    """
+    Publishes the changes since the last call to the subscribers. This is
+    called by the API before every request.
+    """
+    if _watcher is not None:
+        _watcher.publish_changes()
@@ -68,6 +68,7 @@ from jedi.file_io import FileIO
 
 from jedi import debug
 from jedi import settings
+from jedi import parser_utils
 from jedi.inference import imports
 from jedi.inference import recursion
 from jedi.inference.cache import inference_state_function_cache
@@ -98,8 +99,13 @@ class InferenceState(object):
         self.compiled_cache = {}  # see `inference.compiled.create()`
         self.inferred_element_counts = {}
         self.mixed_cache = {}  # see `inference.compiled.mixed._create()`
+        self.overload_match_cache = {}  # see `OverloadedFunctionValue.py__call__`
+        self.function_summary_cache = {}  # see `value.function.infer_function_summary()`
+        self.reachability_cache = {}  # see `flow_analysis._get_cached()`
         self.analysis = []
         self.dynamic_params_depth = 0
+        # Can be disabled temporarily, see settings.dynamic_params_for_other_modules
+        self.dynamic_params_for_other_modules = True
         self.is_analysis = False
         self.project = project
         self.access_cache = {}
@@ -192,7 +198,7 @@ class InferenceState(object):
             code = code[:settings._cropped_file_size]
 
         grammar = self.latest_grammar if use_latest_grammar else self.grammar
-        return grammar.parse(code=code, path=path, file_io=file_io, **kwargs), code
+        return parser_utils.parse(grammar, code, path=path, file_io=file_io, **kwargs), code
 
     def parse(self, *args, **kwargs):
         return self.parse_and_get_code(*args, **kwargs)[0]
@@ -375,6 +375,8 @@ def _getitem(value, index_values, contextualized_node):
 
 
 class ValueSet(BaseValueSet):
+    __slots__ = ()
+
     def py__class__(self):
         return ValueSet(c.py__class__() for c in self._set)
 
@@ -194,7 +194,7 @@ def _find_syntax_node_name(inference_state, python_object):
         # We don't need to check names for modules, because there's not really
         # a way to write a module in a module in Python (and also __name__ can
         # be something like ``email.utils``).
-        code_lines = get_cached_code_lines(inference_state.grammar, path)
+        code_lines = get_cached_code_lines(inference_state.grammar, path, module_node)
         return module_node, module_node, file_io, code_lines
 
     try:
@@ -234,7 +234,7 @@ def _find_syntax_node_name(inference_state, python_object):
         if line_names:
             names = line_names
 
-    code_lines = get_cached_code_lines(inference_state.grammar, path)
+    code_lines = get_cached_code_lines(inference_state.grammar, path, module_node)
     # It's really hard to actually get the right definition, here as a last
     # resort we just return the last one. This chance might lead to odd
     # completions at some points but will lead to mostly correct type
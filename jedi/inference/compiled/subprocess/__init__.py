@@ -5,6 +5,12 @@ goals:
 1. Making it safer - Segfaults and RuntimeErrors as well as stdout/stderr can
    be ignored and dealt with.
 2. Make it possible to handle different Python versions as well as virtualenvs.
+
+A process that forks (e.g. to create workers that inherit the caches of the
+parent) does not share the subprocesses with its children: A child starts its
+own subprocess once it needs one. Inference states must not be used across
+forks, because the compiled objects they know live in the parent's
+subprocess.
 """
 
 import os
@@ -14,7 +20,7 @@ import socket
 import errno
 import traceback
 from functools import partial
-from threading import Thread
+from threading import Thread, Lock
 try:
     from queue import Queue, Empty
 except ImportError:
@@ -24,6 +30,7 @@ from jedi._compatibility import queue, is_py3, force_unicode, \
     pickle_dump, pickle_load, GeneralizedPopen, weakref
 from jedi import debug
 from jedi.cache import memoize_method
+from jedi.common.utils import register_after_fork
 from jedi.inference.compiled.subprocess import functions
 from jedi.inference.compiled.access import DirectObjectAccess, AccessPath, \
     SignatureParam
@@ -32,8 +39,13 @@ from jedi.api.exceptions import InternalError
 
 _MAIN_PATH = os.path.join(os.path.dirname(__file__), '__main__.py')
 
+_subprocesses = weakref.WeakSet()
+
 
 def _enqueue_output(out, queue):
+    # Read from the unbuffered stream. A buffered stream would be locked while
+    # this thread waits, which would deadlock a forked child that closes it.
+    out = getattr(out, 'raw', out)  # Python 2 has no raw streams.
     for line in iter(out.readline, b''):
         queue.put(line)
 
@@ -54,7 +66,12 @@ def _get_function(name):
     return getattr(functions, name)
 
 
-def _cleanup_process(process, thread):
+def _cleanup_process(process, thread, pid):
+    if os.getpid() != pid:
+        # In a forked child the process belongs to the parent and the thread
+        # doesn't exist, just close the inherited pipes.
+        _close_streams(process)
+        return
     try:
         process.kill()
         process.wait()
@@ -62,6 +79,10 @@ def _cleanup_process(process, thread):
         # Raised if the process is already killed.
         pass
     thread.join()
+    _close_streams(process)
+
+
+def _close_streams(process):
     for stream in [process.stdin, process.stdout, process.stderr]:
         try:
             stream.close()
@@ -160,6 +181,10 @@ class CompiledSubprocess(object):
         self._executable = executable
         self._inference_state_deletion_queue = queue.deque()
         self._cleanup_callable = lambda: None
+        # Requests and their responses must not be interleaved by threads.
+        self._lock = Lock()
+        self._pid = os.getpid()
+        _subprocesses.add(self)
 
     def __repr__(self):
         pid = os.getpid()
@@ -202,9 +227,23 @@ class CompiledSubprocess(object):
         self._cleanup_callable = weakref.finalize(self,
                                                   _cleanup_process,
                                                   process,
-                                                  t)
+                                                  t,
+                                                  self._pid)
         return process
 
+    def _reset_after_fork(self):
+        """
+        Called in a forked child. The parent's subprocess is left alone, a new
+        one is started when it's needed.
+        """
+        self._pid = os.getpid()
+        self._lock = Lock()
+        self._inference_state_deletion_queue = queue.deque()
+        self._cleanup_callable()
+        self._cleanup_callable = lambda: None
+        self.__dict__.pop('_memoize_method_dct', None)
+        self.__dict__.pop('is_crashed', None)
+
     def run(self, inference_state, function, args=(), kwargs={}):
         # Delete old inference_states.
         while True:
@@ -226,14 +265,21 @@ class CompiledSubprocess(object):
         self._cleanup_callable()
 
     def _send(self, inference_state_id, function, args=(), kwargs={}):
-        if self.is_crashed:
-            raise InternalError("The subprocess %s has crashed." % self._executable)
-
         if not is_py3:
             # Python 2 compatibility
             kwargs = {force_unicode(key): value for key, value in kwargs.items()}
 
         data = inference_state_id, function, args, kwargs
+        if self._pid != os.getpid():
+            # Forked without os.register_at_fork (Python < 3.7).
+            self._reset_after_fork()
+        with self._lock:
+            return self._send_and_receive(data)
+
+    def _send_and_receive(self, data):
+        if self.is_crashed:
+            raise InternalError("The subprocess %s has crashed." % self._executable)
+
         try:
             pickle_dump(data, self._get_process().stdin, self._pickle_protocol)
         except (socket.error, IOError) as e:
@@ -400,3 +446,11 @@ class AccessHandle(object):
     @memoize_method
     def _cached_results(self, name, *args, **kwargs):
         return self._subprocess.get_compiled_method_return(self.id, name, *args, **kwargs)
+
+
+def _reset_subprocesses_after_fork():
+    for compiled_subprocess in list(_subprocesses):
+        compiled_subprocess._reset_after_fork()
+
+
+register_after_fork(_reset_subprocesses_after_fork)
@@ -250,10 +250,10 @@ class CompiledValue(Value):
             return ValueSet([self])
 
         name, args = self.access_handle.get_annotation_name_and_args()
-        arguments = [
+        arguments = tuple(
             ValueSet([create_from_access_path(self.inference_state, path)])
             for path in args
-        ]
+        )
         if name == 'Union':
             return ValueSet.from_sets(arg.execute_annotation() for arg in arguments)
         elif name:
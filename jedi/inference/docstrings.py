@@ -15,15 +15,21 @@ As an addition to parameter searching, this module also provides return
 annotations.
 """
 
+import os
 import re
+import errno
+import hashlib
 import warnings
 from textwrap import dedent
 
-from parso import parse, ParserSyntaxError
+from parso import load_grammar, ParserSyntaxError
 
-from jedi._compatibility import u
+from jedi._compatibility import u, force_unicode, pickle_dump, pickle_load, \
+    FileNotFoundError
 from jedi import debug
+from jedi import settings
 from jedi.common.utils import indent_block
+from jedi.parser_utils import parse_snippet, get_cached_snippet
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.base_value import iterator_to_value_set, ValueSet, \
     NO_VALUES
@@ -44,28 +50,57 @@ DOCSTRING_RETURN_PATTERNS = [
 REST_ROLE_PATTERN = re.compile(r':[^`]+:`([^`]+)`')
 
 
+_DOCSTRING_TYPES_VERSION = 1
+_PICKLE_PROTOCOL = 2
+
 _numpy_doc_string_cache = None
 
 
 def _get_numpy_doc_string_cls():
+    """
+    Imports numpydoc only when it's needed. Returns None if it's not
+    available, which is only checked once.
+    """
     global _numpy_doc_string_cache
-    if isinstance(_numpy_doc_string_cache, (ImportError, SyntaxError)):
-        raise _numpy_doc_string_cache
-    from numpydoc.docscrape import NumpyDocString
-    _numpy_doc_string_cache = NumpyDocString
-    return _numpy_doc_string_cache
+    if _numpy_doc_string_cache is None:
+        try:
+            from numpydoc.docscrape import NumpyDocString
+        except (ImportError, SyntaxError):
+            _numpy_doc_string_cache = False
+        else:
+            _numpy_doc_string_cache = NumpyDocString
+    return _numpy_doc_string_cache or None
 
 
-def _search_param_in_numpydocstr(docstr, param_str):
-    """Search `docstr` (in numpydoc format) for type(-s) of `param_str`."""
+def _parse_numpydocstr(docstr):
+    """
+    Returns the ``Parameters`` and the ``Returns`` and ``Yields`` of `docstr`
+    (in numpydoc format).
+    """
+    numpy_doc_string_cls = _get_numpy_doc_string_cls()
+    if numpy_doc_string_cls is None:
+        return [], []
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
         try:
-            # This is a non-public API. If it ever changes we should be
-            # prepared and return gracefully.
-            params = _get_numpy_doc_string_cls()(docstr)._parsed_data['Parameters']
+            doc = numpy_doc_string_cls(docstr)
         except Exception:
-            return []
+            return [], []
+    # This is a non-public API. If it ever changes we should be prepared and
+    # return gracefully.
+    try:
+        params = doc._parsed_data['Parameters']
+    except Exception:
+        params = []
+    try:
+        returns = doc._parsed_data['Returns'] + doc._parsed_data['Yields']
+    except Exception:
+        returns = []
+    return params, returns
+
+
+def _search_param_in_numpydocstr(params, param_str):
+    """Search numpydoc `params` for type(-s) of `param_str`."""
     for p_name, p_type, p_descr in params:
         if p_name == param_str:
             m = re.match(r'([^,]+(,[^,]+)*?)(,[ ]*optional)?$', p_type)
@@ -75,23 +110,10 @@ def _search_param_in_numpydocstr(docstr, param_str):
     return []
 
 
-def _search_return_in_numpydocstr(docstr):
+def _search_return_in_numpydocstr(returns):
     """
-    Search `docstr` (in numpydoc format) for type(-s) of function returns.
+    Search numpydoc `returns` for type(-s) of function returns.
     """
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        try:
-            doc = _get_numpy_doc_string_cls()(docstr)
-        except Exception:
-            return
-    try:
-        # This is a non-public API. If it ever changes we should be
-        # prepared and return gracefully.
-        returns = doc._parsed_data['Returns']
-        returns += doc._parsed_data['Yields']
-    except Exception:
-        return
     for r_name, r_type, r_descr in returns:
         # Return names are optional and if so the type is in the name
         if not r_type:
@@ -113,7 +135,7 @@ def _expand_typestr(type_str):
         yield type_str.split('of')[0]
     # Check if type has is a set of valid literal values eg: {'C', 'F', 'A'}
     elif type_str.startswith('{'):
-        node = parse(type_str, version='3.7').children[0]
+        node = parse_snippet(load_grammar(version='3.7'), type_str).children[0]
         if node.type == 'atom':
             for leaf in node.children[1].children:
                 if leaf.type == 'number':
@@ -150,15 +172,98 @@ def _search_param_in_docstr(docstr, param_str):
     ['int']
 
     """
+    return _get_docstring_types(docstr)[0].get(param_str, [])
+
+
+def _search_return_in_docstr(docstr):
+    return _get_docstring_types(docstr)[1]
+
+
+def _get_docstring_types(docstr):
+    """
+    Returns a dict of param names to their types and a list of the return
+    types of `docstr`. Docstrings can be long and parsing numpydoc is slow,
+    therefore the result is cached by the hash of the docstring (and written
+    to the cache directory if :data:`jedi.settings.cache_docstring_types` is
+    enabled).
+    """
+    docstr = force_unicode(docstr)
+    hashed = hashlib.sha256(docstr.encode('utf-8')).hexdigest()
+
+    def create():
+        types = _load_docstring_types(hashed)
+        if types is None:
+            types = _parse_docstring_types(docstr)
+            _save_docstring_types(hashed, types)
+        return types
+
+    return get_cached_snippet(('docstring_types', hashed), create)
+
+
+def _parse_docstring_types(docstr):
+    param_types = {}
     # look at #40 to see definitions of those params
-    patterns = [re.compile(p % re.escape(param_str))
-                for p in DOCSTRING_PARAM_PATTERNS]
-    for pattern in patterns:
-        match = pattern.search(docstr)
+    for p in DOCSTRING_PARAM_PATTERNS:
+        pattern = re.compile(p % r'(?P<name>\w+)')
+        # The type is in the group that is not the name.
+        type_group = 3 - pattern.groupindex['name']
+        for match in pattern.finditer(docstr):
+            param_types.setdefault(
+                match.group('name'),
+                [_strip_rst_role(match.group(type_group))]
+            )
+
+    return_types = []
+    for p in DOCSTRING_RETURN_PATTERNS:
+        match = p.search(docstr)
         if match:
-            return [_strip_rst_role(match.group(1))]
+            return_types.append(_strip_rst_role(match.group(1)))
+
+    params, returns = _parse_numpydocstr(docstr)
+    for p_name, p_type, p_descr in params:
+        if p_name not in param_types:
+            param_types[p_name] = _search_param_in_numpydocstr(params, p_name)
+    # Check for numpy style return hint
+    return_types += _search_return_in_numpydocstr(returns)
+    return param_types, return_types
+
 
-    return _search_param_in_numpydocstr(docstr, param_str)
+def _get_docstring_types_path(hashed):
+    return os.path.join(settings.cache_directory, 'docstring_types',
+                        hashed[:2], hashed + '.pkl')
+
+
+def _load_docstring_types(hashed):
+    if not settings.cache_docstring_types:
+        return None
+    try:
+        with open(_get_docstring_types_path(hashed), 'rb') as f:
+            version, types = pickle_load(f)
+    except (FileNotFoundError, IOError, EOFError, ValueError):
+        return None
+    except Exception as e:
+        # Corrupted or pickled by an incompatible Python.
+        debug.warning('Could not load docstring types: %s', e)
+        return None
+    if version != _DOCSTRING_TYPES_VERSION:
+        return None
+    return types
+
+
+def _save_docstring_types(hashed, types):
+    if not settings.cache_docstring_types:
+        return
+    path = _get_docstring_types_path(hashed)
+    try:
+        try:
+            os.makedirs(os.path.dirname(path))
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        with open(path, 'wb') as f:
+            pickle_dump((_DOCSTRING_TYPES_VERSION, types), f, _PICKLE_PROTOCOL)
+    except (IOError, OSError) as e:
+        debug.warning('Could not save docstring types: %s', e)
 
 
 def _strip_rst_role(type_str):
@@ -207,7 +312,8 @@ def _infer_for_statement_string(module_context, string):
     debug.dbg('Parse docstring code %s', string, color='BLUE')
     grammar = module_context.inference_state.latest_grammar
     try:
-        module = grammar.parse(code.format(indent_block(string)), error_recovery=False)
+        module = parse_snippet(grammar, code.format(indent_block(string)),
+                               error_recovery=False)
     except ParserSyntaxError:
         return []
     try:
@@ -293,15 +399,6 @@ def infer_param(function_value, param):
 @inference_state_method_cache()
 @iterator_to_value_set
 def infer_return_types(function_value):
-    def search_return_in_docstr(code):
-        for p in DOCSTRING_RETURN_PATTERNS:
-            match = p.search(code)
-            if match:
-                yield _strip_rst_role(match.group(1))
-        # Check for numpy style return hint
-        for type_ in _search_return_in_numpydocstr(code):
-            yield type_
-
-    for type_str in search_return_in_docstr(function_value.py__doc__()):
+    for type_str in _search_return_in_docstr(function_value.py__doc__()):
         for value in _infer_for_statement_string(function_value.get_root_context(), type_str):
             yield value
@@ -15,10 +15,18 @@ It works as follows:
 - |Jedi| sees a param
 - search for function calls named ``foo``
 - execute these calls and check the input.
+
+Calls in other modules of the project are looked up in the call sites of the
+symbol index (see :mod:`jedi.api.symbol_index`), which is updated
+incrementally. Modules outside of the project are still searched by looking
+for the name in the files next to them.
 """
+import os
 
 from jedi import settings
 from jedi import debug
+from jedi._compatibility import FileNotFoundError
+from jedi.file_io import FileIO
 from jedi.parser_utils import get_parent_scope
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.arguments import TreeArguments
@@ -27,11 +35,16 @@ from jedi.inference.helpers import is_stdlib_path
 from jedi.inference.utils import to_list
 from jedi.inference.value import instance
 from jedi.inference.base_value import ValueSet, NO_VALUES
-from jedi.inference.references import get_module_contexts_containing_name
+from jedi.inference.references import get_module_contexts_containing_name, \
+    _PARSED_FILE_LIMIT
+from jedi.inference.imports import load_module_from_path
 from jedi.inference import recursion
 
 
 MAX_PARAM_SEARCHES = 20
+# Searching params in other modules is done for every param that is inferred,
+# therefore a lot less files are parsed than for references.
+_LIMIT_REDUCTION = 5
 
 
 def _avoid_recursions(func):
@@ -117,17 +130,8 @@ def _search_function_arguments(module_context, funcdef, string_name):
     i = 0
     inference_state = module_context.inference_state
 
-    if settings.dynamic_params_for_other_modules:
-        module_contexts = get_module_contexts_containing_name(
-            inference_state, [module_context], string_name,
-            # Limit the amounts of files to be opened massively.
-            limit_reduction=5,
-        )
-    else:
-        module_contexts = [module_context]
-
-    for for_mod_context in module_contexts:
-        for name, trailer in _get_potential_nodes(for_mod_context, string_name):
+    for for_mod_context, potential_nodes in _iter_potential_nodes(module_context, string_name):
+        for name, trailer in potential_nodes:
             i += 1
 
             # This is a simple way to stop Jedi's dynamic param recursion
@@ -160,6 +164,80 @@ def _get_lambda_name(node):
     return None
 
 
+def _iter_potential_nodes(module_context, string_name):
+    yield module_context, _get_potential_nodes(module_context, string_name)
+    if not settings.dynamic_params_for_other_modules \
+            or not module_context.inference_state.dynamic_params_for_other_modules:
+        return
+
+    call_sites = _get_indexed_call_sites(module_context, string_name)
+    if call_sites is None:
+        module_contexts = get_module_contexts_containing_name(
+            module_context.inference_state, [module_context], string_name,
+            # Limit the amounts of files to be opened massively.
+            limit_reduction=_LIMIT_REDUCTION,
+        )
+        for for_mod_context in module_contexts:
+            if for_mod_context is not module_context:
+                yield for_mod_context, _get_potential_nodes(for_mod_context, string_name)
+        return
+
+    inference_state = module_context.inference_state
+    path = module_context.py__file__()
+    folder = os.path.dirname(path)
+    parse_limit = _PARSED_FILE_LIMIT / _LIMIT_REDUCTION
+    parsed_file_count = 0
+    # Calls in the same folder are usually the most relevant ones.
+    for call_path in sorted(call_sites, key=lambda p: (os.path.dirname(p) != folder, p)):
+        if call_path == path:
+            continue
+        if parsed_file_count >= parse_limit:
+            debug.dbg('Hit limit of parsed files: %s', parse_limit)
+            break
+        parsed_file_count += 1
+        try:
+            module = load_module_from_path(inference_state, FileIO(call_path))
+        except FileNotFoundError:
+            continue
+        if module.is_compiled():
+            continue
+        for_mod_context = module.as_context()
+        yield for_mod_context, _get_nodes_at_positions(
+            for_mod_context, string_name, call_sites[call_path])
+
+
+def _get_indexed_call_sites(module_context, string_name):
+    """
+    Returns the call sites of the symbol index of the project if the module
+    is part of the project and None otherwise.
+
+    Building the index parses the whole project, which is way too slow for
+    a single inference. Therefore the index is only used if it was already
+    built, e.g. by :meth:`jedi.Project.search`.
+    """
+    from jedi.api.symbol_index import get_symbol_index
+
+    project = module_context.inference_state.project
+    path = module_context.py__file__()
+    if path is None or not path.startswith(os.path.join(project._path, '')):
+        return None
+
+    index = get_symbol_index(project._path, project._exclude_patterns)
+    if not index.is_built():
+        return None
+    index.update(module_context.inference_state.grammar)
+    return index.get_call_sites(string_name)
+
+
+def _get_nodes_at_positions(module_context, string_name, positions):
+    # The positions are only used to filter the names, because the file might
+    # have changed since it was indexed.
+    positions = set(positions)
+    for name, trailer in _get_potential_nodes(module_context, string_name):
+        if name.start_pos in positions:
+            yield name, trailer
+
+
 def _get_potential_nodes(module_value, func_string_name):
     try:
         names = module_value.tree_node.get_used_names()[func_string_name]
@@ -3,6 +3,7 @@ Filters are objects that you can use to filter names in different scopes. They
 are needed for name resolution.
 """
 from abc import abstractmethod
+from bisect import bisect_left
 import weakref
 
 from parso.tree import search_ancestor
@@ -17,6 +18,8 @@ from jedi.inference.names import TreeNameDefinition, ParamName, \
     AnonymousParamName, AbstractNameDefinition
 
 _definition_name_cache = weakref.WeakKeyDictionary()
+_scope_definition_name_cache = weakref.WeakKeyDictionary()
+_scope_name_keys_cache = weakref.WeakKeyDictionary()
 
 
 class AbstractFilter(object):
@@ -68,6 +71,57 @@ def _get_definition_names(used_names, name_key):
         return result
 
 
+def _get_name_scope(used_names, name):
+    parent = name.parent
+    if parent.type == 'trailer':
+        return None
+    base_node = parent if parent.type in ('classdef', 'funcdef') else name
+    return get_cached_parent_scope(used_names, base_node)
+
+
+def _get_scope_definition_names(used_names, name_key):
+    """
+    Returns the definitions of a name grouped by the scope they belong to, as
+    a dict of scope -> (start positions, names). The names are sorted by
+    position, so names before a position can be found with a bisect.
+    """
+    try:
+        for_module = _scope_definition_name_cache[used_names]
+    except KeyError:
+        for_module = _scope_definition_name_cache[used_names] = {}
+
+    try:
+        return for_module[name_key]
+    except KeyError:
+        by_scope = {}
+        for name in _get_definition_names(used_names, name_key):
+            scope = _get_name_scope(used_names, name)
+            if scope is not None:
+                by_scope.setdefault(scope, []).append(name)
+
+        result = for_module[name_key] = {}
+        for scope, names in by_scope.items():
+            names.sort(key=lambda name: name.start_pos)
+            result[scope] = [name.start_pos for name in names], names
+        return result
+
+
+def _get_scope_name_keys(used_names):
+    """
+    Returns a dict of scope -> the strings of all names that are defined in
+    that scope.
+    """
+    try:
+        return _scope_name_keys_cache[used_names]
+    except KeyError:
+        result = {}
+        for name_key in used_names:
+            for scope in _get_scope_definition_names(used_names, name_key):
+                result.setdefault(scope, []).append(name_key)
+        _scope_name_keys_cache[used_names] = result
+        return result
+
+
 class AbstractUsedNamesFilter(AbstractFilter):
     name_class = TreeNameDefinition
 
@@ -77,9 +131,15 @@ class AbstractUsedNamesFilter(AbstractFilter):
         self._used_names = self._module_node.get_used_names()
         self.parent_context = parent_context
 
+    def _get_name_keys(self):
+        return self._used_names
+
+    def _get_definition_names(self, name_key):
+        return _get_definition_names(self._used_names, name_key)
+
     def get(self, name, **filter_kwargs):
         return self._convert_names(self._filter(
-            _get_definition_names(self._used_names, name),
+            self._get_definition_names(name),
             **filter_kwargs
         ))
 
@@ -89,9 +149,9 @@ class AbstractUsedNamesFilter(AbstractFilter):
     def values(self, **filter_kwargs):
         return self._convert_names(
             name
-            for name_key in self._used_names
+            for name_key in self._get_name_keys()
             for name in self._filter(
-                _get_definition_names(self._used_names, name_key),
+                self._get_definition_names(name_key),
                 **filter_kwargs
             )
         )
@@ -116,20 +176,31 @@ class ParserTreeFilter(AbstractUsedNamesFilter):
         self._origin_scope = origin_scope
         self._until_position = until_position
 
+    def _get_name_keys(self):
+        return _get_scope_name_keys(self._used_names).get(self._parser_scope, ())
+
+    def _get_definition_names(self, name_key):
+        # Only the definitions in this scope are relevant. They are already
+        # sorted and limited to the ones before ``until_position``.
+        by_scope = _get_scope_definition_names(self._used_names, name_key)
+        try:
+            positions, names = by_scope[self._parser_scope]
+        except KeyError:
+            return []
+        if self._until_position is None:
+            return names
+        return names[:bisect_left(positions, self._until_position)]
+
     def _filter(self, names):
-        names = super(ParserTreeFilter, self)._filter(names)
         names = [n for n in names if self._is_name_reachable(n)]
         return list(self._check_flows(names))
 
     def _is_name_reachable(self, name):
-        parent = name.parent
-        if parent.type == 'trailer':
-            return False
-        base_node = parent if parent.type in ('classdef', 'funcdef') else name
-        return get_cached_parent_scope(self._used_names, base_node) == self._parser_scope
+        return _get_name_scope(self._used_names, name) == self._parser_scope
 
     def _check_flows(self, names):
-        for name in sorted(names, key=lambda name: name.start_pos, reverse=True):
+        # The names are sorted by position, the last definition wins.
+        for name in reversed(names):
             check = flow_analysis.reachability_check(
                 context=self._node_context,
                 value_scope=self._parser_scope,
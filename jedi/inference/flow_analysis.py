@@ -1,5 +1,5 @@
 from jedi.parser_utils import get_flow_branch_keyword, is_scope, get_parent_scope
-from jedi.inference.recursion import execution_allowed
+from jedi.inference.recursion import execution_allowed, get_refused_count
 from jedi.inference.helpers import is_big_annoying_library
 
 
@@ -84,18 +84,58 @@ def reachability_check(context, value_scope, node, origin_scope=None):
 
 
 def _break_check(context, value_scope, flow_scope, node):
-    reachable = REACHABLE
+    branch = None
     if flow_scope.type == 'if_stmt':
         if flow_scope.is_node_after_else(node):
+            branch = 'else'
+        else:
+            branch = flow_scope.get_corresponding_test_node(node)
+    if context.predefined_names:
+        # Names that are predefined for a flow change the results.
+        return _check_branch(context, value_scope, flow_scope, branch)
+    return _get_cached(
+        context.inference_state,
+        ('branch', context, value_scope, flow_scope, branch),
+        lambda: _check_branch(context, value_scope, flow_scope, branch)
+    )
+
+
+def _get_cached(inference_state, key, check):
+    """
+    All names in the same branch of a flow have the same reachability,
+    therefore the results are cached per branch and condition and not per
+    name.
+
+    A result is only kept if no recursion was refused while checking it,
+    because it would be UNSURE just because of the recursion.
+    """
+    cache = inference_state.reachability_cache
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    refused_count = get_refused_count(inference_state)
+    result = check()
+    if refused_count == get_refused_count(inference_state):
+        cache[key] = result
+    return result
+
+
+def _check_branch(context, value_scope, flow_scope, branch):
+    """
+    ``branch`` is the test node of an if branch, ``'else'`` or None.
+    """
+    reachable = REACHABLE
+    if flow_scope.type == 'if_stmt':
+        if branch == 'else':
             for check_node in flow_scope.get_test_nodes():
                 reachable = _check_if(context, check_node)
                 if reachable in (REACHABLE, UNSURE):
                     break
             reachable = reachable.invert()
-        else:
-            flow_node = flow_scope.get_corresponding_test_node(node)
-            if flow_node is not None:
-                reachable = _check_if(context, flow_node)
+        elif branch is not None:
+            reachable = _check_if(context, branch)
     elif flow_scope.type in ('try_stmt', 'while_stmt'):
         return UNSURE
 
@@ -104,8 +144,9 @@ def _break_check(context, value_scope, flow_scope, node):
         return reachable
 
     if value_scope != flow_scope and value_scope != flow_scope.parent:
-        flow_scope = get_parent_scope(flow_scope, include_flows=True)
-        return reachable & _break_check(context, value_scope, flow_scope, node)
+        # The flow is in the same branch of its parent flow as the node.
+        parent_flow_scope = get_parent_scope(flow_scope, include_flows=True)
+        return reachable & _break_check(context, value_scope, parent_flow_scope, flow_scope)
     else:
         return reachable
 
@@ -115,9 +156,19 @@ def _check_if(context, node):
         if not allowed:
             return UNSURE
 
-        types = context.infer_node(node)
-        values = set(x.py__bool__() for x in types)
-        if len(values) == 1:
-            return Status.lookup_table[values.pop()]
-        else:
-            return UNSURE
+        if context.predefined_names:
+            return _infer_condition(context, node)
+        return _get_cached(
+            context.inference_state,
+            ('condition', context, node),
+            lambda: _infer_condition(context, node)
+        )
+
+
+def _infer_condition(context, node):
+    types = context.infer_node(node)
+    values = set(x.py__bool__() for x in types)
+    if len(values) == 1:
+        return Status.lookup_table[values.pop()]
+    else:
+        return UNSURE
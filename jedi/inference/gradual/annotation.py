@@ -6,11 +6,13 @@ as annotations in future python versions.
 """
 
 import re
+import weakref
 
-from parso import ParserSyntaxError, parse
+from parso import ParserSyntaxError, load_grammar
 
 from jedi._compatibility import force_unicode, Parameter
-from jedi.inference.cache import inference_state_method_cache
+from jedi.inference.cache import inference_state_method_cache, \
+    inference_state_function_cache
 from jedi.inference.base_value import ValueSet, NO_VALUES
 from jedi.inference.gradual.base import DefineGenericBase, GenericClass
 from jedi.inference.gradual.generics import TupleGenericManager
@@ -22,6 +24,8 @@ from jedi.inference.param import get_executed_param_names
 from jedi import debug
 from jedi import parser_utils
 
+_forward_reference_cache = weakref.WeakKeyDictionary()
+
 
 def infer_annotation(context, annotation):
     """
@@ -61,6 +65,24 @@ def _infer_annotation_string(context, string, index=None):
 
 
 def _get_forward_reference_node(context, string):
+    # The node is moved to the end of the module and attached to the tree of
+    # the context. Therefore it's cached per context node and only as long as
+    # the module is not reparsed.
+    used_names = context.tree_node.get_root_node().get_used_names()
+    try:
+        for_module = _forward_reference_cache[used_names]
+    except KeyError:
+        for_module = _forward_reference_cache[used_names] = {}
+
+    key = context.inference_state.grammar, context.tree_node, string
+    try:
+        return for_module[key]
+    except KeyError:
+        result = for_module[key] = _create_forward_reference_node(context, string)
+        return result
+
+
+def _create_forward_reference_node(context, string):
     try:
         new_node = context.inference_state.grammar.parse(
             force_unicode(string),
@@ -87,7 +109,8 @@ def _split_comment_param_declaration(decl_text):
 
     """
     try:
-        node = parse(decl_text, error_recovery=False).children[0]
+        node = parser_utils.parse_snippet(
+            load_grammar(), decl_text, error_recovery=False).children[0]
     except ParserSyntaxError:
         debug.warning('Comment annotation is not valid Python: %s' % decl_text)
         return []
@@ -116,7 +139,8 @@ def infer_param(function_value, param, ignore_stars=False):
     inference_state = function_value.inference_state
     if param.star_count == 1:
         tuple_ = builtin_from_name(inference_state, 'tuple')
-        return ValueSet([GenericClass(
+        return ValueSet([GenericClass.create_cached(
+            inference_state,
             tuple_,
             TupleGenericManager((values,)),
         ) for c in values])
@@ -126,7 +150,8 @@ def infer_param(function_value, param, ignore_stars=False):
             ValueSet([builtin_from_name(inference_state, 'str')]),
             values
         )
-        return ValueSet([GenericClass(
+        return ValueSet([GenericClass.create_cached(
+            inference_state,
             dct,
             TupleGenericManager(generics),
         ) for c in values])
@@ -331,7 +356,21 @@ def _infer_type_vars(annotation_value, value_set, is_class_value=False):
 
     This functions would generate `int` for `_T` in this case, because it
     unpacks the `Iterable`.
+
+    The results are cached per annotation value and value set, because the
+    same annotations are used with the same classes over and over again. The
+    returned dicts must therefore not be modified.
     """
+    return _infer_type_vars_cached(
+        annotation_value.inference_state,
+        annotation_value,
+        value_set,
+        is_class_value,
+    )
+
+
+@inference_state_function_cache()
+def _infer_type_vars_cached(inference_state, annotation_value, value_set, is_class_value):
     type_var_dict = {}
     if isinstance(annotation_value, TypeVar):
         if not is_class_value:
@@ -193,7 +193,11 @@ class GenericClass(ClassMixin, DefineGenericBase):
             yield _LazyGenericBaseClass(self, base)
 
     def _create_instance_with_generics(self, generics_manager):
-        return GenericClass(self._class_value, generics_manager)
+        return GenericClass.create_cached(
+            self.inference_state,
+            self._class_value,
+            generics_manager
+        )
 
     def is_sub_class_of(self, class_value):
         if super(GenericClass, self).is_sub_class_of(class_value):
@@ -2,6 +2,7 @@ from jedi import debug
 from jedi.inference.base_value import ValueSet, \
     NO_VALUES
 from jedi.inference.utils import to_list
+from jedi.inference.cache import inference_state_function_cache
 from jedi.inference.gradual.stub_value import StubModuleValue
 from jedi.inference.gradual.typeshed import try_to_load_stub_cached
 from jedi.inference.value.decorator import Decoratee
@@ -51,6 +52,21 @@ def _infer_from_stub(stub_module_context, qualified_names, ignore_compiled):
     from jedi.inference.compiled.mixed import MixedObject
     stub_module = stub_module_context.get_value()
     assert isinstance(stub_module, (StubModuleValue, MixedObject)), stub_module_context
+    return _infer_qualified_names_from_stub(
+        stub_module.inference_state,
+        stub_module,
+        tuple(qualified_names),
+        ignore_compiled,
+    )
+
+
+@inference_state_function_cache()
+def _infer_qualified_names_from_stub(inference_state, stub_module, qualified_names,
+                                     ignore_compiled):
+    """
+    The Python values of a qualified name in a stub module. Results are
+    converted often, therefore this is cached per module and name.
+    """
     non_stubs = stub_module.non_stub_value_set
     if ignore_compiled:
         non_stubs = non_stubs.filter(lambda c: not c.is_compiled())
@@ -191,10 +207,8 @@ def to_stub(value):
         qualified_names = qualified_names[:-1]
         was_instance = True
 
-    stub_values = ValueSet([stub_module])
-    for name in qualified_names:
-        stub_values = stub_values.py__getattribute__(name)
-
+    stub_values = _infer_qualified_names_in_stub(
+        stub_module.inference_state, stub_module, tuple(qualified_names))
     if was_instance:
         stub_values = ValueSet.from_sets(
             c.execute_with_values()
@@ -206,3 +220,14 @@ def to_stub(value):
         # the method.
         stub_values = stub_values.py__getattribute__(method_name)
     return stub_values
+
+
+@inference_state_function_cache()
+def _infer_qualified_names_in_stub(inference_state, stub_module, qualified_names):
+    """
+    The counterpart of :func:`_infer_qualified_names_from_stub`.
+    """
+    stub_values = ValueSet([stub_module])
+    for name in qualified_names:
+        stub_values = stub_values.py__getattribute__(name)
+    return stub_values
@@ -34,12 +34,30 @@ class _AbstractGenericManager(object):
     def get_type_hint(self):
         return '[%s]' % ', '.join(t.get_type_hint(add_class_info=False) for t in self.to_tuple())
 
+    def _get_key(self):
+        raise NotImplementedError
+
+    # Generic classes are created with ``create_cached``, which uses the
+    # generics manager as a key. Equal managers therefore lead to the same
+    # generic class, e.g. for all the ``List[int]`` in a context.
+    def __eq__(self, other):
+        return type(self) == type(other) and self._get_key() == other._get_key()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._get_key())
+
 
 class LazyGenericManager(_AbstractGenericManager):
     def __init__(self, context_of_index, index_value):
         self._context_of_index = context_of_index
         self._index_value = index_value
 
+    def _get_key(self):
+        return self._context_of_index, self._index_value
+
     @memoize_method
     def __getitem__(self, index):
         return self._tuple()[index]()
@@ -85,6 +103,9 @@ class TupleGenericManager(_AbstractGenericManager):
     def __init__(self, tup):
         self._tuple = tup
 
+    def _get_key(self):
+        return self._tuple
+
     def __getitem__(self, index):
         return self._tuple[index]
 
@@ -1,9 +1,12 @@
 import os
 import re
+import threading
 from functools import wraps
 
 from jedi import settings
 from jedi.file_io import FileIO
+from jedi.file_watcher import watch
+from jedi.common.utils import register_after_fork
 from jedi._compatibility import FileNotFoundError, cast_path
 from jedi.parser_utils import get_cached_code_lines
 from jedi.inference.base_value import ValueSet, NO_VALUES
@@ -70,22 +73,44 @@ def _get_typeshed_directories(version_info):
 
 
 _version_cache = {}
+_watched_versions = set()
+_watch_lock = threading.Lock()
+
+
+def _reset_lock_after_fork():
+    global _watch_lock
+    _watch_lock = threading.Lock()
+
+
+register_after_fork(_reset_lock_after_fork)
 
 
 def _cache_stub_file_map(version_info):
     """
     Returns a map of an importable name in Python to a stub file.
     """
-    # TODO this caches the stub files indefinitely, maybe use a time cache
-    # for that?
     version = version_info[:2]
     try:
         return _version_cache[version]
     except KeyError:
         pass
 
-    _version_cache[version] = file_set = \
-        _merge_create_stub_map(_get_typeshed_directories(version_info))
+    directories = list(_get_typeshed_directories(version_info))
+    _version_cache[version] = file_set = _merge_create_stub_map(directories)
+
+    def on_change(events):
+        if any(e.type != 'modified' for e in events):
+            _version_cache.pop(version, None)
+
+    # Stub files are only added or removed if typeshed is updated, but in that
+    # case the map needs to be recreated.
+    with _watch_lock:
+        if version in _watched_versions:
+            return file_set
+        _watched_versions.add(version)
+    for directory in directories:
+        if os.path.isdir(directory):
+            watch(directory, on_change, recursive=False)
     return file_set
 
 
@@ -292,7 +317,8 @@ def create_stub_module(inference_state, python_value_set, stub_module_node, file
         string_names=import_names,
         # The code was loaded with latest_grammar, so use
         # that.
-        code_lines=get_cached_code_lines(inference_state.latest_grammar, file_io.path),
+        code_lines=get_cached_code_lines(
+            inference_state.latest_grammar, file_io.path, stub_module_node),
         is_package=file_name == '__init__.pyi',
     )
     return stub_module_value
@@ -137,7 +137,8 @@ class TypingValueWithIndex(BaseTypingValueWithGenerics):
         return ValueSet.from_sets(self._generics_manager.to_tuple())
 
     def _create_instance_with_generics(self, generics_manager):
-        return TypingValueWithIndex(
+        return TypingValueWithIndex.create_cached(
+            self.inference_state,
             self.parent_context,
             self._tree_name,
             generics_manager
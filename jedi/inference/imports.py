@@ -441,7 +441,8 @@ def _load_python_module(inference_state, file_io,
         inference_state, module_node,
         file_io=file_io,
         string_names=import_names,
-        code_lines=get_cached_code_lines(inference_state.grammar, file_io.path),
+        code_lines=get_cached_code_lines(
+            inference_state.grammar, file_io.path, module_node),
         is_package=is_package,
     )
 
@@ -3,9 +3,10 @@ Recursions are the recipe of |jedi| to conquer Python code. However, someone
 must stop recursions going mad. Some settings are here to make |jedi| stop at
 the right time. You can read more about them :ref:`here <settings-recursion>`.
 
-Next to the internal ``jedi.inference.cache`` this module also makes |jedi| not
-thread-safe, because ``execution_recursion_decorator`` uses class variables to
-count the function calls.
+The function calls are counted per inference state. Since every
+:class:`jedi.Script` has its own inference state, scripts can be used in
+different threads at the same time. A single script must not be shared by
+threads.
 
 .. _settings-recursion:
 
@@ -53,6 +54,8 @@ A function may not be executed more than this number of times recursively.
 class RecursionDetector(object):
     def __init__(self):
         self.pushed_nodes = []
+        # How often a statement was not inferred because of a recursion.
+        self.refused_count = 0
 
 
 @contextmanager
@@ -66,6 +69,7 @@ def execution_allowed(inference_state, node):
     if node in pushed_nodes:
         debug.warning('catched stmt recursion: %s @%s', node,
                       getattr(node, 'start_pos', None))
+        inference_state.recursion_detector.refused_count += 1
         yield False
     else:
         try:
@@ -82,6 +86,7 @@ def execution_recursion_decorator(default=NO_VALUES):
             limit_reached = detector.push_execution(self)
             try:
                 if limit_reached:
+                    detector.refused_count += 1
                     result = default
                 else:
                     result = func(self, **kwargs)
@@ -103,6 +108,8 @@ class ExecutionRecursionDetector(object):
         self._parent_execution_funcs = []
         self._funcdef_execution_counts = {}
         self._execution_count = 0
+        # How often an execution was refused because of one of the limits.
+        self.refused_count = 0
 
     def pop_execution(self):
         self._parent_execution_funcs.pop()
@@ -151,3 +158,13 @@ class ExecutionRecursionDetector(object):
             )
             return True
         return False
+
+
+def get_refused_count(inference_state):
+    """
+    Returns how often an inference was cut short because of a recursion or an
+    execution limit. If this number doesn't change while inferring something,
+    the result is complete and may be reused.
+    """
+    return inference_state.recursion_detector.refused_count \
+        + inference_state.execution_recursion_detector.refused_count
@@ -1,16 +1,22 @@
 import os
 import re
+import atexit
+import itertools
+import threading
 
 from parso import python_bytes_to_unicode
 
+from jedi import settings
+from jedi._compatibility import FileNotFoundError
 from jedi.debug import dbg
-from jedi.file_io import KnownContentFileIO
+from jedi.common.utils import register_after_fork, get_process_context
+from jedi.file_io import KnownContentFileIO, FileIO
+from jedi.file_walker import walk_python_files
+from jedi.inference.base_value import ValueSet
 from jedi.inference.imports import SubModuleName, load_module_from_path
 from jedi.inference.filters import ParserTreeFilter
 from jedi.inference.gradual.conversion import convert_names
 
-_IGNORE_FOLDERS = ('.tox', 'venv', '__pycache__')
-
 _OPENED_FILE_LIMIT = 2000
 """
 Stats from a 2016 Lenovo Notebook running Linux:
@@ -24,6 +30,24 @@ For now we keep the amount of parsed files really low, since parsing might take
 easily 100ms for bigger files.
 """
 
+_pool = None
+_pool_size = None
+_pool_lock = threading.Lock()
+_request_counter = itertools.count()
+_worker_environments = {}
+_worker_inference_state = [None, None]  # [request_id, inference_state]
+
+
+def _reset_pool_after_fork():
+    # The pool's workers and pipes belong to the parent.
+    global _pool, _pool_size, _pool_lock
+    _pool = None
+    _pool_size = None
+    _pool_lock = threading.Lock()
+
+
+register_after_fork(_reset_pool_after_fork)
+
 
 def _resolve_names(definition_names, avoid_names=()):
     for name in definition_names:
@@ -125,6 +149,10 @@ def find_references(module_context, tree_name):
     finally:
         inf.flow_analysis_enabled = True
 
+    if settings.reference_processes > 1 \
+            and not any(n.api_type == 'param' for n in found_names):
+        return _find_references_in_processes(module_context, found_names, search_name)
+
     found_names_dct = _dictionarize(found_names)
 
     module_contexts = set(d.get_root_context() for d in found_names)
@@ -143,24 +171,236 @@ def find_references(module_context, tree_name):
     for module_context in potential_modules:
         for name_leaf in module_context.tree_node.get_used_names().get(search_name, []):
             new = _dictionarize(_find_names(module_context, name_leaf))
-            if any(tree_name in found_names_dct for tree_name in new):
-                found_names_dct.update(new)
-                for tree_name in new:
-                    for dct in non_matching_reference_maps.get(tree_name, []):
-                        # A reference that was previously searched for matches
-                        # with a now found name. Merge.
-                        found_names_dct.update(dct)
-                    try:
-                        del non_matching_reference_maps[tree_name]
-                    except KeyError:
-                        pass
-            else:
-                for name in new:
-                    non_matching_reference_maps.setdefault(name, []).append(new)
+            _merge_reference_map(found_names_dct, non_matching_reference_maps, new)
     return found_names_dct.values()
 
 
-def _check_fs(inference_state, file_io, regex):
+def _merge_reference_map(found_names_dct, non_matching_reference_maps, new):
+    """
+    ``new`` contains all the names a single reference resolves to. It is merged
+    into ``found_names_dct`` if one of them is a known name.
+    """
+    if any(key in found_names_dct for key in new):
+        _update_names(found_names_dct, new)
+        for key in new:
+            # A reference that was previously searched for matches with a now
+            # found name. Merge.
+            for dct in non_matching_reference_maps.pop(key, []):
+                _update_names(found_names_dct, dct)
+    else:
+        for key in new:
+            non_matching_reference_maps.setdefault(key, []).append(new)
+
+
+def _update_names(found_names_dct, new):
+    for key, name in new.items():
+        # Names found by worker processes are None until they are created.
+        if name is not None or key not in found_names_dct:
+            found_names_dct[key] = name
+
+
+def _get_name_key(name):
+    """
+    Names cannot be sent between processes, but their positions can.
+    """
+    if name.tree_name is None:
+        return name
+    path = name.get_root_context().py__file__()
+    if path is None:
+        return name.tree_name
+    return path, name.tree_name.start_pos
+
+
+def _find_references_in_processes(module_context, found_names, search_name):
+    """
+    Like the part of :func:`find_references` after finding the defining
+    names, but the modules that are found in the file system are inferred by
+    ``settings.reference_processes`` worker processes. The limits on opened
+    and parsed files are multiplied by the number of processes and the files
+    that the symbol index knows to use the name are always searched.
+    """
+    inference_state = module_context.inference_state
+    found_names_dct = dict((_get_name_key(n), n) for n in found_names)
+    module_contexts = set(d.get_root_context() for d in found_names)
+    module_contexts = [module_context] + [m for m in module_contexts if m != module_context]
+
+    non_matching_reference_maps = {}
+    for m in module_contexts:
+        if m.is_compiled():
+            continue
+        for name_leaf in m.tree_node.get_used_names().get(search_name, []):
+            new = dict((_get_name_key(n), n) for n in _find_names(m, name_leaf))
+            _merge_reference_map(found_names_dct, non_matching_reference_maps, new)
+
+    if len(search_name) > 2:
+        module_paths = set(m.py__file__() for m in module_contexts)
+        paths = [
+            path for path in _get_indexed_paths(inference_state, search_name)
+            if path not in module_paths
+        ]
+        indexed_paths = set(paths)
+        file_ios = (
+            f for f in _find_python_files_in_sys_path(inference_state, module_contexts)
+            if f.path not in indexed_paths
+        )
+        # Every worker may open and parse as many files as a single process.
+        limit_reduction = 1. / settings.reference_processes
+        paths += [
+            f.path
+            for f in _iter_file_ios_containing_name(file_ios, search_name, limit_reduction)
+        ]
+        for keys in _iter_references_from_processes(module_context, paths, search_name):
+            # The names are created lazily, once they are known to be found.
+            new = dict((key, None) for key in keys)
+            _merge_reference_map(found_names_dct, non_matching_reference_maps, new)
+
+    missing_keys = [key for key, name in found_names_dct.items() if name is None]
+    for key, name in zip(missing_keys, _create_names(module_context, missing_keys)):
+        found_names_dct[key] = name
+    return [n for n in found_names_dct.values() if n is not None]
+
+
+def _get_indexed_paths(inference_state, search_name):
+    """
+    Returns the paths of the files in the project that define, import or call
+    a name, if the symbol index of the project has already been built.
+    """
+    from jedi.api.symbol_index import get_symbol_index
+
+    project = inference_state.project
+    index = get_symbol_index(project._path, project._exclude_patterns)
+    if not index.is_built():
+        return []
+    index.update(inference_state.grammar)
+    paths = set(index.get_defining_paths(search_name, all_scopes=True))
+    paths.update(index.get_call_sites(search_name))
+    return sorted(paths)
+
+
+def _create_names(module_context, keys):
+    module_contexts = {module_context.py__file__(): module_context}
+    for path, position in keys:
+        try:
+            m = module_contexts[path]
+        except KeyError:
+            try:
+                m = load_module_from_path(module_context.inference_state, FileIO(path))
+            except FileNotFoundError:
+                m = None
+            else:
+                m = m.as_context()
+            module_contexts[path] = m
+        tree_name = None if m is None else m.tree_node.get_name_of_position(position)
+        yield None if tree_name is None else m.create_name(tree_name)
+
+
+def _get_pool(processes):
+    """
+    The pool is created on the first request and lives until the process
+    exits or :data:`jedi.settings.reference_processes` changes.
+    """
+    global _pool, _pool_size
+    with _pool_lock:
+        if _pool is None or _pool_size != processes:
+            if _pool is not None:
+                _close_pool()
+            else:
+                atexit.register(_close_pool)
+            _pool = get_process_context().Pool(processes)
+            _pool_size = processes
+        return _pool
+
+
+def _close_pool():
+    global _pool, _pool_size
+    if _pool is not None:
+        _pool.terminate()
+        _pool.join()
+        _pool = None
+        _pool_size = None
+
+
+def _iter_references_from_processes(module_context, paths, search_name):
+    from jedi.api.environment import InterpreterEnvironment
+    if not paths:
+        return
+    inference_state = module_context.inference_state
+    environment = inference_state.environment
+    script_path = module_context.py__file__()
+    script_code = None
+    if script_path is not None:
+        script_code = module_context.tree_node.get_code()
+
+    request = (
+        (os.getpid(), next(_request_counter)),
+        inference_state.project,
+        None if isinstance(environment, InterpreterEnvironment) else environment.executable,
+        script_path,
+        script_code,
+    )
+    processes = settings.reference_processes
+    pool = _get_pool(processes)
+    chunksize = max(1, len(paths) // (processes * 4))
+    tasks = [(request, path, search_name) for path in paths]
+    for references in pool.imap(_find_references_in_file, tasks, chunksize):
+        for keys in references:
+            yield keys
+
+
+def _get_worker_inference_state(request_id, project, executable, script_path, script_code):
+    from jedi.inference import InferenceState
+    from jedi.api.environment import InterpreterEnvironment, create_environment
+
+    if _worker_inference_state[0] == request_id:
+        return _worker_inference_state[1]
+
+    try:
+        environment = _worker_environments[executable]
+    except KeyError:
+        if executable is None:
+            environment = InterpreterEnvironment()
+        else:
+            environment = create_environment(executable, safe=False)
+        _worker_environments[executable] = environment
+
+    inference_state = InferenceState(project, environment, script_path)
+    if script_path is not None and not script_path.endswith('.pyi'):
+        # The current file might not be saved, make sure that it is imported
+        # the same way as in the main process.
+        module = load_module_from_path(
+            inference_state,
+            KnownContentFileIO(script_path, script_code)
+        )
+        if module.string_names is not None \
+                and module.string_names[0] not in ('builtins', '__builtin__', 'typing'):
+            inference_state.module_cache.add(module.string_names, ValueSet([module]))
+    _worker_inference_state[:] = request_id, inference_state
+    return inference_state
+
+
+def _find_references_in_file(task):
+    """
+    Runs in a worker process. Returns the positions (keys) of the names all
+    usages of ``search_name`` in a file resolve to.
+    """
+    request, path, search_name = task
+    inference_state = _get_worker_inference_state(*request)
+    try:
+        module_value = load_module_from_path(inference_state, FileIO(path))
+    except FileNotFoundError:
+        return []
+    if module_value.is_compiled():
+        return []
+
+    module_context = module_value.as_context()
+    result = []
+    for name_leaf in module_context.tree_node.get_used_names().get(search_name, []):
+        keys = [_get_name_key(n) for n in _find_names(module_context, name_leaf)]
+        result.append([key for key in keys if isinstance(key, tuple)])
+    return result
+
+
+def _check_fs(file_io, regex):
     try:
         code = file_io.read()
     except FileNotFoundError:
@@ -168,60 +408,13 @@ def _check_fs(inference_state, file_io, regex):
     code = python_bytes_to_unicode(code, errors='replace')
     if not regex.search(code):
         return None
-    new_file_io = KnownContentFileIO(file_io.path, code)
-    m = load_module_from_path(inference_state, new_file_io)
-    if m.is_compiled():
-        return None
-    return m.as_context()
-
-
-def gitignored_lines(folder_io, file_io):
-    ignored_paths = set()
-    ignored_names = set()
-    for l in file_io.read().splitlines():
-        if not l or l.startswith(b'#'):
-            continue
-
-        p = l.decode('utf-8', 'ignore')
-        if p.startswith('/'):
-            name = p[1:]
-            if name.endswith(os.path.sep):
-                name = name[:-1]
-            ignored_paths.add(os.path.join(folder_io.path, name))
-        else:
-            ignored_names.add(p)
-    return ignored_paths, ignored_names
-
-
-def recurse_find_python_folders_and_files(folder_io, except_paths=()):
-    except_paths = set(except_paths)
-    for root_folder_io, folder_ios, file_ios in folder_io.walk():
-        # Delete folders that we don't want to iterate over.
-        for file_io in file_ios:
-            path = file_io.path
-            if path.endswith('.py') or path.endswith('.pyi'):
-                if path not in except_paths:
-                    yield None, file_io
-
-            if path.endswith('.gitignore'):
-                ignored_paths, ignored_names = \
-                    gitignored_lines(root_folder_io, file_io)
-                except_paths |= ignored_paths
-
-        folder_ios[:] = [
-            folder_io
-            for folder_io in folder_ios
-            if folder_io.path not in except_paths
-            and folder_io.get_base_name() not in _IGNORE_FOLDERS
-        ]
-        for folder_io in folder_ios:
-            yield folder_io, None
+    return KnownContentFileIO(file_io.path, code)
 
 
 def recurse_find_python_files(folder_io, except_paths=()):
-    for folder_io, file_io in recurse_find_python_folders_and_files(folder_io, except_paths):
-        if file_io is not None:
-            yield file_io
+    for entry in walk_python_files(folder_io.path, except_paths=except_paths):
+        if not entry.is_dir():
+            yield FileIO(entry.path)
 
 
 def _find_python_files_in_sys_path(inference_state, module_contexts):
@@ -270,7 +463,7 @@ def get_module_contexts_containing_name(inference_state, module_contexts, name,
         yield x  # Python 2...
 
 
-def search_in_file_ios(inference_state, file_io_iterator, name, limit_reduction=1):
+def _iter_file_ios_containing_name(file_io_iterator, name, limit_reduction=1):
     parse_limit = _PARSED_FILE_LIMIT / limit_reduction
     open_limit = _OPENED_FILE_LIMIT / limit_reduction
     file_io_count = 0
@@ -278,10 +471,10 @@ def search_in_file_ios(inference_state, file_io_iterator, name, limit_reduction=
     regex = re.compile(r'\b' + re.escape(name) + r'\b')
     for file_io in file_io_iterator:
         file_io_count += 1
-        m = _check_fs(inference_state, file_io, regex)
-        if m is not None:
+        new_file_io = _check_fs(file_io, regex)
+        if new_file_io is not None:
             parsed_file_count += 1
-            yield m
+            yield new_file_io
             if parsed_file_count >= parse_limit:
                 dbg('Hit limit of parsed files: %s', parse_limit)
                 break
@@ -289,3 +482,10 @@ def search_in_file_ios(inference_state, file_io_iterator, name, limit_reduction=
         if file_io_count >= open_limit:
             dbg('Hit limit of opened files: %s', open_limit)
             break
+
+
+def search_in_file_ios(inference_state, file_io_iterator, name, limit_reduction=1):
+    for file_io in _iter_file_ios_containing_name(file_io_iterator, name, limit_reduction):
+        m = load_module_from_path(inference_state, file_io)
+        if not m.is_compiled():
+            yield m.as_context()
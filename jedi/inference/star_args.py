@@ -11,43 +11,77 @@ This means for example in this case::
 The signature here for bar should be `bar(b, c)` instead of bar(*args).
 """
 
+import weakref
+
+from parso.python.tree import search_ancestor
+
 from jedi._compatibility import Parameter
 from jedi.inference.utils import to_list
 from jedi.inference.names import ParamNameWrapper
 from jedi.inference.helpers import is_big_annoying_library
+from jedi.inference.cache import inference_state_function_cache
 
+_star_argument_cache = weakref.WeakKeyDictionary()
 
-def _iter_nodes_for_param(param_name):
-    from parso.python.tree import search_ancestor
-    from jedi.inference.arguments import TreeArguments
 
-    execution_context = param_name.parent_context
-    function_node = execution_context.tree_node
-    module_node = function_node.get_root_node()
+def _get_star_arguments(function_node, string_name, star_count):
+    """
+    Returns the names and trailers of the ``*name`` (or ``**name``) arguments
+    of calls within a function. This only depends on the syntax tree, so it's
+    cached until the module is parsed again.
+    """
+    used_names = function_node.get_root_node().get_used_names()
+    try:
+        by_function = _star_argument_cache[used_names]
+    except KeyError:
+        by_function = _star_argument_cache[used_names] = {}
+
+    key = function_node, string_name, star_count
+    try:
+        return by_function[key]
+    except KeyError:
+        pass
+
+    result = []
     start = function_node.children[-1].start_pos
     end = function_node.children[-1].end_pos
-    for name in module_node.get_used_names().get(param_name.string_name):
+    for name in used_names.get(string_name, []):
         if start <= name.start_pos < end:
             # Is used in the function
             argument = name.parent
             if argument.type == 'argument' \
-                    and argument.children[0] == '*' * param_name.star_count:
+                    and argument.children[0] == '*' * star_count:
                 # No support for Python 2.7 here, but they are end-of-life
                 # anyway
                 trailer = search_ancestor(argument, 'trailer')
                 if trailer is not None:  # Make sure we're in a function
-                    context = execution_context.create_context(trailer)
-                    if _goes_to_param_name(param_name, context, name):
-                        values = _to_callables(context, trailer)
+                    result.append((name, trailer))
+    by_function[key] = result
+    return result
 
-                        args = TreeArguments.create_cached(
-                            execution_context.inference_state,
-                            context=context,
-                            argument_node=trailer.children[1],
-                            trailer=trailer,
-                        )
-                        for c in values:
-                            yield c, args
+
+def _iter_nodes_for_param(param_name):
+    from jedi.inference.arguments import TreeArguments
+
+    execution_context = param_name.parent_context
+    star_arguments = _get_star_arguments(
+        execution_context.tree_node,
+        param_name.string_name,
+        param_name.star_count,
+    )
+    for name, trailer in star_arguments:
+        context = execution_context.create_context(trailer)
+        if _goes_to_param_name(param_name, context, name):
+            values = _to_callables(context, trailer)
+
+            args = TreeArguments.create_cached(
+                execution_context.inference_state,
+                context=context,
+                argument_node=trailer.children[1],
+                trailer=trailer,
+            )
+            for c in values:
+                yield c, args
 
 
 def _goes_to_param_name(param_name, context, potential_name):
@@ -92,6 +126,25 @@ def _remove_given_params(arguments, param_names):
         yield p
 
 
+@inference_state_function_cache(default=())
+def _process_forwarded_params(inference_state, func, arguments, star_count):
+    """
+    Returns the resolved parameters for every signature of a function that
+    ``*args`` or ``**kwargs`` are forwarded to. Many signatures forward to
+    the same functions, so this is only done once.
+    """
+    return [
+        process_params(
+            list(_remove_given_params(
+                arguments,
+                signature.get_param_names(resolve_stars=False)
+            )),
+            star_count
+        )
+        for signature in func.get_signatures()
+    ]
+
+
 @to_list
 def process_params(param_names, star_count=3):  # default means both * and **
     if param_names:
@@ -148,16 +201,13 @@ def process_params(param_names, star_count=3):  # default means both * and **
         else:
             new_star_count = 1
 
-        for signature in func.get_signatures():
+        for params in _process_forwarded_params(
+                func.inference_state, func, arguments, new_star_count):
             found_arg_signature = True
             if new_star_count == 3:
                 found_kwarg_signature = True
             args_for_this_func = []
-            for p in process_params(
-                    list(_remove_given_params(
-                        arguments,
-                        signature.get_param_names(resolve_stars=False)
-                    )), new_star_count):
+            for p in params:
                 if p.get_kind() == Parameter.VAR_KEYWORD:
                     kwarg_names.append(p)
                 elif p.get_kind() == Parameter.VAR_POSITIONAL:
@@ -184,13 +234,10 @@ def process_params(param_names, star_count=3):  # default means both * and **
 
     # Then process **kwargs
     for func, arguments in kwarg_callables:
-        for signature in func.get_signatures():
+        for params in _process_forwarded_params(
+                func.inference_state, func, arguments, 2):
             found_kwarg_signature = True
-            for p in process_params(
-                    list(_remove_given_params(
-                        arguments,
-                        signature.get_param_names(resolve_stars=False)
-                    )), star_count=2):
+            for p in params:
                 if p.get_kind() == Parameter.VAR_KEYWORD:
                     kwarg_names.append(p)
                 elif p.get_kind() == Parameter.KEYWORD_ONLY:
@@ -28,7 +28,7 @@ from jedi.inference.gradual.stub_value import VersionInfo
 from jedi.inference.gradual import annotation
 from jedi.inference.names import TreeNameDefinition
 from jedi.inference.context import CompForContext
-from jedi.inference.value.decorator import Decoratee
+from jedi.inference.value.decorator import Decoratee, get_transfer_summary
 from jedi.plugins import plugin_manager
 
 
@@ -767,6 +767,10 @@ def _apply_decorators(context, node):
                     debug.warning('decorator not found: %s on %s', dec, node)
                 return initial
 
+            if _passes_through(dec_values, node):
+                debug.dbg('decorator passes through: %s', dec_values)
+                continue
+
             values = dec_values.execute(arguments.ValuesArguments([values]))
             if not len(values):
                 debug.warning('not possible to resolve wrappers found %s', node)
@@ -778,6 +782,20 @@ def _apply_decorators(context, node):
     return values
 
 
+def _passes_through(decorator_values, node):
+    """
+    Decorators that return the decorated value or a wrapper that just forwards
+    all calls to it don't need to be executed.
+    """
+    for value in decorator_values:
+        if not isinstance(value, FunctionValue) or value.tree_node.type != 'funcdef':
+            return False
+        summary = get_transfer_summary(value.inference_state, value.tree_node)
+        if summary != 'identity' and (summary != 'forward' or node.type == 'classdef'):
+            return False
+    return True
+
+
 def check_tuple_assignments(name, value_set):
     """
     Checks if tuples are assigned.
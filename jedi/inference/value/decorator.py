@@ -2,8 +2,10 @@
 Decorators are not really values, however we need some wrappers to improve
 docstrings and other things around decorators.
 '''
+import re
 
 from jedi.inference.base_value import ValueWrapper
+from jedi.inference.cache import inference_state_function_cache
 
 
 class Decoratee(ValueWrapper):
@@ -13,3 +15,77 @@ class Decoratee(ValueWrapper):
 
     def py__doc__(self):
         return self._original_value.py__doc__()
+
+
+def _iter_names(node):
+    for child in node.children:
+        if child.type == 'name':
+            yield child
+        elif hasattr(child, 'children'):
+            for name in _iter_names(child):
+                yield name
+
+
+def _count_definitions(scope, string_name):
+    return sum(
+        1 for name in _iter_names(scope.children[-1])
+        if name.value == string_name and name.is_definition()
+    )
+
+
+def _get_returned_code(funcdef):
+    if funcdef.parent.type in ('async_funcdef', 'async_stmt') \
+            or funcdef.is_generator():
+        return None
+    return_stmts = list(funcdef.iter_return_stmts())
+    if len(return_stmts) != 1 or len(return_stmts[0].children) != 2:
+        return None
+    return re.sub(r'\s', '', return_stmts[0].children[1].get_code(include_prefix=False))
+
+
+def _is_forwarding_wrapper(wrapper, func_name):
+    """
+    Checks for the usual ``def wrapper(*args, **kwargs)`` that just returns
+    ``func(*args, **kwargs)``, optionally decorated with ``wraps(func)``.
+    """
+    for decorator in wrapper.get_decorators():
+        code = re.sub(r'\s', '', decorator.get_code(include_prefix=False))
+        if code not in ('@wraps(%s)' % func_name, '@functools.wraps(%s)' % func_name):
+            return False
+
+    params = wrapper.get_params()
+    if [p.star_count for p in params] != [1, 2]:
+        return False
+    args, kwargs = [p.name.value for p in params]
+    if _get_returned_code(wrapper) != '%s(*%s,**%s)' % (func_name, args, kwargs):
+        return False
+    return not any(_count_definitions(wrapper, n) for n in (func_name, args, kwargs))
+
+
+@inference_state_function_cache()
+def get_transfer_summary(inference_state, funcdef):
+    """
+    Summarizes what a decorator function does with the decorated value,
+    without executing it. This is done once per decorator definition.
+
+    Returns ``'identity'`` if the decorated value is returned as it is,
+    ``'forward'`` if a wrapper is returned that just forwards the call to it
+    and None for all other decorators, which need to be executed.
+    """
+    params = funcdef.get_params()
+    if len(params) != 1 or params[0].star_count:
+        return None
+    func_name = params[0].name.value
+    if _count_definitions(funcdef, func_name):
+        return None
+
+    returned = _get_returned_code(funcdef)
+    if returned == func_name:
+        return 'identity'
+
+    for wrapper in funcdef.iter_funcdefs():
+        if wrapper.name.value == returned \
+                and _count_definitions(funcdef, returned) == 1 \
+                and _is_forwarding_wrapper(wrapper, func_name):
+            return 'forward'
+    return None
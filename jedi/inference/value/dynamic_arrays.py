@@ -12,13 +12,17 @@ content will be added
 This can be really cpu intensive, as you can imagine. Because |jedi| has to
 follow **every** ``append`` and check whether it's the right array. However this
 works pretty good, because in *slow* cases, the recursion detector and other
-settings will stop this process.
+settings will stop this process. The calls like ``arr.append(...)`` of a
+module are only collected once per parsed module.
 
 It is important to note that:
 
 1. Array modfications work only in the current module.
 2. Jedi only checks Array additions; ``list.pop``, etc are ignored.
 """
+import weakref
+from bisect import bisect_left, bisect_right
+
 from jedi import debug
 from jedi import settings
 from jedi.inference import recursion
@@ -29,6 +33,7 @@ from jedi.inference.helpers import infer_call_of_leaf
 from jedi.inference.cache import inference_state_method_cache
 
 _sentinel = object()
+_mutation_cache = weakref.WeakKeyDictionary()
 
 
 def check_array_additions(context, sequence):
@@ -70,39 +75,24 @@ def _internal_check_array_additions(context, sequence):
                 result |= set(lazy_value.infer().iterate())
         return result
 
-    temp_param_add, settings.dynamic_params_for_other_modules = \
-        settings.dynamic_params_for_other_modules, False
+    # Don't search for params in other modules while searching for additions.
+    # This is not done with the setting, because other threads use it as well.
+    inference_state = context.inference_state
+    temp_param_add, inference_state.dynamic_params_for_other_modules = \
+        inference_state.dynamic_params_for_other_modules, False
 
     is_list = sequence.name.string_name == 'list'
     search_names = (['append', 'extend', 'insert'] if is_list else ['add', 'update'])
 
     added_types = set()
-    for add_name in search_names:
-        try:
-            possible_names = module_context.tree_node.get_used_names()[add_name]
-        except KeyError:
-            continue
-        else:
-            for name in possible_names:
-                value_node = context.tree_node
-                if not (value_node.start_pos < name.start_pos < value_node.end_pos):
-                    continue
-                trailer = name.parent
-                power = trailer.parent
-                trailer_pos = power.children.index(trailer)
-                try:
-                    execution_trailer = power.children[trailer_pos + 1]
-                except IndexError:
-                    continue
-                else:
-                    if execution_trailer.type != 'trailer' \
-                            or execution_trailer.children[0] != '(' \
-                            or execution_trailer.children[1] == ')':
-                        continue
-
+    value_node = context.tree_node
+    try:
+        for add_name in search_names:
+            for name, power, execution_trailer in _get_mutations_in_node(
+                    module_context.tree_node, add_name, value_node):
                 random_context = context.create_context(name)
 
-                with recursion.execution_allowed(context.inference_state, power) as allowed:
+                with recursion.execution_allowed(inference_state, power) as allowed:
                     if allowed:
                         found = infer_call_of_leaf(
                             random_context,
@@ -116,13 +106,58 @@ def _internal_check_array_additions(context, sequence):
                                 execution_trailer.children[1],
                                 add_name
                             )
-
-    # reset settings
-    settings.dynamic_params_for_other_modules = temp_param_add
+    finally:
+        inference_state.dynamic_params_for_other_modules = temp_param_add
     debug.dbg('Dynamic array result %s', added_types, color='MAGENTA')
     return added_types
 
 
+def _create_mutations(used_names, add_name):
+    positions = []
+    mutations = []
+    for name in used_names.get(add_name, ()):
+        trailer = name.parent
+        if trailer.type != 'trailer' or trailer.children[0] != '.':
+            continue
+        power = trailer.parent
+        trailer_pos = power.children.index(trailer)
+        try:
+            execution_trailer = power.children[trailer_pos + 1]
+        except IndexError:
+            continue
+        if execution_trailer.type != 'trailer' \
+                or execution_trailer.children[0] != '(' \
+                or execution_trailer.children[1] == ')':
+            continue
+        positions.append(name.start_pos)
+        mutations.append((name, power, execution_trailer))
+    return positions, mutations
+
+
+def _get_mutations_in_node(module_node, add_name, node):
+    """
+    Returns the calls like ``foo.append(x)`` within a node as a list of
+    ``(name, power, execution_trailer)``. The calls of a module are collected
+    once per parsed module (the cache is invalidated together with the used
+    names of the module) and then looked up by position.
+    """
+    used_names = module_node.get_used_names()
+    try:
+        for_module = _mutation_cache[used_names]
+    except KeyError:
+        for_module = _mutation_cache[used_names] = {}
+
+    try:
+        positions, mutations = for_module[add_name]
+    except KeyError:
+        positions, mutations = for_module[add_name] = \
+            _create_mutations(used_names, add_name)
+
+    start = bisect_right(positions, node.start_pos)
+    end = bisect_left(positions, node.end_pos, start)
+    return mutations[start:end]
+
+
 def get_dynamic_array_instance(instance, arguments):
     """Used for set() and list() instances."""
     ai = _DynamicArrayAdditions(instance, arguments)
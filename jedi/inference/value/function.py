@@ -2,7 +2,8 @@ from parso.python import tree
 
 from jedi._compatibility import use_metaclass
 from jedi import debug
-from jedi.inference.cache import inference_state_method_cache, CachedMetaClass
+from jedi.inference.cache import inference_state_method_cache, CachedMetaClass, \
+    inference_state_function_cache
 from jedi.inference import compiled
 from jedi.inference import recursion
 from jedi.inference import docstrings
@@ -114,8 +115,12 @@ class FunctionMixin(object):
         return body + ' -> ' + return_hint
 
     def py__call__(self, arguments):
-        function_execution = self.as_context(arguments)
-        return function_execution.infer()
+        return infer_function_summary(
+            self.inference_state,
+            self,
+            arguments,
+            lambda: self.as_context(arguments).infer(),
+        )
 
     def _as_context(self, arguments=None):
         if arguments is None:
@@ -126,6 +131,35 @@ class FunctionMixin(object):
         return [TreeSignature(f) for f in self.get_signature_functions()]
 
 
+def infer_function_summary(inference_state, function_key, arguments, infer):
+    """
+    Executions of the same function with arguments that infer to the same
+    values have the same results. These results (summaries) are therefore
+    shared between all call sites.
+
+    A result is only kept if no recursion or execution limit was hit while
+    inferring it, because it might be incomplete otherwise.
+    """
+    if inference_state.is_analysis:
+        # The issues are reported per call site.
+        return infer()
+
+    key = function_key, tuple(
+        (key, lazy_value.infer()) for key, lazy_value in arguments.unpack()
+    )
+    cache = inference_state.function_summary_cache
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    refused_count = recursion.get_refused_count(inference_state)
+    result = infer()
+    if refused_count == recursion.get_refused_count(inference_state):
+        cache[key] = result
+    return result
+
+
 class FunctionValue(use_metaclass(CachedMetaClass, FunctionMixin, FunctionAndClassBase)):
     @classmethod
     def from_context(cls, context, tree_node):
@@ -340,7 +374,7 @@ class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
                 generics = (yield_values.py__class__(), NO_VALUES)
                 return ValueSet(
                     # In Python 3.6 AsyncGenerator is still a class.
-                    GenericClass(c, TupleGenericManager(generics))
+                    GenericClass.create_cached(inference_state, c, TupleGenericManager(generics))
                     for c in async_generator_classes
                 ).execute_annotation()
             else:
@@ -351,7 +385,8 @@ class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
                 # Only the first generic is relevant.
                 generics = (return_values.py__class__(), NO_VALUES, NO_VALUES)
                 return ValueSet(
-                    GenericClass(c, TupleGenericManager(generics)) for c in async_classes
+                    GenericClass.create_cached(inference_state, c, TupleGenericManager(generics))
+                    for c in async_classes
                 ).execute_annotation()
         else:
             if self.is_generator():
@@ -408,17 +443,56 @@ class OverloadedFunctionValue(FunctionMixin, ValueWrapper):
 
     def py__call__(self, arguments):
         debug.dbg("Execute overloaded function %s", self._wrapped_value, color='BLUE')
-        function_executions = []
-        for signature in self.get_signatures():
-            function_execution = signature.value.as_context(arguments)
-            function_executions.append(function_execution)
-            if signature.matches_signature(arguments):
-                return function_execution.infer()
-
+        signatures = self.get_signatures()
+        if self.inference_state.is_analysis:
+            # All the signatures are checked, because that reports issues.
+            index = self._find_matching_signature(signatures, arguments)
+        else:
+            unpacked = list(arguments.unpack())
+            # Matching only depends on the classes of the arguments and on
+            # whether missing arguments are reported, therefore the result is
+            # cached for them.
+            cache_key = (
+                tuple(self._overloaded_functions),
+                tuple((key, lazy_value.infer().py__class__())
+                      for key, lazy_value in unpacked),
+                bool(arguments.get_calling_nodes()),
+            )
+            cache = self.inference_state.overload_match_cache
+            try:
+                index = cache[cache_key]
+            except KeyError:
+                index = cache[cache_key] = self._find_matching_signature(
+                    signatures, arguments, unpacked)
+
+        if index is not None:
+            return signatures[index].value.as_context(arguments).infer()
         if self.inference_state.is_analysis:
             # In this case we want precision.
             return NO_VALUES
-        return ValueSet.from_sets(fe.infer() for fe in function_executions)
+        return ValueSet.from_sets(
+            signature.value.as_context(arguments).infer()
+            for signature in signatures
+        )
+
+    def _find_matching_signature(self, signatures, arguments, unpacked=None):
+        arities = [(None, None)] * len(signatures)
+        if unpacked is not None:
+            positional_count = sum(1 for key, _ in unpacked if key is None)
+            keys = set(key for key, _ in unpacked if key is not None)
+            arities = _get_overload_arities(
+                self.inference_state,
+                tuple(s.value.tree_node for s in signatures)
+            )
+        for i, (signature, (max_positional, keywords)) in enumerate(zip(signatures, arities)):
+            # Checking the arity first is cheap, matching needs inference.
+            if max_positional is not None and positional_count > max_positional:
+                continue
+            if keywords is not None and not keys <= keywords:
+                continue
+            if signature.matches_signature(arguments):
+                return i
+        return None
 
     def get_signature_functions(self):
         return self._overloaded_functions
@@ -427,6 +501,28 @@ class OverloadedFunctionValue(FunctionMixin, ValueWrapper):
         return 'Union[%s]' % ', '.join(f.get_type_hint() for f in self._overloaded_functions)
 
 
+@inference_state_function_cache()
+def _get_overload_arities(inference_state, funcdefs):
+    """
+    Returns the maximum number of positional arguments (None if there's a
+    ``*args``) and the names of the keyword arguments (None if there's a
+    ``**kwargs``) of every overload. Calls that don't fit are never matched,
+    because there would be an issue with the arguments.
+    """
+    result = []
+    for funcdef in funcdefs:
+        params = funcdef.get_params()
+        star_counts = [p.star_count for p in params]
+        max_positional = None
+        if 1 not in star_counts:
+            max_positional = star_counts.count(0)
+        keywords = None
+        if 2 not in star_counts:
+            keywords = frozenset(p.name.value for p in params)
+        result.append((max_positional, keywords))
+    return result
+
+
 def _find_overload_functions(context, tree_node):
     def _is_overload_decorated(funcdef):
         if funcdef.parent.type == 'decorated':
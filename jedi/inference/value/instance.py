@@ -1,4 +1,5 @@
 from abc import abstractproperty
+import weakref
 
 from parso.python.tree import search_ancestor
 
@@ -17,11 +18,14 @@ from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.arguments import ValuesArguments, TreeArgumentsWrapper
 from jedi.inference.value.function import \
     FunctionValue, FunctionMixin, OverloadedFunctionValue, \
-    BaseFunctionExecutionContext, FunctionExecutionContext, FunctionNameInClass
+    BaseFunctionExecutionContext, FunctionExecutionContext, FunctionNameInClass, \
+    infer_function_summary
 from jedi.inference.value.klass import ClassFilter
 from jedi.inference.value.dynamic_arrays import get_dynamic_array_instance
 from jedi.parser_utils import function_is_staticmethod, function_is_classmethod
 
+_self_attribute_cache = weakref.WeakKeyDictionary()
+
 
 class InstanceExecutedParamName(ParamName):
     def __init__(self, instance, function_value, tree_name):
@@ -477,8 +481,14 @@ class BoundMethod(FunctionMixin, ValueWrapper):
         if isinstance(self._wrapped_value, OverloadedFunctionValue):
             return self._wrapped_value.py__call__(self._get_arguments(arguments))
 
-        function_execution = self.as_context(arguments)
-        return function_execution.infer()
+        # Bound methods are created on every access, the function and the
+        # class are not. The instance is part of the arguments.
+        return infer_function_summary(
+            self.inference_state,
+            (self._wrapped_value, self._class_context),
+            self._get_arguments(arguments),
+            lambda: self.as_context(arguments).infer(),
+        )
 
     def get_signature_functions(self):
         return [
@@ -575,22 +585,19 @@ class SelfAttributeFilter(ClassFilter):
         )
         self._instance = instance
 
-    def _filter(self, names):
-        start, end = self._parser_scope.start_pos, self._parser_scope.end_pos
-        names = [n for n in names if start < n.start_pos < end]
-        return self._filter_self_names(names)
+    def _get_name_keys(self):
+        return _get_self_attribute_names(self._used_names, self._parser_scope)
+
+    def _get_definition_names(self, name_key):
+        return _get_self_attribute_names(self._used_names, self._parser_scope).get(name_key, ())
 
-    def _filter_self_names(self, names):
+    def _filter(self, names):
         for name in names:
-            trailer = name.parent
-            if trailer.type == 'trailer' \
-                    and len(trailer.parent.children) == 2 \
-                    and trailer.children[0] == '.':
-                if name.is_definition() and self._access_possible(name):
-                    # TODO filter non-self assignments instead of this bad
-                    #      filter.
-                    if self._is_in_right_scope(trailer.parent.children[0], name):
-                        yield name
+            if self._access_possible(name):
+                # TODO filter non-self assignments instead of this bad
+                #      filter.
+                if self._is_in_right_scope(name.parent.parent.children[0], name):
+                    yield name
 
     def _is_in_right_scope(self, self_name, name):
         self_context = self._node_context.create_context(self_name)
@@ -609,6 +616,57 @@ class SelfAttributeFilter(ClassFilter):
         return names
 
 
+def _is_first_param(name):
+    """
+    Checks if there is a function around the name that has a first param with
+    the same name. Otherwise it cannot be ``self``.
+    """
+    if name.type != 'name':
+        return False
+    funcdef = search_ancestor(name, 'funcdef')
+    while funcdef is not None:
+        params = funcdef.get_params()
+        if params and params[0].name.value == name.value:
+            return True
+        funcdef = search_ancestor(funcdef, 'funcdef')
+    return False
+
+
+def _get_self_attribute_names(used_names, class_node):
+    """
+    Returns a dict of attribute name -> names of all assignments like
+    ``self.attribute = 1`` within a class, sorted by position. These are the
+    candidates for instance attributes. Which of them are assignments to
+    ``self`` is checked by :class:`SelfAttributeFilter`.
+
+    The attributes of all classes in a module are indexed at once.
+    """
+    try:
+        by_class = _self_attribute_cache[used_names]
+    except KeyError:
+        by_class = {}
+        for names in used_names.values():
+            for name in names:
+                trailer = name.parent
+                if trailer.type != 'trailer' \
+                        or len(trailer.parent.children) != 2 \
+                        or trailer.children[0] != '.' \
+                        or not name.is_definition() \
+                        or not _is_first_param(trailer.parent.children[0]):
+                    continue
+                classdef = search_ancestor(name, 'classdef')
+                while classdef is not None:
+                    by_class.setdefault(classdef, {}) \
+                        .setdefault(name.value, []).append(name)
+                    classdef = search_ancestor(classdef, 'classdef')
+
+        for attributes in by_class.values():
+            for names in attributes.values():
+                names.sort(key=lambda name: name.start_pos)
+        _self_attribute_cache[used_names] = by_class
+    return by_class.get(class_node, {})
+
+
 class InstanceArguments(TreeArgumentsWrapper):
     def __init__(self, instance, arguments):
         super(InstanceArguments, self).__init__(arguments)
@@ -3,8 +3,10 @@ Contains all classes and functions to deal with lists, dicts, generators and
 iterators in general.
 """
 import sys
+import weakref
 
-from jedi._compatibility import force_unicode, is_py3
+from jedi._compatibility import force_unicode, is_py3, unicode
+from jedi import debug
 from jedi.inference import compiled
 from jedi.inference import analysis
 from jedi.inference.lazy_value import LazyKnownValue, LazyKnownValues, \
@@ -14,10 +16,10 @@ from jedi.inference.helpers import get_int_or_none, is_string, \
 from jedi.inference.utils import safe_property, to_list
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.filters import LazyAttributeOverwrite, publish_method
-from jedi.inference.base_value import ValueSet, Value, NO_VALUES, \
+from jedi.inference.base_value import ValueSet, Value, \
     ContextualizedNode, iterate_values, sentinel, \
     LazyValueWrapper
-from jedi.parser_utils import get_sync_comp_fors
+from jedi.parser_utils import get_sync_comp_fors, safe_literal_eval
 from jedi.inference.context import CompForContext
 from jedi.inference.value.dynamic_arrays import check_array_additions
 
@@ -196,7 +198,8 @@ class Sequence(LazyAttributeOverwrite, IterableMixin):
         from jedi.inference.gradual.base import GenericClass
         from jedi.inference.gradual.generics import TupleGenericManager
         klass = compiled.builtin_from_name(self.inference_state, self.array_type)
-        c, = GenericClass(
+        c, = GenericClass.create_cached(
+            self.inference_state,
             klass,
             TupleGenericManager(self._get_generics())
         ).execute_annotation()
@@ -311,6 +314,68 @@ class DictComprehension(ComprehensionMixin, Sequence, _DictKeyMixin):
         return []
 
 
+_literal_key_index_cache = weakref.WeakKeyDictionary()
+
+# Literals with more entries than this are summarized instead of inferring
+# every single entry, see `_summarize_entries`.
+_SUMMARIZE_THRESHOLD = 100
+# The number of entries of a summarized literal that are inferred, if they
+# are not simple literals like numbers or strings.
+_SUMMARY_SAMPLE_SIZE = 50
+
+
+def _get_literal_kind(node):
+    """
+    Returns a key that is the same for all simple literals (numbers, strings,
+    keywords) with the same type or None for other nodes.
+    """
+    if node.type == 'number':
+        value = node.value.lower()
+        if value.endswith('j'):
+            return 'complex'
+        if not value.startswith(('0x', '0o', '0b')) and ('.' in value or 'e' in value):
+            return 'float'
+        return 'int'
+    if node.type == 'string':
+        prefix = node.string_prefix.lower()
+        if 'f' in prefix:
+            return None
+        return 'string' + prefix.replace('r', '')
+    if node.type == 'keyword' and node.value in ('None', 'True', 'False'):
+        return node.value
+    return None
+
+
+def _summarize_entries(context, nodes):
+    """
+    Infers the merged values of the entries of a big literal. Simple literals
+    have the same type per kind and are only inferred once per kind. All
+    other entries are sampled.
+    """
+    literal_nodes = {}
+    other_nodes = []
+    for node in nodes:
+        kind = _get_literal_kind(node)
+        if kind is None:
+            other_nodes.append(node)
+        else:
+            literal_nodes.setdefault(kind, node)
+
+    if len(other_nodes) > _SUMMARY_SAMPLE_SIZE:
+        debug.warning(
+            'Literal summary limit (%s) reached, inferred only some of the %s entries',
+            _SUMMARY_SAMPLE_SIZE,
+            len(other_nodes),
+        )
+        step = len(other_nodes) / float(_SUMMARY_SAMPLE_SIZE)
+        other_nodes = [other_nodes[int(i * step)] for i in range(_SUMMARY_SAMPLE_SIZE)]
+
+    return ValueSet.from_sets(
+        context.infer_node(node)
+        for node in list(literal_nodes.values()) + other_nodes
+    )
+
+
 class SequenceLiteralValue(Sequence):
     _TUPLE_LIKE = 'testlist_star_expr', 'testlist', 'subscriptlist'
     mapping = {'(': u'tuple',
@@ -342,7 +407,15 @@ class SequenceLiteralValue(Sequence):
         While values returns the possible values for any array field, this
         function returns the value for a certain index.
         """
-        for node in self.get_tree_entries():
+        entries = self.get_tree_entries()
+        if self._is_summarized(entries):
+            # Every entry gets the merged values of all entries.
+            lazy_value = LazyKnownValues(self._summarize())
+            for _ in entries:
+                yield lazy_value
+            entries = []
+
+        for node in entries:
             if node == ':' or node.type == 'subscript':
                 # TODO this should probably use at least part of the code
                 #      of infer_subscript_list.
@@ -356,6 +429,13 @@ class SequenceLiteralValue(Sequence):
         # This function is not really used often. It's more of a try.
         return len(self.get_tree_entries())
 
+    def _is_summarized(self, entries):
+        return len(entries) > _SUMMARIZE_THRESHOLD and self.atom.type == 'atom'
+
+    @inference_state_method_cache()
+    def _summarize(self):
+        return _summarize_entries(self._defining_context, self.get_tree_entries())
+
     def get_tree_entries(self):
         c = self.atom.children
 
@@ -425,8 +505,21 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
 
     def py__simple_getitem__(self, index):
         """Here the index is an int/str. Raises IndexError/KeyError."""
+        entries = self.get_tree_entries()
+        if self._is_summarized(entries) and not isinstance(index, slice):
+            # The keys of big dicts are usually literals, those are looked up
+            # without inferring them. Other keys might match as well, in that
+            # case all keys are checked in order.
+            _, key_index = self._get_literal_key_index()
+            if key_index is not None:
+                try:
+                    node = key_index[index]
+                except (KeyError, TypeError):
+                    raise SimpleGetItemNotFound('No key found in dictionary %s.' % self)
+                return self._defining_context.infer_node(node)
+
         compiled_value_index = compiled.create_simple_object(self.inference_state, index)
-        for key, value in self.get_tree_entries():
+        for key, value in entries:
             for k in self._defining_context.infer_node(key):
                 for key_v in k.execute_operation(compiled_value_index, u'=='):
                     if key_v.get_safe_value():
@@ -439,14 +532,23 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
         function returns the value for a certain index.
         """
         # Get keys.
-        types = NO_VALUES
-        for k, _ in self.get_tree_entries():
-            types |= self._defining_context.infer_node(k)
+        types = self._dict_keys()
         # We don't know which dict index comes first, therefore always
         # yield all the types.
         for _ in types:
             yield LazyKnownValues(types)
 
+    def exact_key_items(self):
+        if self._is_summarized(self.get_tree_entries()):
+            items, key_index = self._get_literal_key_index()
+            if key_index is not None:
+                return (
+                    (key, LazyTreeValue(self._defining_context, value))
+                    for key, value in items
+                    if isinstance(key, (str, unicode))
+                )
+        return super(DictLiteralValue, self).exact_key_items()
+
     @publish_method('values')
     def _imitate_values(self):
         lazy_value = LazyKnownValues(self._dict_values())
@@ -465,17 +567,64 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
         return ValueSet([FakeList(self.inference_state, lazy_values)])
 
     def _dict_values(self):
+        entries = self.get_tree_entries()
+        if self._is_summarized(entries):
+            return self._summarize_keys_and_values()[1]
         return ValueSet.from_sets(
             self._defining_context.infer_node(v)
-            for k, v in self.get_tree_entries()
+            for k, v in entries
         )
 
     def _dict_keys(self):
+        entries = self.get_tree_entries()
+        if self._is_summarized(entries):
+            return self._summarize_keys_and_values()[0]
         return ValueSet.from_sets(
             self._defining_context.infer_node(k)
-            for k, v in self.get_tree_entries()
+            for k, v in entries
+        )
+
+    @inference_state_method_cache()
+    def _summarize_keys_and_values(self):
+        entries = self.get_tree_entries()
+        return (
+            _summarize_entries(self._defining_context, [k for k, v in entries]),
+            _summarize_entries(self._defining_context, [v for k, v in entries]),
         )
 
+    def _get_literal_key_index(self):
+        """
+        Returns the Python values of the keys with their value nodes in order
+        and a dict that maps them to the value nodes. Like the ordered lookup
+        in `py__simple_getitem__`, the dict uses the first of duplicate keys.
+        The dict is None if not all keys are simple literals.
+
+        This only depends on the syntax tree and is cached until the module is
+        parsed again.
+        """
+        used_names = self.atom.get_root_node().get_used_names()
+        try:
+            by_atom = _literal_key_index_cache[used_names]
+        except KeyError:
+            by_atom = _literal_key_index_cache[used_names] = {}
+
+        try:
+            return by_atom[self.atom]
+        except KeyError:
+            pass
+
+        items = []
+        index = {}
+        for key, value in self.get_tree_entries():
+            if _get_literal_kind(key) is None:
+                index = None
+                continue
+            items.append((safe_literal_eval(key.value), value))
+            if index is not None:
+                index.setdefault(items[-1][0], value)
+        by_atom[self.atom] = items, index
+        return items, index
+
 
 class _FakeSequence(Sequence):
     def __init__(self, inference_state, lazy_value_list):
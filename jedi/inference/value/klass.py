@@ -131,6 +131,30 @@ class ClassFilter(ParserTreeFilter):
         return [name for name in names if self._access_possible(name)]
 
 
+def _c3_merge(sequences):
+    """
+    The C3 linearization that Python uses for the MRO, see
+    https://www.python.org/download/releases/2.3/mro/. Returns None if there
+    is no consistent order.
+    """
+    sequences = [list(sequence) for sequence in sequences if sequence]
+    result = []
+    while sequences:
+        for sequence in sequences:
+            head = sequence[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            return None
+        result.append(head)
+        sequences = [
+            sequence[1:] if sequence[0] == head else sequence
+            for sequence in sequences
+        ]
+        sequences = [sequence for sequence in sequences if sequence]
+    return result
+
+
 class ClassMixin(object):
     def is_class(self):
         return True
@@ -155,10 +179,8 @@ class ClassMixin(object):
 
     @inference_state_method_generator_cache()
     def py__mro__(self):
-        mro = [self]
         yield self
-        # TODO Do a proper mro resolution. Currently we are just listing
-        # classes. However, it's a complicated algorithm.
+        base_mros = []
         for lazy_cls in self.py__bases__():
             # TODO there's multiple different mro paths possible if this yields
             # multiple possibilities. Could be changed to be more correct.
@@ -181,10 +203,22 @@ class ClassMixin(object):
                     """
                     debug.warning('Super class of %s is not a class: %s', self, cls)
                 else:
-                    for cls_new in mro_method():
-                        if cls_new not in mro:
-                            mro.append(cls_new)
-                            yield cls_new
+                    base_mro = list(mro_method())
+                    if base_mro:
+                        base_mros.append(base_mro)
+
+        mro = _c3_merge(base_mros + [[base_mro[0] for base_mro in base_mros]])
+        if mro is None:
+            # Python would raise a TypeError here. Just list the classes in the
+            # order of the bases.
+            debug.warning('Cannot create a consistent MRO for %s', self)
+            mro = [cls for base_mro in base_mros for cls in base_mro]
+
+        yielded = [self]
+        for cls in mro:
+            if cls not in yielded:
+                yielded.append(cls)
+                yield cls
 
     def get_filters(self, origin_scope=None, is_instance=False):
         metaclasses = self.get_metaclasses()
@@ -313,7 +347,8 @@ class ClassValue(use_metaclass(CachedMetaClass, ClassMixin, FunctionAndClassBase
         if not index_value_set:
             return ValueSet([self])
         return ValueSet(
-            GenericClass(
+            GenericClass.create_cached(
+                self.inference_state,
                 self,
                 LazyGenericManager(
                     context_of_index=contextualized_node.context,
@@ -325,7 +360,8 @@ class ClassValue(use_metaclass(CachedMetaClass, ClassMixin, FunctionAndClassBase
 
     def with_generics(self, generics_tuple):
         from jedi.inference.gradual.base import GenericClass
-        return GenericClass(
+        return GenericClass.create_cached(
+            self.inference_state,
             self,
             TupleGenericManager(generics_tuple)
         )
@@ -347,7 +383,8 @@ class ClassValue(use_metaclass(CachedMetaClass, ClassMixin, FunctionAndClassBase
                 yield type_var_dict.get(type_var.py__name__(), NO_VALUES)
 
         if type_var_dict:
-            return ValueSet([GenericClass(
+            return ValueSet([GenericClass.create_cached(
+                self.inference_state,
                 self,
                 TupleGenericManager(tuple(remap_type_vars()))
             )])
@@ -1,13 +1,17 @@
 import re
 import textwrap
+import threading
+from collections import OrderedDict
 from inspect import cleandoc
 from weakref import WeakKeyDictionary
 
 from parso.python import tree
-from parso.cache import parser_cache
-from parso import split_lines
+from parso.cache import parser_cache, try_to_save_module
+from parso.file_io import KnownContentFileIO
+from parso import split_lines, ParserSyntaxError
 
 from jedi._compatibility import literal_eval, force_unicode
+from jedi.common.utils import register_after_fork
 
 _EXECUTE_NODES = {'funcdef', 'classdef', 'import_from', 'import_name', 'test',
                   'or_test', 'and_test', 'not_test', 'comparison', 'expr',
@@ -18,6 +22,30 @@ _FLOW_KEYWORDS = (
     'try', 'except', 'finally', 'else', 'if', 'elif', 'with', 'for', 'while'
 )
 
+_path_locks_lock = threading.Lock()
+# Dict[path, RLock], parsing the same path is serialized.
+_path_locks = {}
+# Dict[path, Optional[thread ident]], the thread that may update the cached
+# tree of a path in place.
+_tree_owners = {}
+
+_SNIPPET_CACHE_SIZE = 1000
+# The least recently used snippets come first.
+_snippet_cache = OrderedDict()
+_snippet_cache_info = {'hits': 0, 'misses': 0}
+
+
+def _reset_after_fork():
+    global _path_locks_lock
+    _path_locks_lock = threading.Lock()
+    _path_locks.clear()
+    # The only thread of the child has the ident of the thread that forked.
+    # Trees of other threads could otherwise be claimed by new threads.
+    _tree_owners.clear()
+
+
+register_after_fork(_reset_after_fork)
+
 
 def get_executable_nodes(node, last_added=False):
     """
@@ -273,12 +301,144 @@ def get_parent_scope(node, include_flows=False):
 get_cached_parent_scope = _get_parent_scope_cache(get_parent_scope)
 
 
-def get_cached_code_lines(grammar, path):
+def parse(grammar, code, path=None, file_io=None, **kwargs):
+    """
+    Like ``grammar.parse``, but safe to use from multiple threads.
+
+    parso's diff parser updates the cached tree of a path in place, which
+    would break other threads that are still using that tree. Therefore a tree
+    is only updated in place by the thread that created it and only as long as
+    no other thread got it from the cache. Other threads parse the code again
+    and replace the cached tree with theirs.
+    """
+    if file_io is not None:
+        path = file_io.path
+    if path is None:
+        return grammar.parse(code=code, file_io=file_io, **kwargs)
+
+    thread_id = threading.current_thread().ident
+    with _get_path_lock(path):
+        item = _get_cached_item(grammar, path)
+        owner = _tree_owners.get(path)
+        if item is None or owner == thread_id \
+                or not kwargs.get('diff_cache') or code is None:
+            if item is not None and owner != thread_id:
+                kwargs['diff_cache'] = False
+            module_node = grammar.parse(code=code, path=path, file_io=file_io, **kwargs)
+            if item is not None and module_node is item.node:
+                if owner != thread_id:
+                    # The tree is shared now.
+                    _tree_owners[path] = None
+            elif _get_cached_node(grammar, path) is module_node:
+                _tree_owners[path] = thread_id
+            return module_node
+
+        code = force_unicode(code)
+        lines = split_lines(code, keepends=True)
+        if lines == item.lines:
+            # Nothing changed, the tree can simply be shared.
+            _tree_owners[path] = None
+            return item.node
+
+        kwargs['diff_cache'] = False
+        module_node = grammar.parse(code=code, path=path, file_io=file_io, **kwargs)
+        # Other threads keep using the old tree, but the cache is now owned by
+        # this thread.
+        if file_io is None:
+            file_io = KnownContentFileIO(path, code)
+        try_to_save_module(grammar._hashed, file_io, module_node, lines, pickling=False)
+        _tree_owners[path] = thread_id
+        return module_node
+
+
+def _get_path_lock(path):
+    with _path_locks_lock:
+        try:
+            return _path_locks[path]
+        except KeyError:
+            lock = _path_locks[path] = threading.RLock()
+            return lock
+
+
+def _get_cached_item(grammar, path):
+    try:
+        return parser_cache[grammar._hashed][path]
+    except KeyError:
+        return None
+
+
+def _get_cached_node(grammar, path):
+    item = _get_cached_item(grammar, path)
+    return None if item is None else item.node
+
+
+def get_cached_snippet(key, create):
+    """
+    A small LRU cache for snippets of code that are generated or found in
+    docstrings and annotations, and for the things that are derived from
+    them. ``create`` is only called if ``key`` is not cached yet. The results
+    are shared by all inference states, so they must not contain values.
+    """
+    try:
+        result = _snippet_cache.pop(key)
+    except KeyError:
+        _snippet_cache_info['misses'] += 1
+        result = create()
+        while len(_snippet_cache) >= _SNIPPET_CACHE_SIZE:
+            try:
+                _snippet_cache.popitem(last=False)
+            except KeyError:
+                # Another thread removed it.
+                break
+    else:
+        _snippet_cache_info['hits'] += 1
+    _snippet_cache[key] = result
+    return result
+
+
+def parse_snippet(grammar, code, **kwargs):
+    """
+    Like ``grammar.parse`` for snippets, but cached by their code. The trees
+    are shared and therefore must not be modified.
+    """
+    def create():
+        try:
+            return grammar.parse(code, **kwargs)
+        except ParserSyntaxError as e:
+            return e
+
+    key = 'parse', grammar, code, tuple(sorted(kwargs.items()))
+    result = get_cached_snippet(key, create)
+    if isinstance(result, ParserSyntaxError):
+        raise ParserSyntaxError(result.message, result.error_leaf)
+    return result
+
+
+def get_snippet_cache_info():
+    """
+    Returns a dict with the ``hits`` and ``misses`` of the snippet cache and
+    its current ``size``.
+    """
+    return dict(_snippet_cache_info, size=len(_snippet_cache))
+
+
+def clear_snippet_cache():
+    _snippet_cache.clear()
+    _snippet_cache_info.update(hits=0, misses=0)
+
+
+def get_cached_code_lines(grammar, path, module_node=None):
     """
     Basically access the cached code lines in parso. This is not the nicest way
     to do this, but we avoid splitting all the lines again.
+
+    If ``module_node`` is given and another thread parsed the path again in the
+    meantime, the lines are created from the module.
     """
-    return parser_cache[grammar._hashed][path].lines
+    item = parser_cache[grammar._hashed][path]
+    if module_node is not None and item.node is not module_node:
+        return split_lines(module_node.get_code(), keepends=True)
+    return item.lines
 
 
 def cut_value_at_position(leaf, position):
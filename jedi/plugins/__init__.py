@@ -1,18 +1,23 @@
+import threading
 from functools import wraps
 
+from jedi.common.utils import register_after_fork
+
 
 class _PluginManager(object):
     def __init__(self):
         self._registered_plugins = []
         self._cached_base_callbacks = {}
         self._built_functions = {}
+        self._lock = threading.Lock()
 
     def register(self, *plugins):
         """
         Makes it possible to register your plugin.
         """
-        self._registered_plugins.extend(plugins)
-        self._build_functions()
+        with self._lock:
+            self._registered_plugins.extend(plugins)
+            self._build_functions()
 
     def decorate(self, name=None):
         def decorator(callback):
@@ -32,7 +37,9 @@ class _PluginManager(object):
         return decorator
 
     def _build_functions(self):
-        for name, callback in self._cached_base_callbacks.items():
+        # Other threads might be calling the functions. Every function is
+        # replaced at once, which is atomic.
+        for name, callback in list(self._cached_base_callbacks.items()):
             for plugin in reversed(self._registered_plugins):
                 # Need to reverse so the first plugin is run first.
                 try:
@@ -45,3 +52,10 @@ class _PluginManager(object):
 
 
 plugin_manager = _PluginManager()
+
+
+def _reset_lock_after_fork():
+    plugin_manager._lock = threading.Lock()
+
+
+register_after_fork(_reset_lock_after_fork)
@@ -1,9 +1,16 @@
+import os
+import weakref
+
 from parso.python.tree import search_ancestor
-from jedi._compatibility import FileNotFoundError
+from jedi import settings
+from jedi._compatibility import FileNotFoundError, scandir
+from jedi.file_io import FileIO
+from jedi.parser_utils import get_parent_scope
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.imports import load_module_from_path
 from jedi.inference.filters import ParserTreeFilter
 from jedi.inference.base_value import NO_VALUES, ValueSet
+from jedi.inference.utils import to_list
 
 _PYTEST_FIXTURE_MODULES = [
     ('_pytest', 'monkeypatch'),
@@ -13,6 +20,12 @@ _PYTEST_FIXTURE_MODULES = [
     ('_pytest', 'pytester'),
 ]
 
+_fixture_names_cache = weakref.WeakKeyDictionary()
+# Dict[folder, Tuple[Tuple[Tuple[conftest_path, modified], ...], Dict[name, List[path]]]]
+_conftest_index_cache = {}
+# Dict[folder, Tuple[modified, List[module_name]]]
+_entry_point_plugins_cache = {}
+
 
 def execute(callback):
     def wrapper(value, arguments):
@@ -83,7 +96,7 @@ def complete_param_names(func):
         module_context = context.get_root_context()
         if _is_pytest_func(func_name, decorator_nodes):
             names = []
-            for module_context in _iter_pytest_modules(module_context):
+            for module_context in _iter_pytest_modules(module_context, with_fixtures=True):
                 names += FixtureFilter(module_context).values()
             if names:
                 return names
@@ -92,7 +105,9 @@ def complete_param_names(func):
 
 
 def _goto_pytest_fixture(module_context, name, skip_own_module):
-    for module_context in _iter_pytest_modules(module_context, skip_own_module=skip_own_module):
+    for module_context in _iter_pytest_modules(module_context,
+                                               skip_own_module=skip_own_module,
+                                               fixture_name=name):
         names = FixtureFilter(module_context).get(name)
         if names:
             return names
@@ -118,27 +133,200 @@ def _is_pytest_func(func_name, decorator_nodes):
         or any('fixture' in n.get_code() for n in decorator_nodes)
 
 
+def _has_fixture_decorator(decorated):
+    # The same heuristic as in FixtureFilter, but without inferring anything.
+    return decorated.type == 'decorated' and any(
+        'fixture' in decorator.children[1].get_code()
+        for decorator in decorated.children[:-1]
+    )
+
+
+def _get_fixture_names(module_node):
+    """
+    Returns the names of the functions of a module that look like fixtures.
+    They are collected once per parsed module.
+    """
+    used_names = module_node.get_used_names()
+    try:
+        return _fixture_names_cache[used_names]
+    except KeyError:
+        pass
+
+    fixture_names = set()
+    for key, names in used_names.items():
+        for name in names:
+            funcdef = name.parent
+            if funcdef.type == 'funcdef' and funcdef.name is name \
+                    and _has_fixture_decorator(funcdef.parent) \
+                    and get_parent_scope(funcdef) == module_node:
+                fixture_names.add(key)
+    result = _fixture_names_cache[used_names] = frozenset(fixture_names)
+    return result
+
+
+def _iter_conftest_paths(inference_state, folder):
+    sys_path = inference_state.get_sys_path()
+    while any(folder.startswith(p) for p in sys_path):
+        path = os.path.join(folder, 'conftest.py')
+        try:
+            yield path, os.path.getmtime(path)
+        except OSError:
+            pass
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            break
+        folder = parent
+
+
+def _get_conftest_fixtures(inference_state, folder):
+    """
+    Returns a dict of fixture names to the paths of the ``conftest.py`` files
+    that are relevant for a folder and define a fixture with that name. The
+    nearest ``conftest.py`` comes first.
+
+    The result is cached per folder and is only created again if one of the
+    ``conftest.py`` files was added, removed or modified.
+    """
+    conftests = tuple(_iter_conftest_paths(inference_state, folder))
+    try:
+        cached_conftests, fixtures = _conftest_index_cache[folder]
+    except KeyError:
+        pass
+    else:
+        if cached_conftests == conftests:
+            return fixtures
+
+    fixtures = {}
+    for path, modified in conftests:
+        try:
+            module_node = inference_state.parse(
+                file_io=FileIO(path),
+                cache=True,
+                diff_cache=settings.fast_parser,
+                cache_path=settings.cache_directory,
+            )
+        except FileNotFoundError:
+            continue
+        for name in _get_fixture_names(module_node):
+            fixtures.setdefault(name, []).append(path)
+    _conftest_index_cache[folder] = conftests, fixtures
+    return fixtures
+
+
+def _parse_pytest_entry_points(path):
+    try:
+        with open(path) as f:
+            lines = f.read().splitlines()
+    except (IOError, OSError):
+        return []
+
+    module_names = []
+    in_section = False
+    for line in lines:
+        line = line.strip()
+        if line.startswith('['):
+            in_section = line == '[pytest11]'
+        elif in_section and '=' in line:
+            module_name = line.split('=', 1)[1].split(':', 1)[0].strip()
+            if module_name:
+                module_names.append(module_name)
+    return module_names
+
+
+def _get_entry_point_plugins(folder):
+    """
+    Returns the names of the modules that are registered as pytest plugins
+    (with the ``pytest11`` entry point) by the distributions in a folder.
+    """
+    try:
+        modified = os.path.getmtime(folder)
+        cached_modified, module_names = _entry_point_plugins_cache[folder]
+    except OSError:
+        return []
+    except KeyError:
+        pass
+    else:
+        if cached_modified == modified:
+            return module_names
+
+    module_names = []
+    try:
+        entries = list(scandir(folder))
+    except OSError:
+        entries = []
+    for entry in entries:
+        if entry.name.endswith(('.dist-info', '.egg-info')):
+            module_names += _parse_pytest_entry_points(
+                os.path.join(entry.path, 'entry_points.txt'))
+    _entry_point_plugins_cache[folder] = modified, module_names
+    return module_names
+
+
+def _iter_plugin_module_names(inference_state):
+    for names in _PYTEST_FIXTURE_MODULES:
+        yield names
+    for folder in inference_state.get_sys_path():
+        for module_name in _get_entry_point_plugins(folder):
+            yield tuple(module_name.split('.'))
+
+
+def _iter_pytest_modules(module_context, skip_own_module=False,
+                         fixture_name=None, with_fixtures=False):
+    """
+    Iterates over the modules that define fixtures that can be used in a
+    module: The module itself, the ``conftest.py`` files of the parent folders
+    and the pytest plugins.
+
+    :param fixture_name: Only the modules that might define this fixture.
+    :param with_fixtures: Only the modules that might define any fixture.
+    """
+    def is_relevant(module_context):
+        if module_context.is_compiled():
+            return False
+        module_node = module_context.tree_node
+        if fixture_name is not None:
+            return fixture_name in _get_fixture_names(module_node)
+        return not with_fixtures or bool(_get_fixture_names(module_node))
+
+    return [
+        m for m in _get_pytest_modules(module_context, skip_own_module, fixture_name)
+        if is_relevant(m)
+    ]
+
+
 @inference_state_method_cache()
-def _iter_pytest_modules(module_context, skip_own_module=False):
+@to_list
+def _get_pytest_modules(module_context, skip_own_module, fixture_name):
     if not skip_own_module:
         yield module_context
 
+    inference_state = module_context.inference_state
     file_io = module_context.get_value().file_io
     if file_io is not None:
-        folder = file_io.get_parent_folder()
-        sys_path = module_context.inference_state.get_sys_path()
-        while any(folder.path.startswith(p) for p in sys_path):
-            file_io = folder.get_file_io('conftest.py')
-            if file_io.path != module_context.py__file__():
+        fixtures = _get_conftest_fixtures(
+            inference_state,
+            os.path.dirname(file_io.path),
+        )
+        if fixture_name is None:
+            # All the conftest.py files are in parent folders, therefore the
+            # deepest ones are the nearest ones.
+            paths = sorted(
+                set(p for fixture_paths in fixtures.values() for p in fixture_paths),
+                key=lambda p: -p.count(os.path.sep)
+            )
+        else:
+            paths = fixtures.get(fixture_name, [])
+
+        for path in paths:
+            if path != module_context.py__file__():
                 try:
-                    m = load_module_from_path(module_context.inference_state, file_io)
+                    m = load_module_from_path(inference_state, FileIO(path))
                     yield m.as_context()
                 except FileNotFoundError:
                     pass
-            folder = folder.get_parent_folder()
 
-    for names in _PYTEST_FIXTURE_MODULES:
-        for module_value in module_context.inference_state.import_module(names):
+    for names in _iter_plugin_module_names(inference_state):
+        for module_value in inference_state.import_module(names):
             yield module_value.as_context()
 
 
@@ -14,7 +14,9 @@ import os
 
 from jedi._compatibility import force_unicode, Parameter
 from jedi import debug
+from jedi.parser_utils import parse_snippet
 from jedi.inference.utils import safe_property
+from jedi.inference.cache import inference_state_function_cache
 from jedi.inference.helpers import get_str_or_none
 from jedi.inference.arguments import \
     repack_with_argument_clinic, AbstractArguments, TreeArgumentsWrapper
@@ -460,15 +462,18 @@ def collections_namedtuple(value, arguments, callback):
                              for index, name in enumerate(fields))
     )
 
-    # Parse source code
-    module = inference_state.grammar.parse(code)
+    return ValueSet([_create_namedtuple_class(inference_state, code)])
+
+
+@inference_state_function_cache()
+def _create_namedtuple_class(inference_state, code):
+    module = parse_snippet(inference_state.grammar, code)
     generated_class = next(module.iter_classdefs())
     parent_context = ModuleValue(
         inference_state, module,
         code_lines=parso.split_lines(code, keepends=True),
     ).as_context()
-
-    return ValueSet([ClassValue(inference_state, parent_context, generated_class)])
+    return ClassValue(inference_state, parent_context, generated_class)
 
 
 class PartialObject(ValueWrapper):
@@ -44,6 +44,15 @@ Caching
 ~~~~~~~
 
 .. autodata:: call_signatures_validity
+.. autodata:: symbol_index_validity
+.. autodata:: watch_file_system
+.. autodata:: cache_docstring_types
+
+
+Multiprocessing
+~~~~~~~~~~~~~~~
+
+.. autodata:: reference_processes
 
 
 """
@@ -123,7 +132,8 @@ the params of a function.
 
 dynamic_params_for_other_modules = True
 """
-Do the same for other modules.
+Do the same for other modules. Calls within the project are found with the
+symbol index of the project, which is built on first use.
 """
 
 dynamic_flow_information = True
@@ -149,3 +159,42 @@ call_signatures_validity = 3.0
 Finding function calls might be slow (0.1-0.5s). This is not acceptible for
 normal writing. Therefore cache it for a short time.
 """
+
+symbol_index_validity = 3.0
+"""
+Searching a project uses an index of all the definitions in the project.
+Checking whether files have changed requires walking the project, therefore
+the index is only updated if it is older than this many seconds. This is only
+used if :data:`watch_file_system` is disabled.
+"""
+
+watch_file_system = False
+"""
+Watches the directories of projects, typeshed and site-packages for changes
+(using inotify on Linux, polling otherwise). Caches that depend on these
+directories are updated when a change happens instead of checking the file
+system regularly. Polling only checks the files of a project that were
+loaded, see :mod:`jedi.file_watcher`.
+"""
+
+cache_docstring_types = False
+"""
+The types that are found in docstrings are cached by the hash of the
+docstring. If this is enabled, they are also written to the
+:data:`cache_directory`, which helps with the long numpydoc docstrings of
+scientific libraries.
+"""
+
+# ----------------
+# Multiprocessing
+# ----------------
+
+reference_processes = 0
+"""
+Finding references (and therefore also renaming) infers all the usages of a
+name in the modules that might contain references. If this is bigger than 1,
+the modules that are found by searching the file system are distributed to
+this many worker processes. By default everything happens in the current
+process. The workers are started on the first search and are kept until the
+process exits.
+"""
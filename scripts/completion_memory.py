@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Measures the peak memory (RSS) of completing in all Python files of a project.
+
+Every file is completed at the end of each of its lines until ``-n`` completions
+were made in that file. All scripts share one project, so the caches are kept
+like in an editor. Prints the time and the peak RSS of the process (POSIX only).
+
+Usage:
+  completion_memory.py [<project>] [-n <number>] [--max-files <files>]
+  completion_memory.py -h | --help
+
+Options:
+  -h --help            Show this screen.
+  -n <number>          Completions per file [default: 5].
+  --max-files <files>  Stop after this many files [default: 500].
+"""
+import os
+import sys
+import time
+import resource
+
+from docopt import docopt
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
+import jedi  # noqa: E402
+
+
+def peak_rss():
+    """Returns the peak RSS of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        # Bytes on macOS, kilobytes everywhere else.
+        return peak / 2 ** 20
+    return peak / 2 ** 10
+
+
+def iter_files(path):
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for file_name in sorted(files):
+            if file_name.endswith('.py'):
+                yield os.path.join(root, file_name)
+
+
+def complete_file(project, path, number):
+    with open(path) as f:
+        code = f.read()
+    script = jedi.Script(code, path=path, project=project)
+    lines = code.splitlines()
+    step = max(len(lines) // number, 1)
+    for line_nr in range(1, len(lines) + 1, step)[:number]:
+        script.complete(line_nr, len(lines[line_nr - 1]))
+
+
+def main(args):
+    path = os.path.abspath(args['<project>'] or os.path.join(os.path.dirname(__file__), '..'))
+    project = jedi.Project(path)
+    number = int(args['-n'])
+    max_files = int(args['--max-files'])
+
+    start_rss = peak_rss()
+    t0 = time.time()
+    files = 0
+    for file_path in iter_files(path):
+        if files >= max_files:
+            break
+        files += 1
+        try:
+            complete_file(project, file_path, number)
+        except Exception as e:
+            print('Failed to complete %s: %r' % (file_path, e))
+
+    print('Files:             %10s' % files)
+    print('Time:              %10.1f s' % (time.time() - t0))
+    print('Peak RSS at start: %10.1f MB' % start_rss)
+    print('Peak RSS:          %10.1f MB' % peak_rss())
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Measures the flow analysis with scaled up versions of the completion test
+files ``flow_analysis.py`` and ``isinstance.py``.
+
+Each file is repeated ``-n`` times and all names in the result are inferred.
+Additionally a name that is defined in every branch of a long ``if``/``elif``
+ladder is inferred from many places.
+
+Usage:
+  flow_analysis_benchmark.py [-n <number>] [--ladder <branches>]
+  flow_analysis_benchmark.py -h | --help
+
+Options:
+  -h --help             Show this screen.
+  -n <number>           How many times the test files are repeated [default: 20].
+  --ladder <branches>   Number of branches in the if/elif ladder [default: 300].
+"""
+import os
+import sys
+import time
+
+from docopt import docopt
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
+import jedi  # noqa: E402
+
+_COMPLETION_DIR = os.path.join(os.path.dirname(__file__), '..', 'test', 'completion')
+
+
+def infer_all_names(code):
+    script = jedi.Script(code)
+    for name in script.get_names(all_scopes=True, references=True):
+        name.infer()
+
+
+def infer_ladder(branches):
+    code = 'import random\nx = random.random()\n'
+    for i in range(branches):
+        code += '%s x == %s:\n    z = %s\n' % ('if' if i == 0 else 'elif', i, i)
+    code += 'else:\n    z = ""\n'
+    code += 'def use():\n    return z\n' * (branches // 10)
+    infer_all_names(code + 'z')
+
+
+def main(args):
+    number = int(args['-n'])
+    for file_name in ('flow_analysis.py', 'isinstance.py'):
+        with open(os.path.join(_COMPLETION_DIR, file_name)) as f:
+            code = f.read()
+        t = time.time()
+        infer_all_names(code * number)
+        print('%-20s %8.2f s' % (file_name, time.time() - t))
+
+    t = time.time()
+    infer_ladder(int(args['--ladder']))
+    print('%-20s %8.2f s' % ('if/elif ladder', time.time() - t))
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
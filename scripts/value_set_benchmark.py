@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""
+Measures how ``ValueSet`` objects are used.
+
+The microbenchmarks time the most common set operations. The corpus run infers
+all names in the files of the completion tests (or the given files) and counts
+how many value sets are created, how big the results of ``from_sets`` are and
+how much memory was allocated at peak (Python 3 only).
+
+The completion tests need typeshed, ``--stdlib`` uses some modules of the
+standard library instead, which also works without it.
+
+Usage:
+  value_set_benchmark.py [<file>...] [-n <number>] [--stdlib]
+  value_set_benchmark.py -h | --help
+
+Options:
+  -h --help     Show this screen.
+  -n <number>   Number of loops for the microbenchmarks [default: 200000].
+  --stdlib      Use some modules of the standard library as the corpus.
+"""
+import os
+import sys
+import glob
+import timeit
+from collections import Counter
+
+from docopt import docopt
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
+import jedi  # noqa: E402
+from jedi.common.value import BaseValueSet  # noqa: E402
+from jedi.inference.base_value import ValueSet, NO_VALUES  # noqa: E402
+
+_COMPLETION_DIR = os.path.join(os.path.dirname(__file__), '..', 'test', 'completion')
+_STDLIB_MODULES = ('bisect', 'colorsys', 'fnmatch', 'glob', 'heapq', 'keyword',
+                   'netrc', 'shlex', 'textwrap', 'queue', 'sched', 'stat')
+
+
+class _Value(object):
+    def infer(self):
+        return ValueSet([self])
+
+
+def microbenchmarks(number):
+    a = ValueSet([_Value()])
+    b = ValueSet([_Value()])
+    cases = [
+        ('from_sets([])', lambda: ValueSet.from_sets([])),
+        ('from_sets([a])', lambda: ValueSet.from_sets([a])),
+        ('from_sets([empty, a])', lambda: ValueSet.from_sets([NO_VALUES, a])),
+        ('from_sets([a, b])', lambda: ValueSet.from_sets([a, b])),
+        ('a | empty', lambda: a | NO_VALUES),
+        ('a | b', lambda: a | b),
+        ('a.infer()', lambda: a.infer()),
+        ('list(a)', lambda: list(a)),
+    ]
+    for name, func in cases:
+        elapsed = timeit.timeit(func, number=number)
+        print('%-25s %8.3f us' % (name, elapsed / number * 1e6))
+
+
+def _count(counter):
+    def counting_new(cls, *args, **kwargs):
+        counter['created'] += 1
+        return object.__new__(cls)
+
+    original_from_sets = BaseValueSet.from_sets.__func__
+
+    def from_sets(cls, sets):
+        result = original_from_sets(cls, sets)
+        counter['from_sets'] += 1
+        counter['from_sets size %s' % min(len(result), 2)] += 1
+        return result
+
+    BaseValueSet.__new__ = staticmethod(counting_new)
+    BaseValueSet.from_sets = classmethod(from_sets)
+
+
+def run_corpus(paths):
+    try:
+        import tracemalloc
+    except ImportError:
+        tracemalloc = None
+    else:
+        tracemalloc.start()
+
+    counter = Counter()
+    _count(counter)
+    for path in paths:
+        with open(path) as f:
+            code = f.read()
+        script = jedi.Script(code, path=path)
+        try:
+            for name in script.get_names(all_scopes=True, references=True):
+                name.infer()
+        except Exception as e:
+            print('Failed to infer %s: %r' % (path, e))
+
+    for key, count in sorted(counter.items()):
+        print('%-25s %10s' % (key, count))
+    if tracemalloc is not None:
+        _, peak = tracemalloc.get_traced_memory()
+        print('%-25s %10.1f MB' % ('peak memory', peak / 2 ** 20))
+
+
+def main(args):
+    microbenchmarks(int(args['-n']))
+    if args['--stdlib']:
+        stdlib_dir = os.path.dirname(os.__file__)
+        paths = [os.path.join(stdlib_dir, name + '.py') for name in _STDLIB_MODULES]
+    else:
+        paths = args['<file>'] or sorted(glob.glob(os.path.join(_COMPLETION_DIR, '*.py')))
+    run_corpus(paths)
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""
+Compares the speed of ``jedi.file_walker.walk_python_files`` with
+``recurse_find_python_folders_and_files``, which Jedi used to find the Python
+files of a project. The latter is copied here from the old
+``jedi.inference.references``.
+
+Without a path a temporary project is created, that contains a small Python
+package and huge ``node_modules`` and ``build`` folders (the latter is in the
+``.gitignore``).
+
+Usage:
+  walk_benchmark.py [<path>] [-n <number>]
+  walk_benchmark.py -h | --help
+
+Options:
+  -h --help     Show this screen.
+  -n <number>   How many times each walk is repeated [default: 5].
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+from docopt import docopt
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
+from jedi.file_io import FolderIO  # noqa: E402
+from jedi.file_walker import walk_python_files  # noqa: E402
+
+
+def _write(path, content=''):
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+def create_project(root, packages=300, files=20):
+    _write(os.path.join(root, '.gitignore'), '/build/\n*.egg-info/\n')
+    for i in range(20):
+        _write(os.path.join(root, 'project', 'sub%s' % i, '__init__.py'))
+        _write(os.path.join(root, 'project', 'sub%s' % i, 'module.py'))
+    for i in range(packages):
+        for j in range(files):
+            _write(os.path.join(root, 'node_modules', 'pkg%s' % i, 'lib', 'f%s.js' % j))
+            _write(os.path.join(root, 'build', 'lib%s' % i, 'f%s.py' % j))
+
+
+_IGNORE_FOLDERS = ('.tox', 'venv', '__pycache__')
+
+
+def gitignored_lines(folder_io, file_io):
+    ignored_paths = set()
+    ignored_names = set()
+    for line in file_io.read().splitlines():
+        if not line or line.startswith(b'#'):
+            continue
+
+        p = line.decode('utf-8', 'ignore')
+        if p.startswith('/'):
+            name = p[1:]
+            if name.endswith(os.path.sep):
+                name = name[:-1]
+            ignored_paths.add(os.path.join(folder_io.path, name))
+        else:
+            ignored_names.add(p)
+    return ignored_paths, ignored_names
+
+
+def recurse_find_python_folders_and_files(folder_io, except_paths=()):
+    except_paths = set(except_paths)
+    for root_folder_io, folder_ios, file_ios in folder_io.walk():
+        # Delete folders that we don't want to iterate over.
+        for file_io in file_ios:
+            path = file_io.path
+            if path.endswith('.py') or path.endswith('.pyi'):
+                if path not in except_paths:
+                    yield None, file_io
+
+            if path.endswith('.gitignore'):
+                ignored_paths, ignored_names = \
+                    gitignored_lines(root_folder_io, file_io)
+                except_paths |= ignored_paths
+
+        folder_ios[:] = [
+            folder_io
+            for folder_io in folder_ios
+            if folder_io.path not in except_paths
+            and folder_io.get_base_name() not in _IGNORE_FOLDERS
+        ]
+        for folder_io in folder_ios:
+            yield folder_io, None
+
+
+def walk_with_folder_io(path):
+    return [
+        (folder_io or file_io).path
+        for folder_io, file_io in recurse_find_python_folders_and_files(FolderIO(path))
+    ]
+
+
+def walk_with_file_walker(path):
+    return [entry.path for entry in walk_python_files(path)]
+
+
+def benchmark(func, path, number):
+    func(path)  # Warm up the file system cache.
+    start = time.time()
+    for _ in range(number):
+        paths = func(path)
+    elapsed = (time.time() - start) / number
+    print('%-25s %8.2f ms %8s paths' % (func.__name__, elapsed * 1000, len(paths)))
+
+
+def main(args):
+    path = args['<path>']
+    number = int(args['-n'])
+    temp_dir = None
+    if path is None:
+        temp_dir = path = tempfile.mkdtemp()
+        create_project(path)
+    try:
+        benchmark(walk_with_folder_io, path, number)
+        benchmark(walk_with_file_walker, path, number)
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
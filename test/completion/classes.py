@@ -287,6 +287,23 @@ V(1).d()
 V(1).d() 
 
 
+class SelfAttributes:
+    def __init__(self, other):
+        self.in_init = 1
+        other.on_other = 1
+
+        def nested():
+            self.in_nested = ''
+        nested()
+
+#? ['in_init', 'in_nested']
+SelfAttributes(1).in_
+#? str()
+SelfAttributes(1).in_nested
+#? []
+SelfAttributes(1).on_other
+
+
 # -----------------
 # ordering
 # -----------------
@@ -555,6 +572,24 @@ B.b
 B().b
 
 
+class MroBase(object):
+    attr = 1
+
+class MroLeft(MroBase):
+    pass
+
+class MroRight(MroBase):
+    attr = ''
+
+class MroDiamond(MroLeft, MroRight):
+    pass
+
+#? str()
+MroDiamond.attr
+#? str()
+MroDiamond().attr
+
+
 # -----------------
 # With import
 # -----------------
@@ -320,6 +320,45 @@ A().ret()
 A().x
 
 
+# -----------------
+# Decorators that pass the function through
+# -----------------
+
+import functools
+
+registry = []
+
+def register(func):
+    registry.append(func)
+    return func
+
+def forward(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return wrapper
+
+@register
+def registered(a):
+    return a
+
+@forward
+def forwarded(a, b=''):
+    return a, b
+
+@forward
+class ForwardedClass():
+    attribute = 1
+
+#? int()
+registered(1)
+#? float()
+forwarded(1.0)[0]
+#? str()
+forwarded(1.0)[1]
+#? int()
+ForwardedClass().attribute
+
 # -----------------
 # On decorator completions
 # -----------------
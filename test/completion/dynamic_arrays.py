@@ -154,6 +154,43 @@ arr3[10]
 #? float() str() int() set()
 res[10]
 
+# -----------------
+# mutations after the inferred position and in nested functions
+# -----------------
+
+later = []
+#? int() float() str() bytes()
+later[0]
+later.append(1)
+later.insert(0, 1.0)
+later.extend([''])
+
+def nested_mutations():
+    def add_bytes():
+        later.append(b'')
+    return add_bytes
+
+later_set = set()
+#? int() str()
+later_set.pop()
+
+def nested_set_mutations():
+    def inner():
+        later_set.add(1)
+        later_set.update([''])
+    inner()
+
+def nested_list():
+    arr = []
+    def inner():
+        arr.append(1.0)
+        def innermost():
+            arr.extend([1])
+        innermost()
+    inner()
+    #? float() int()
+    arr[0]
+
 # -----------------
 # returns, special because the module dicts are not correct here.
 # -----------------
@@ -72,3 +72,23 @@ overload_f1(list_alias)
 overload_f1(list_str)
 #? str() dict()
 overload_f1(list_int)
+
+# -------------------------
+# Arity and keywords
+# -------------------------
+
+@overload
+def overload_arity(a: int) -> int: ...
+@overload
+def overload_arity(a: int, b: int) -> str: ...
+@overload
+def overload_arity(a: int, *, key: int) -> float: ...
+
+#? int()
+overload_arity(1)
+#? str()
+overload_arity(1, 2)
+#? float()
+overload_arity(1, key=2)
+#? int()
+overload_arity(1)
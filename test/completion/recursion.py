@@ -103,3 +103,23 @@ while True:
     bar = bar  # type: bar
     #? int()
     bar
+
+# -----------------
+# Executions with the same arguments don't count towards the limits
+# -----------------
+
+def ident(x):
+    return x
+
+summarized = 1.0
+summarized = ident(summarized)
+summarized = ident(summarized)
+summarized = ident(summarized)
+summarized = ident(summarized)
+summarized = ident(summarized)
+summarized = ident(summarized)
+summarized = ident(summarized)
+summarized = ident(summarized)
+summarized = ident(summarized)
+#? float()
+summarized
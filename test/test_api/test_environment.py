@@ -90,6 +90,35 @@ def test_killed_subprocess(inference_state, Script, environment):
     assert def_.name == 'str'
 
 
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="Needs os.fork")
+def test_subprocess_after_fork(environment):
+    if isinstance(environment, InterpreterEnvironment):
+        pytest.skip("There is no subprocess")
+    subprocess = environment._get_subprocess()
+    sys_path = subprocess.get_sys_path()
+    parent_pid = subprocess._get_process().pid
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            # The child must start its own subprocess.
+            works = subprocess.get_sys_path() == sys_path \
+                and subprocess._get_process().pid != parent_pid
+        except Exception:
+            works = False
+        os.write(write_fd, b'1' if works else b'0')
+        os._exit(0)
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b'1'
+    os.close(read_fd)
+    # The subprocess of the parent is still usable.
+    assert subprocess._get_process().pid == parent_pid
+    assert subprocess.get_sys_path() == sys_path
+
+
 def test_not_existing_virtualenv(monkeypatch):
     """Should not match the path that was given"""
     path = '/foo/bar/jedi_baz'
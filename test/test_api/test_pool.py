@@ -0,0 +1,67 @@
+import pickle
+from textwrap import dedent
+
+import pytest
+
+from jedi import ScriptPool
+from jedi.api.pool import PoolName
+from jedi.common.utils import get_process_context
+
+_CODE = dedent('''\
+    def foo(a):
+        """doc of foo"""
+        return a
+
+    foo(1)
+    ''')
+
+
+@pytest.fixture
+def pool(environment):
+    with ScriptPool(environment=environment, processes=2) as pool:
+        yield pool
+
+
+def test_goto_and_references(pool, tmpdir):
+    path = tmpdir.join('pool.py').strpath
+    name, = pool.goto(_CODE, path, line=5, column=0)
+    assert isinstance(name, PoolName)
+    assert (name.name, name.type, name.line, name.column) == ('foo', 'function', 1, 4)
+    assert name.module_path == path
+    assert name.is_definition()
+    assert name.docstring(raw=True) == 'doc of foo'
+    assert pickle.loads(pickle.dumps(name)) == name
+
+    references = pool.get_references(_CODE, path, line=5, column=0)
+    assert [(r.line, r.column) for r in references] == [(1, 4), (5, 0)]
+
+
+def test_worker_affinity(pool, tmpdir):
+    path = tmpdir.join('pool.py').strpath
+    assert pool._get_worker(path) is pool._get_worker(path)
+
+
+def test_error(pool):
+    with pytest.raises(ValueError):
+        pool.goto(_CODE, line=100, column=0)
+
+    worker = pool._get_worker('crash.py')
+    worker._process.terminate()
+    worker._process.join()
+    # A dead worker is restarted.
+    assert pool.goto(_CODE, 'crash.py', line=5, column=0)
+
+
+def test_preload_modules(environment, tmpdir):
+    path = tmpdir.join('pool.py').strpath
+    with ScriptPool(environment=environment, processes=1, preload_modules=['json']) as pool:
+        name, = pool.infer('import json\njson.loads', path, line=2, column=5)
+        assert name.full_name == 'json.loads'
+
+        # Crashed workers are not forked from this process again.
+        worker, = pool._workers
+        assert worker._restart_context is get_process_context()
+        worker._process.terminate()
+        worker._process.join()
+        name, = pool.infer('import json\njson.loads', path, line=2, column=5)
+        assert name.full_name == 'json.loads'
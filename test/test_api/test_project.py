@@ -4,8 +4,9 @@ import sys
 import pytest
 
 from ..helpers import get_example_dir, set_cwd, root_dir, test_dir
-from jedi import Interpreter
+from jedi import Interpreter, settings
 from jedi.api import Project, get_default_project
+from jedi.api.symbol_index import get_symbol_index
 
 
 def test_django_default_project(Script):
@@ -151,3 +152,72 @@ def test_complete_search(Script, string, completions, all_scopes, skip_pre_pytho
     project = Project(test_dir)
     defs = project.complete_search(string, all_scopes=all_scopes)
     assert [d.complete for d in defs] == completions
+
+
+def test_dynamic_params_from_project(Script, tmpdir):
+    os.mkdir(tmpdir.join('pkg').strpath)
+    tmpdir.join('pkg', '__init__.py').write('')
+    tmpdir.join('pkg', 'mod.py').write('def func(param):\n    param\n')
+    tmpdir.join('caller.py').write('from pkg.mod import func\nfunc(1.0)\n')
+
+    path = tmpdir.join('pkg', 'mod.py').strpath
+    project = Project(tmpdir.strpath)
+    script = Script(path=path, project=project)
+    assert [d.name for d in script.infer(2, 5)] == ['float']
+    # Inference alone doesn't walk the whole project to build the index.
+    index = get_symbol_index(project._path, project._exclude_patterns)
+    assert not index.is_built()
+
+    # Once the index is built, it is used to find the call sites.
+    list(project.search('func'))
+    assert index.is_built()
+    script = Script(path=path, project=project)
+    assert [d.name for d in script.infer(2, 5)] == ['float']
+
+
+def test_dynamic_params_from_project_limit(Script, tmpdir, monkeypatch):
+    monkeypatch.setattr(settings, 'symbol_index_validity', 0)
+    os.mkdir(tmpdir.join('pkg').strpath)
+    tmpdir.join('pkg', '__init__.py').write('')
+    tmpdir.join('pkg', 'mod.py').write('def func(param):\n    param\n')
+    for i in range(10):
+        # Calls of other functions with the same name.
+        tmpdir.join('other%s.py' % i).write('def func(x): pass\nfunc(1)\n')
+    tmpdir.join('real.py').write('from pkg.mod import func\nfunc(1.0)\n')
+
+    path = tmpdir.join('pkg', 'mod.py').strpath
+    project = Project(tmpdir.strpath)
+    list(project.search('func'))
+    # Like without the index only a few modules are parsed.
+    assert Script(path=path, project=project).infer(2, 5) == []
+
+    # The ones in the same folder first.
+    tmpdir.join('pkg', 'near.py').write('from pkg.mod import func\nfunc(1.0)\n')
+    script = Script(path=path, project=project)
+    assert [d.name for d in script.infer(2, 5)] == ['float']
+
+
+def test_incrementally_built_index(tmpdir):
+    for i in range(80):
+        tmpdir.join('mod%s.py' % i).write('def func%s(): pass\n' % (i % 2))
+    project = Project(tmpdir.strpath)
+    index = get_symbol_index(project._path, project._exclude_patterns)
+
+    # The first search doesn't parse the whole project and therefore only
+    # finds the names in the first few files.
+    assert 0 < len(list(project.search('func0'))) < 40
+    assert not index.is_built()
+
+    list(project.search('func0'))
+    assert index.is_built()
+    assert len(list(project.search('func0'))) == 40
+
+
+def test_removed_module_in_search(tmpdir, skip_pre_python36):
+    tmpdir.join('removed_module.py').write('')
+    project = Project(tmpdir.strpath)
+    assert [d.name for d in project.search('removed_module')] == ['removed_module']
+
+    # The index still knows about the file for a while.
+    os.remove(tmpdir.join('removed_module.py').strpath)
+    assert list(project.search('removed_module')) == []
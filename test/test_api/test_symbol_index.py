@@ -0,0 +1,115 @@
+import os
+
+import parso
+
+from jedi.api.symbol_index import SymbolIndex
+
+
+def _write(path, code):
+    with open(path, 'w') as f:
+        f.write(code)
+
+
+def _create_project(tmpdir):
+    os.mkdir(tmpdir.join('pkg').strpath)
+    _write(tmpdir.join('pkg', '__init__.py').strpath, '')
+    _write(tmpdir.join('pkg', 'models.py').strpath, (
+        '"""Models."""\n'
+        'import os\n'
+        'class Bar:\n'
+        '    """A bar.\n\n    More text."""\n'
+        '    def foobar(self, param):\n'
+        '        pass\n'
+        'bar_value = 3\n'
+    ))
+    _write(tmpdir.join('other.py').strpath, 'def bar(): pass\n')
+    return SymbolIndex(tmpdir.strpath)
+
+
+def test_outline(tmpdir):
+    index = _create_project(tmpdir)
+    index.update(parso.load_grammar(), force=True)
+
+    outline = index.get_outline(tmpdir.join('pkg', 'models.py').strpath)
+    assert [(s.full_name, s.type, s.line, s.column) for s in outline] == [
+        ('pkg.models', 'module', 1, 0),
+        ('pkg.models.os', 'import', 2, 7),
+        ('pkg.models.Bar', 'class', 3, 6),
+        ('pkg.models.Bar.foobar', 'function', 7, 8),
+        ('pkg.models.Bar.foobar.self', 'param', 7, 15),
+        ('pkg.models.Bar.foobar.param', 'param', 7, 21),
+        ('pkg.models.bar_value', 'statement', 9, 0),
+    ]
+    assert outline[0].docstring == 'Models.'
+    assert outline[2].docstring == 'A bar.'
+
+
+def _get_full_names(index, name, **kwargs):
+    return sorted(s.full_name for s in index.iter_symbols(name, **kwargs))
+
+
+def test_symbols(tmpdir):
+    index = _create_project(tmpdir)
+    index.update(parso.load_grammar(), force=True)
+
+    def search(string, **kwargs):
+        return _get_full_names(index, string, **kwargs)
+
+    assert search('bar') == ['other.bar', 'pkg.models.Bar']
+    assert search('foobar') == ['pkg.models.Bar.foobar']
+    assert search('foobar', all_scopes=False) == []
+    assert search('bar_', complete=True) == ['pkg.models.bar_value']
+    assert search('os') == ['pkg.models.os']
+
+    assert index.get_folder_paths('pkg') == [tmpdir.join('pkg').strpath]
+    assert index.get_file_paths('other.py') == [tmpdir.join('other.py').strpath]
+    assert index.get_defining_paths('os') == [tmpdir.join('pkg', 'models.py').strpath]
+
+
+def test_incremental_update(tmpdir):
+    grammar = parso.load_grammar()
+    index = _create_project(tmpdir)
+    assert len(index.update(grammar, force=True)) == 3
+    assert index.update(grammar, force=True) == []
+
+    other = tmpdir.join('other.py').strpath
+    _write(other, 'def baz(): pass\n')
+    os.utime(other, (1, 1))
+    os.remove(tmpdir.join('pkg', 'models.py').strpath)
+    assert sorted(index.update(grammar, force=True)) \
+        == [other, tmpdir.join('pkg', 'models.py').strpath]
+    assert _get_full_names(index, 'bar') == []
+    assert _get_full_names(index, 'baz') == ['other.baz']
+
+    # The index is persisted
+    loaded = SymbolIndex.load(tmpdir.strpath)
+    assert _get_full_names(loaded, 'baz') == ['other.baz']
+    assert loaded.update(grammar, force=True) == []
+
+
+def test_parse_limit(tmpdir):
+    grammar = parso.load_grammar()
+    index = _create_project(tmpdir)
+    assert len(index.update(grammar, parse_limit=2)) == 2
+    assert not index.is_built()
+    # The next update continues without waiting for the validity.
+    assert len(index.update(grammar, parse_limit=2)) == 1
+    assert index.is_built()
+    assert _get_full_names(index, 'bar') == ['other.bar', 'pkg.models.Bar']
+
+
+def test_call_sites(tmpdir):
+    grammar = parso.load_grammar()
+    index = _create_project(tmpdir)
+    other = tmpdir.join('other.py').strpath
+    _write(other, 'from pkg.models import Bar\nBar().foobar(1)\nBar.foobar\nBar()\n')
+    index.update(grammar, force=True)
+
+    assert index.get_call_sites('Bar') == {other: [(2, 0), (4, 0)]}
+    assert index.get_call_sites('foobar') == {other: [(2, 6)]}
+    assert index.get_call_sites('bar') == {}
+
+    _write(other, '')
+    os.utime(other, (1, 1))
+    index.update(grammar, force=True)
+    assert index.get_call_sites('Bar') == {}
@@ -0,0 +1,94 @@
+import threading
+from textwrap import dedent
+
+from parso import load_grammar
+
+from jedi import parser_utils
+
+
+def _run_in_threads(func, count=8):
+    errors = []
+
+    def run(i):
+        try:
+            func(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+
+
+def test_scripts_in_threads(Script, tmpdir):
+    path = tmpdir.join('threads.py').strpath
+    code = dedent('''\
+        class Foo(object):
+            def bar(self, x):
+                return [x]
+
+        def func(a):
+            return Foo().bar(a)
+        ''')
+
+    def run(i):
+        for j in range(5):
+            source = code + 'number%s = %s\nfunc(number%s)[0].' % (j, i, j)
+            script = Script(source, path=path)
+            completions = [c.name for c in script.complete()]
+            assert 'real' in completions
+            assert 'number%s' % j in [n.name for n in script.get_names()]
+
+    _run_in_threads(run)
+
+
+def test_parse_tree_owner(tmpdir):
+    grammar = load_grammar()
+    path = tmpdir.join('owner.py').strpath
+
+    module = parser_utils.parse(grammar, 'a = 1\nb = 2\n', path=path, cache=True, diff_cache=True)
+    updated = parser_utils.parse(grammar, 'a = 1\nb = 3\n', path=path, cache=True, diff_cache=True)
+    # The thread that created the tree may update it in place.
+    assert updated is module
+
+    results = []
+
+    def parse_in_thread(i):
+        results.append(parser_utils.parse(
+            grammar, 'a = 1\nb = 4\n', path=path, cache=True, diff_cache=True
+        ))
+
+    _run_in_threads(parse_in_thread, count=1)
+    new_module, = results
+    assert new_module is not module
+    assert module.get_code() == 'a = 1\nb = 3\n'
+    assert new_module.get_code() == 'a = 1\nb = 4\n'
+    lines = parser_utils.get_cached_code_lines(grammar, path, module)
+    assert lines == ['a = 1\n', 'b = 3\n', '']
+
+
+def test_parse_tree_owner_handover(tmpdir):
+    grammar = load_grammar()
+    path = tmpdir.join('handover.py').strpath
+
+    def parse(code):
+        # Like scripts, without a disk cache.
+        return parser_utils.parse(grammar, code, path=path, cache=False, diff_cache=True)
+
+    module = parse('a = 1\n')
+    results = []
+    _run_in_threads(lambda i: results.append(parse('a = 2\n')), count=1)
+    thread_module, = results
+    assert thread_module is not module
+    # The tree of the other thread replaced the cached one.
+    assert parser_utils.get_cached_code_lines(grammar, path) == ['a = 2\n', '']
+
+    # Therefore this thread parses again once, but may then use the diff
+    # parser again.
+    new_module = parse('a = 3\n')
+    assert new_module is not module and new_module is not thread_module
+    assert parse('a = 4\n') is new_module
+    assert thread_module.get_code() == 'a = 2\n'
@@ -1,3 +1,6 @@
+import os
+
+
 def test_import_references(Script):
     s = Script("from .. import foo", path="foo.py")
     assert [usage.line for usage in s.get_references(line=1, column=18)] == [1]
@@ -15,3 +18,69 @@ def test_exclude_builtin_modules(Script):
 
     places = get(include=False)
     assert places == [(1, 7), (2, 6)]
+
+
+def test_references_in_processes(Script, tmpdir, monkeypatch, skip_pre_python36):
+    from jedi import settings
+    from jedi.inference import references
+    from jedi.api.project import Project
+
+    def write(name, code):
+        with open(tmpdir.join(name).strpath, 'w') as f:
+            f.write(code)
+
+    write('defining.py', 'def some_function(): pass\n')
+    write('using.py', 'from defining import some_function\nsome_function()\n')
+    write('other.py', 'def some_function(): pass\nsome_function()\n')
+
+    def get_references():
+        script = Script(
+            path=tmpdir.join('defining.py').strpath,
+            project=Project(tmpdir.strpath),
+        )
+        refs = script.get_references(1, 5)
+        return [(os.path.basename(r.module_path), r.line, r.column) for r in refs]
+
+    expected = [
+        ('defining.py', 1, 4),
+        ('using.py', 1, 21),
+        ('using.py', 2, 0),
+    ]
+    assert get_references() == expected
+    monkeypatch.setattr(settings, 'reference_processes', 2)
+    assert get_references() == expected
+
+    # The pool is kept for later searches until it's closed at exit.
+    assert references._pool is not None
+    references._close_pool()
+    assert references._pool is None
+
+
+def test_references_in_processes_limits(Script, tmpdir, monkeypatch, skip_pre_python36):
+    from jedi import settings
+    from jedi.inference import references
+    from jedi.api.project import Project
+
+    tmpdir.join('defining.py').write('def some_function(): pass\n')
+    for i in range(70):
+        tmpdir.join('using%s.py' % i).write(
+            'from defining import some_function\nsome_function()\n'
+        )
+    project = Project(tmpdir.strpath)
+
+    def count_using_files():
+        script = Script(path=tmpdir.join('defining.py').strpath, project=project)
+        refs = script.get_references(1, 5)
+        return len(set(r.module_path for r in refs)) - 1
+
+    assert count_using_files() == references._PARSED_FILE_LIMIT
+    # Every process may parse as many files as the main process.
+    monkeypatch.setattr(settings, 'reference_processes', 2)
+    assert count_using_files() == 2 * references._PARSED_FILE_LIMIT
+    # The files that the symbol index knows are always searched. Every search
+    # parses a part of the project until the index is built.
+    list(project.search('some_function'))
+    assert count_using_files() < 70
+    list(project.search('some_function'))
+    assert count_using_files() == 70
+    references._close_pool()
@@ -1,6 +1,10 @@
 """
 Test all things related to the ``jedi.cache`` module.
 """
+import pytest
+from parso import load_grammar, ParserSyntaxError
+
+from jedi.parser_utils import parse_snippet, get_snippet_cache_info
 
 
 def test_cache_get_signatures(Script):
@@ -27,3 +31,41 @@ def test_cache_get_signatures(Script):
 def test_cache_line_split_issues(Script):
     """Should still work even if there's a newline."""
     assert Script('int(\n').get_signatures()[0].name == 'int'
+
+
+def test_parse_snippet():
+    grammar = load_grammar()
+    before = get_snippet_cache_info()
+    module = parse_snippet(grammar, 'snippet_for_test = 1\n')
+    assert parse_snippet(grammar, 'snippet_for_test = 1\n') is module
+    info = get_snippet_cache_info()
+    assert info['misses'] == before['misses'] + 1
+    assert info['hits'] == before['hits'] + 1
+
+    for _ in range(2):
+        with pytest.raises(ParserSyntaxError):
+            parse_snippet(grammar, 'snippet_for_test(', error_recovery=False)
+
+
+def test_namedtuple_class_is_cached(Script):
+    code = "import collections\nP = collections.namedtuple('P', 'x y')\nP(1, 2).x"
+    before = get_snippet_cache_info()
+    for _ in range(2):
+        assert [d.name for d in Script(code).infer()] == ['int']
+    info = get_snippet_cache_info()
+    assert info['hits'] > before['hits']
+
+
+def test_dynamic_array_mutations_after_reparse(Script):
+    def infer(code):
+        # The same path reuses the module of the diff parser.
+        return {d.name for d in Script(code + 'arr[0]', path='mutations.py').infer()}
+
+    code = 'arr = []\narr.append(1)\n'
+    assert infer(code) == {'int'}
+
+    # The collected mutations of the old module must not be used.
+    code = 'arr = []\narr.append("")\n'
+    assert infer(code) == {'str'}
+    code += 'arr.insert(0, 1.0)\n'
+    assert infer(code) == {'str', 'float'}
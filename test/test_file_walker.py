@@ -0,0 +1,115 @@
+import os
+
+import pytest
+
+from jedi.file_walker import walk_python_files, is_ignored, IgnoreRules
+
+
+def _create_files(root, paths):
+    for path in paths:
+        path = os.path.join(root, *path.split('/'))
+        if path.endswith(os.path.sep):
+            os.makedirs(path)
+            continue
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'w') as f:
+            f.write('')
+
+
+def _walk(root, **kwargs):
+    return sorted(
+        os.path.relpath(entry.path, root).replace(os.path.sep, '/')
+        + ('/' if entry.is_dir() else '')
+        for entry in walk_python_files(root, **kwargs)
+    )
+
+
+@pytest.mark.parametrize(
+    'pattern, path, is_directory, expected', [
+        ('foo', 'foo', False, True),
+        ('foo', 'a/b/foo', True, True),
+        ('foo', 'foobar', False, None),
+        ('foo/', 'foo', False, None),
+        ('foo/', 'a/foo', True, True),
+        ('/foo', 'foo', False, True),
+        ('/foo', 'a/foo', False, None),
+        ('a/foo', 'a/foo', False, True),
+        ('a/foo', 'b/a/foo', False, None),
+        ('*.py', 'a/b.py', False, True),
+        ('a/*.py', 'a/b/c.py', False, None),
+        ('a?.py', 'ab.py', False, True),
+        ('a?.py', 'a/.py', False, None),
+        ('[ab].py', 'b.py', False, True),
+        ('[!ab].py', 'b.py', False, None),
+        ('**/foo', 'a/b/foo', False, True),
+        ('a/**', 'a/b/c', False, True),
+        ('a/**', 'a', True, None),
+        ('a/**/b', 'a/b', True, True),
+        ('a/**/b', 'a/x/y/b', True, True),
+        (r'\#foo', '#foo', False, True),
+        ('#foo', '#foo', False, None),
+        ('foo\\ ', 'foo ', False, True),
+        ('foo  ', 'foo', False, True),
+    ]
+)
+def test_ignore_rules(pattern, path, is_directory, expected):
+    assert IgnoreRules([pattern]).match(path, is_directory) is expected
+
+
+def test_ignore_rules_negation():
+    rules = IgnoreRules(['*.py', '!keep.py', 'a/keep.py'])
+    assert rules.match('x.py', False) is True
+    assert rules.match('keep.py', False) is False
+    assert rules.match('a/keep.py', False) is True
+    assert rules.match('x.txt', False) is None
+
+
+def test_walk(tmpdir):
+    root = tmpdir.strpath
+    _create_files(root, [
+        'a.py', 'b.txt', 'c.pyi',
+        'pkg/__init__.py', 'pkg/generated.py',
+        'pkg/sub/mod.py', 'pkg/sub/.gitignore',
+        'build/lib.py', 'empty/',
+        'node_modules/x/setup.py', 'venv/lib/os.py', 'venv2/x.py',
+        '.gitignore',
+    ])
+    with open(os.path.join(root, '.gitignore'), 'w') as f:
+        f.write('# Comment\n/build/\ngenerated.py\n')
+    with open(os.path.join(root, 'pkg', 'sub', '.gitignore'), 'w') as f:
+        f.write('*.py\n')
+
+    assert _walk(root) == [
+        'a.py', 'c.pyi', 'empty/', 'pkg/', 'pkg/__init__.py', 'pkg/sub/', 'venv2/',
+        'venv2/x.py',
+    ]
+    assert _walk(root, exclude_patterns=['venv?/', '!venv/', '!build', '*.pyi']) == [
+        'a.py', 'build/', 'build/lib.py', 'empty/', 'pkg/', 'pkg/__init__.py',
+        'pkg/sub/', 'venv/', 'venv/lib/', 'venv/lib/os.py',
+    ]
+    assert _walk(root, except_paths=[os.path.join(root, 'pkg')]) == [
+        'a.py', 'c.pyi', 'empty/', 'venv2/', 'venv2/x.py',
+    ]
+
+    # is_ignored checks single paths the same way.
+    for exclude_patterns in [(), ('venv?/', '!venv/', '!build', '*.pyi')]:
+        walked = _walk(root, exclude_patterns=exclude_patterns)
+        for folder, folder_names, file_names in os.walk(root):
+            for name in folder_names + file_names:
+                path = os.path.relpath(os.path.join(folder, name), root)
+                is_directory = name in folder_names
+                if not is_directory and not name.endswith(('.py', '.pyi')):
+                    continue
+                expected = path.replace(os.path.sep, '/') + ('/' if is_directory else '')
+                assert is_ignored(root, path, is_directory, exclude_patterns) \
+                    == (expected not in walked)
+
+
+def test_walk_order(tmpdir):
+    root = tmpdir.strpath
+    _create_files(root, ['x/y/z.py', 'x/a.py', 'b.py'])
+    paths = [os.path.relpath(e.path, root) for e in walk_python_files(root)]
+    # Files and folders are yielded before the content of the folders.
+    assert paths.index('b.py') < paths.index('x') < paths.index(os.path.join('x', 'a.py')) \
+        < paths.index(os.path.join('x', 'y')) < paths.index(os.path.join('x', 'y', 'z.py'))
@@ -0,0 +1,170 @@
+import os
+
+import pytest
+
+from jedi import file_watcher
+from jedi import parser_utils
+from jedi.file_watcher import PollingWatcher, InotifyWatcher, ChangeEvent
+from parso import load_grammar
+
+
+def _create_polling_watcher():
+    return PollingWatcher()
+
+
+def _create_inotify_watcher():
+    libc = file_watcher._load_libc()
+    if libc is None:
+        pytest.skip('inotify is not available')
+    return InotifyWatcher(libc)
+
+
+def _get_changes(watcher):
+    if isinstance(watcher, PollingWatcher):
+        return watcher.get_changes(force=True)
+    return watcher.get_changes()
+
+
+def _write(path, code=''):
+    with open(path, 'w') as f:
+        f.write(code)
+
+
+@pytest.fixture(params=[_create_polling_watcher, _create_inotify_watcher])
+def watcher(request):
+    return request.param()
+
+
+def test_changes(tmpdir):
+    watcher = _create_inotify_watcher()
+    root = tmpdir.strpath
+    foo = os.path.join(root, 'foo.py')
+    folder = os.path.join(root, 'folder')
+    _write(foo)
+    os.mkdir(folder)
+    assert watcher.watch(root) is True
+    assert _get_changes(watcher) == []
+
+    _write(os.path.join(root, 'ignored.txt'))
+    bar = os.path.join(folder, 'bar.py')
+    _write(bar)
+    os.utime(foo, (1, 1))
+    changes = set(_get_changes(watcher))
+    assert ChangeEvent('created', bar, False) in changes
+    assert ChangeEvent('modified', foo, False) in changes
+    assert not [c for c in changes if c.path.endswith('.txt')]
+
+    os.remove(bar)
+    assert ChangeEvent('deleted', bar, False) in _get_changes(watcher)
+    os.rmdir(folder)
+    assert ChangeEvent('deleted', folder, True) in _get_changes(watcher)
+
+
+def test_not_recursive(watcher, tmpdir):
+    root = tmpdir.strpath
+    os.mkdir(os.path.join(root, 'folder'))
+    assert watcher.watch(root, recursive=False) is True
+    _write(os.path.join(root, 'folder', 'bar.py'))
+    _write(os.path.join(root, 'foo.pth'))
+    changes = _get_changes(watcher)
+    assert set(c.path for c in changes) == {os.path.join(root, 'foo.pth')}
+    assert ChangeEvent('created', os.path.join(root, 'foo.pth'), False) in changes
+
+
+def test_subscribe(tmpdir):
+    watcher = PollingWatcher()
+    root = tmpdir.strpath
+    os.mkdir(os.path.join(root, 'a'))
+    os.mkdir(os.path.join(root, 'b'))
+    watcher.watch(os.path.join(root, 'a'), recursive=False)
+    watcher.watch(os.path.join(root, 'b'), recursive=False)
+
+    published = []
+    watcher.subscribe(published.append, os.path.join(root, 'a'))
+    _write(os.path.join(root, 'a', 'x.py'))
+    _write(os.path.join(root, 'b', 'x.py'))
+    watcher._last_poll = 0
+    assert len(watcher.publish_changes()) == 2
+    assert published == [[ChangeEvent('created', os.path.join(root, 'a', 'x.py'), False)]]
+
+
+def test_polling_only_loaded_files(tmpdir):
+    watcher = PollingWatcher()
+    root = tmpdir.strpath
+    loaded = os.path.join(root, 'loaded.py')
+    other = os.path.join(root, 'other.py')
+    _write(loaded)
+    _write(other)
+    # Not all the changes are found, because the tree is not scanned.
+    assert watcher.watch(root) is False
+    parser_utils.parse(load_grammar(), '', path=loaded, cache=False, diff_cache=True)
+    assert watcher.get_changes(force=True) == []
+
+    os.utime(loaded, (1, 1))
+    os.utime(other, (1, 1))
+    _write(os.path.join(root, 'new.py'))
+    assert watcher.get_changes(force=True) == [ChangeEvent('modified', loaded, False)]
+    os.remove(loaded)
+    assert watcher.get_changes(force=True) == [ChangeEvent('deleted', loaded, False)]
+
+
+def test_reset_after_fork_on_first_use(tmpdir):
+    watcher = _create_inotify_watcher()
+    root = tmpdir.strpath
+    watcher.watch(root)
+    fd = watcher._fd
+
+    # The fork hook itself doesn't touch inotify.
+    watcher._mark_forked()
+    assert watcher._fd == fd
+
+    foo = os.path.join(root, 'foo.py')
+    _write(foo)
+    watcher.publish_changes()
+    assert watcher._fd is not None and watcher._watch_descriptors
+    os.utime(foo, (1, 1))
+    assert _get_changes(watcher) == [ChangeEvent('modified', foo, False)]
+
+
+def test_exclude_patterns(tmpdir):
+    watcher = _create_inotify_watcher()
+    root = tmpdir.strpath
+    for folder in ['build', 'node_modules', 'src', os.path.join('src', 'generated')]:
+        os.mkdir(os.path.join(root, folder))
+    _write(os.path.join(root, 'src', '.gitignore'), 'generated/\n*_pb2.py\n')
+    # The same folders are ignored as by the symbol index.
+    assert watcher.watch(root, exclude_patterns=['/build/']) is True
+
+    for path in ['build/x.py', 'node_modules/x.py', 'src/generated/x.py',
+                 'src/x_pb2.py', 'src/x.py']:
+        _write(os.path.join(root, *path.split('/')))
+    os.makedirs(os.path.join(root, 'venv', 'lib'))
+    os.makedirs(os.path.join(root, 'src', 'new', 'generated'))
+    os.makedirs(os.path.join(root, 'src', 'new', 'sub'))
+    changes = _get_changes(watcher)
+    assert set(c.path for c in changes) == {
+        os.path.join(root, 'src', 'x.py'),
+        os.path.join(root, 'src', 'new'),
+    }
+
+    # Watches are only added for new folders that are not ignored.
+    _write(os.path.join(root, 'src', 'new', 'generated', 'y.py'))
+    _write(os.path.join(root, 'src', 'new', 'sub', 'y.py'))
+    changes = _get_changes(watcher)
+    assert set(c.path for c in changes) == {os.path.join(root, 'src', 'new', 'sub', 'y.py')}
+
+
+def test_polling_exclude_patterns(tmpdir):
+    watcher = PollingWatcher()
+    root = tmpdir.strpath
+    os.mkdir(os.path.join(root, 'build'))
+    paths = [os.path.join(root, 'build', 'x.py'), os.path.join(root, 'x.py')]
+    watcher.watch(root, exclude_patterns=['build/'])
+    for path in paths:
+        _write(path)
+        parser_utils.parse(load_grammar(), '', path=path, cache=False, diff_cache=True)
+    assert watcher.get_changes(force=True) == []
+
+    for path in paths:
+        os.utime(path, (1, 1))
+    assert watcher.get_changes(force=True) == [ChangeEvent('modified', paths[1], False)]
@@ -62,3 +62,35 @@ def test_lambda_forward_references(Script, environment):
     # For now just receiving the 3 is ok. I'm doubting that this is what we
     # want. We also execute functions. Should we only execute classes?
     assert Script(source).infer()
+
+
+def test_generic_classes_are_interned(Script, environment):
+    if environment.version_info.major == 2:
+        pytest.skip()
+
+    code = dedent("""\
+    from typing import List
+    def f(a: List[int], b: List[int], c: List[str]):
+        a; b; c
+    """)
+    script = Script(code)
+    (a,), (b,), (c,) = [
+        script.infer(3, column)[0]._name.infer()
+        for column in (4, 7, 10)
+    ]
+    assert a.class_value.name.string_name == 'list'
+    assert a.class_value is b.class_value
+    assert a.class_value is not c.class_value
+
+
+def test_forward_references_after_reparse(Script, environment, tmpdir):
+    if environment.version_info.major == 2:
+        pytest.skip()
+
+    path = tmpdir.join('forward.py').strpath
+    code = 'def f(x: "Foo"): x\n%sclass Foo: pass\n'
+    assert [d.name for d in Script(code % '', path=path).infer(1, 17)] == ['Foo']
+    # The module is reused by the diff parser, the forward reference must
+    # still see the definitions that moved further down.
+    code = code % ('\n' * 20)
+    assert [d.name for d in Script(code, path=path).infer(1, 17)] == ['Foo']
@@ -1,4 +1,7 @@
+from textwrap import dedent
+
 from jedi._compatibility import force_unicode
+from jedi.inference.filters import ParserTreeFilter
 
 
 def test_module_attributes(Script):
@@ -19,3 +22,26 @@ def test_module__file__(Script, environment):
     def_, = Script('import antigravity; antigravity.__file__').infer()
     value = force_unicode(def_._name._value.get_safe_value())
     assert value.endswith('.py')
+
+
+def test_parser_tree_filter_positions(Script):
+    code = dedent('''\
+        x = 1
+        def f():
+            x = 2
+            x = 3
+        if foo:
+            x = 4
+        x
+        ''')
+    module_context = Script(code)._get_module_context()
+
+    def positions(until_position=None):
+        filter = ParserTreeFilter(module_context, until_position=until_position)
+        return [n.start_pos for n in filter.get('x')]
+
+    # The definitions in the function are in another scope.
+    assert positions() == [(6, 4), (1, 0)]
+    assert positions((6, 4)) == [(1, 0)]
+    assert positions((1, 0)) == []
+    assert 'x' in [n.string_name for n in ParserTreeFilter(module_context).values()]
@@ -120,6 +120,35 @@ def test_docstrings_type_str(Script):
     assert 'join' in names
 
 
+def test_docstring_types_on_disk(Script, monkeypatch):
+    from jedi.inference import docstrings
+    from jedi.parser_utils import clear_snippet_cache
+
+    monkeypatch.setattr(jedi.settings, 'cache_docstring_types', True)
+    s = dedent("""
+        def func(arg):
+            '''
+            :type arg: str
+            :rtype: int
+            '''
+            arg.""")
+    call = s + "\nfunc('')."
+    assert 'join' in [c.name for c in Script(s).complete()]
+    assert 'real' in [c.name for c in Script(call).complete()]
+
+    parsed = []
+    parse = docstrings._parse_docstring_types
+    monkeypatch.setattr(
+        docstrings, '_parse_docstring_types',
+        lambda docstr: parsed.append(docstr) or parse(docstr)
+    )
+    clear_snippet_cache()
+    # The types are loaded from the cache directory now.
+    assert 'join' in [c.name for c in Script(s).complete()]
+    assert 'real' in [c.name for c in Script(call).complete()]
+    assert not [d for d in parsed if ':type arg: str' in d]
+
+
 def test_docstring_instance(Script):
     # The types hint that it's a certain kind
     s = dedent("""
@@ -0,0 +1,28 @@
+from textwrap import dedent
+
+from jedi.inference import flow_analysis
+from jedi.inference.recursion import execution_allowed
+
+
+def test_cached_reachability_after_recursion(Script):
+    code = dedent('''\
+        if 1:
+            x = 3
+        else:
+            x = ''
+        ''')
+    script = Script(code)
+    inference_state = script._inference_state
+    module_context = script._get_module_context()
+    if_stmt = script._module_node.children[0]
+    name = script._module_node.get_used_names()['x'][0]
+
+    def check():
+        return flow_analysis.reachability_check(module_context, module_context.tree_node, name)
+
+    # While the condition is being inferred further up the stack, the check is
+    # refused and unsure.
+    with execution_allowed(inference_state, if_stmt.children[1]):
+        assert check() is flow_analysis.UNSURE
+    # That result must not be reused afterwards.
+    assert check() is flow_analysis.REACHABLE
@@ -2,7 +2,7 @@ import os
 
 from test.helpers import root_dir
 from jedi.api.project import Project
-from jedi.inference.gradual.conversion import convert_names
+from jedi.inference.gradual.conversion import convert_names, convert_values
 
 
 def test_sqlite3_conversion(Script):
@@ -25,6 +25,17 @@ def test_sqlite3_conversion(Script):
     assert v.is_compiled()
 
 
+def test_conversion_round_trip(Script):
+    d, = Script('import json; json.JSONDecoder').infer()
+    python_values = d._name.infer()
+    assert [v.is_stub() for v in python_values] == [False]
+
+    stub_values = convert_values(python_values, only_stubs=True)
+    assert [v.is_stub() for v in stub_values] == [True]
+    assert convert_values(python_values, only_stubs=True) == stub_values
+    assert convert_values(stub_values) == python_values
+
+
 def test_conversion_of_stub_only(Script):
     project = Project(os.path.join(root_dir, 'test', 'completion', 'stub_folder'))
     code = 'import stub_only; stub_only.in_stub_only'
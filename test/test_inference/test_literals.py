@@ -40,3 +40,33 @@ def test_thousand_separators(Script, environment):
     assert _infer_literal(Script, '0x3_4') == 52
     assert _infer_literal(Script, '0b1_0') == 2
     assert _infer_literal(Script, '0o1_0') == 8
+
+
+def test_big_literals(Script):
+    entries = ', '.join(str(i) for i in range(1000))
+    code = 'x = [%s, 1.0, "", True]\n' % entries
+    assert {d.name for d in Script(code + 'x[-1000]').infer()} == {'int'}
+    assert {d.name for d in Script(code + 'for y in x: y').infer()} \
+        == {'int', 'float', 'str', 'bool'}
+
+    code = 'x = {%s, "last": 1.0}\n' % ', '.join('"k%s": %s' % (i, i) for i in range(1000))
+    assert {d.name for d in Script(code + 'x["k999"]').infer()} == {'int'}
+    assert {d.name for d in Script(code + 'x["last"]').infer()} == {'float'}
+    assert {d.name for d in Script(code + 'x.values()[0]').infer()} == {'int', 'float'}
+    assert {d.name for d in Script(code + 'for y in x: y').infer()} == {'str'}
+
+
+def test_big_dict_key_precedence(Script):
+    entries = ', '.join('"k%s": %s' % (i, i) for i in range(200))
+    # Big dicts look up keys in the same order as small ones.
+    for code in ['d = {"a": 1, "a": "s", %s}\nd["a"]',
+                 'K = "a"\nd = {K: 1, "a": "s", %s}\nd["a"]']:
+        small = code % '"b": 1.0'
+        big = code % entries
+        assert [d.name for d in Script(small).infer()] == ['int']
+        assert [d.name for d in Script(big).infer()] == ['int']
+
+    # Keyword arguments of non-literal keys are not lost.
+    code = 'def f(a, **kwargs): return a\nK = "a"\nf(**{K: 1, %s})'
+    assert [d.name for d in Script(code % '"b": 1.0').infer()] == ['int']
+    assert [d.name for d in Script(code % entries).infer()] == ['int']
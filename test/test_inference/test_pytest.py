@@ -0,0 +1,39 @@
+import os
+
+from jedi import Project
+from jedi.plugins import pytest as pytest_plugin
+
+
+def test_conftest_fixtures(Script, tmpdir):
+    sub = tmpdir.join('sub')
+    os.mkdir(sub.strpath)
+    tmpdir.join('conftest.py').write(
+        'import pytest\n'
+        '@pytest.fixture\ndef outer(): pass\n'
+        '@pytest.fixture\ndef shared(): pass\n'
+        'def not_a_fixture(): pass\n'
+    )
+    sub.join('conftest.py').write('from pytest import fixture\n@fixture\ndef shared(): pass\n')
+
+    inference_state = Script('', project=Project(tmpdir.strpath))._inference_state
+    fixtures = pytest_plugin._get_conftest_fixtures(inference_state, sub.strpath)
+    assert fixtures == {
+        'outer': [tmpdir.join('conftest.py').strpath],
+        'shared': [sub.join('conftest.py').strpath, tmpdir.join('conftest.py').strpath],
+    }
+    assert pytest_plugin._get_conftest_fixtures(inference_state, sub.strpath) is fixtures
+
+    os.remove(sub.join('conftest.py').strpath)
+    fixtures = pytest_plugin._get_conftest_fixtures(inference_state, sub.strpath)
+    assert fixtures['shared'] == [tmpdir.join('conftest.py').strpath]
+
+
+def test_entry_point_plugins(tmpdir):
+    dist_info = tmpdir.join('pytest_foo-1.0.dist-info')
+    os.mkdir(dist_info.strpath)
+    dist_info.join('entry_points.txt').write(
+        '[console_scripts]\nfoo = foo.cli:main\n\n'
+        '[pytest11]\nfoo = pytest_foo.plugin\nbar = pytest_foo.bar:Plugin\n'
+    )
+    assert pytest_plugin._get_entry_point_plugins(tmpdir.strpath) \
+        == ['pytest_foo.plugin', 'pytest_foo.bar']
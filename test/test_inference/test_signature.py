@@ -329,6 +329,38 @@ def test_param_resolving_to_static(Script, stmt, expected, skip_pre_python35):
     assert sig.to_string() == expected
 
 
+def test_forwarded_signature_cache(Script, monkeypatch, skip_pre_python35):
+    from jedi.inference import star_args
+
+    calls = []
+
+    def process_params(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    original = star_args.process_params
+    monkeypatch.setattr(star_args, 'process_params', process_params)
+
+    code = dedent('''\
+        def simple(a, b, *, c): ...
+        def redirect(func):
+            return lambda *args, **kwargs: func(1, *args, **kwargs)
+        z = redirect(redirect(simple))
+        z(''')
+    script = Script(code)
+    for _ in range(2):
+        del calls[:]
+        sig, = script.get_signatures()
+        assert sig.to_string() == '<lambda>(*, b, c)'
+    # The forwarded signatures are not processed again, only the parameters
+    # of the lambda itself.
+    assert len(calls) == 1
+
+    # Changes in the module are not hidden by the cache.
+    sig, = Script(code.replace('func(1, ', 'func(')).get_signatures()
+    assert sig.to_string() == '<lambda>(a, b, *, c)'
+
+
 @pytest.mark.parametrize(
     'code', [
         'from file import with_overload; with_overload(',
@@ -0,0 +1,42 @@
+from jedi.inference.base_value import ValueSet, NO_VALUES
+
+
+class _Value(object):
+    def __init__(self, name):
+        self.name = name
+
+    def infer(self):
+        return ValueSet([self])
+
+
+def test_empty_sets_are_shared():
+    empty = ValueSet.from_sets([])
+    assert empty == NO_VALUES
+    assert ValueSet.from_sets([NO_VALUES, []]) is empty
+    assert NO_VALUES & ValueSet([_Value('a')]) is empty
+
+
+def test_union_fast_paths():
+    a = ValueSet([_Value('a')])
+    b = ValueSet([_Value('b')])
+    assert a | NO_VALUES is a
+    assert NO_VALUES | a is a
+    assert a | a is a
+    assert ValueSet.from_sets([NO_VALUES, a, NO_VALUES]) is a
+    assert set(a | b) == set(a) | set(b)
+    assert set(ValueSet.from_sets([a, [], b, a])) == set(a) | set(b)
+
+
+def test_from_sets_with_iterables():
+    a, b = _Value('a'), _Value('b')
+    result = ValueSet.from_sets(iter([x]) for x in [a, b, a])
+    assert set(result) == {a, b}
+    result = ValueSet.from_sets([iter([a])])
+    assert isinstance(result, ValueSet) and list(result) == [a]
+
+
+def test_mapping():
+    a, b = _Value('a'), _Value('b')
+    assert set(ValueSet([a, b]).infer()) == {a, b}
+    value_set = ValueSet([a])
+    assert value_set.infer() == value_set